@@ -0,0 +1,104 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from dbRecordHandler.connectionManager import ConnectionManager
+
+@contextmanager
+def temporaryWorkingDir():
+    """
+    Context manager that runs its block in a temporary folder, which has the src/sensitive folder that ConnectionManager opens the webscraper.db in
+
+    The current thread's connection to the db is closed, and the original working directory restored, when the block ends, even if it raises.
+
+    Parameters
+    ----------
+    none
+
+    Returns
+    ----------
+    String
+        The path to the temporary folder
+    """
+
+    originalDir = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as benchmarkDir:
+        os.chdir(benchmarkDir)
+
+        try:
+            os.makedirs("src/sensitive")
+
+            yield benchmarkDir
+        finally:
+            ConnectionManager().closeConnection()
+            os.chdir(originalDir)
+
+@contextmanager
+def fakeACLIOnPath(acliScript):
+    """
+    Context manager that puts a stand-in "acli" executable at the front of PATH, so that ACLIController runs it instead of ACLI
+
+    The stand-in is a Python file with a shebang line, so it only runs on Linux and macOS.
+
+    Parameters
+    ----------
+    acliScript : String
+        The Python source of the stand-in.  It gets ACLI's command-line arguments in sys.argv.
+
+    Returns
+    ----------
+    none
+    """
+
+    if os.name == "nt":
+        raise RuntimeError("The stand-in acli is an executable script, which Windows can't run without an extension")
+
+    originalPath = os.environ.get("PATH", "")
+
+    with tempfile.TemporaryDirectory() as acliDir:
+        acliPath = Path(acliDir) / "acli"
+        acliPath.write_text(f"#!{sys.executable}\n{acliScript}", encoding="utf-8")
+        acliPath.chmod(0o755)
+
+        os.environ["PATH"] = acliDir + os.pathsep + originalPath
+
+        try:
+            yield
+        finally:
+            os.environ["PATH"] = originalPath
+
+def measure(function, *args, **kwargs):
+    """
+    Calls a function, and returns its result, how long it took, and the peak memory it took
+
+    The peak memory is that of the Python heap, as tracemalloc measures it, so it leaves out SQLite's own page cache and the memory of any subprocess.
+
+    Parameters
+    ----------
+    function : Callable
+        The function to call
+
+    *args, **kwargs
+        The arguments to call the function with
+
+    Returns
+    ----------
+    Tuple
+        A three item tuple of the function's result, the seconds it took, and its peak memory in bytes
+    """
+
+    tracemalloc.start()
+
+    try:
+        startTime = time.perf_counter()
+        result = function(*args, **kwargs)
+        seconds = time.perf_counter() - startTime
+        _, peakMemory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (result, seconds, peakMemory)
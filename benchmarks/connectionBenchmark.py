@@ -0,0 +1,86 @@
+import sqlite3
+import time
+from benchmarks.benchmarkHelper import temporaryWorkingDir
+from dbRecordHandler.connectionManager import ConnectionManager
+from dbRecordHandler.sqlHelper import SQLHelper
+
+# The statements that Creator.addNewConfluencePageToDB, Retriever.isPageIDInDB, and Updater.updateWasPageCheckedThisRun run, and the parameters for a pageID
+ALL_STATEMENTS = {
+    "addNewConfluencePageToDB": ("""
+        INSERT INTO ALL_CONFLUENCE_PAGES (pageID, oldPageVersion)
+        VALUES (?, ?)
+        """,
+        lambda pageID: (pageID, "1")
+    ),
+    "isPageIDInDB": ("""
+        SELECT pageID FROM ALL_CONFLUENCE_PAGES
+        WHERE pageID = (?)
+        """,
+        lambda pageID: (pageID,)
+    ),
+    "updateWasPageCheckedThisRun": ("""
+        UPDATE ALL_CONFLUENCE_PAGES
+        SET wasPageCheckedThisRun = (?)
+        WHERE pageID = (?)
+        """,
+        lambda pageID: ("TRUE", pageID)
+    ),
+}
+
+def runBenchmark(numCalls=2000):
+    """
+    Times calls to the db through ConnectionManager's shared connection against calls that each open their own connection, and prints the per-call overhead of each
+
+    A call that opens its own connection does what every record handler method did before ConnectionManager: it connects, runs the SQLHelper PRAGMAs and a truncating checkpoint, runs its statement, commits, and closes the connection.  The benchmark runs against a fresh db in a temporary folder.
+
+    Run with `python -m benchmarks.connectionBenchmark` from the repo's root folder.
+
+    Parameters
+    ----------
+    numCalls (optional) : Integer
+        The number of calls to time for each statement
+
+    Returns
+    ----------
+    none
+    """
+
+    allTimings = {}
+
+    with temporaryWorkingDir():
+        connectionManager = ConnectionManager()
+
+        for pattern in ("per-call connection", "shared connection"):
+            dbConnector = connectionManager.getConnection()
+            dbConnector.execute("""DROP TABLE IF EXISTS ALL_CONFLUENCE_PAGES""")
+            dbConnector.execute("""CREATE TABLE ALL_CONFLUENCE_PAGES (
+                pageID TEXT NOT NULL PRIMARY KEY,
+                oldPageVersion TEXT NOT NULL,
+                wasPageRecentlyUpdated TEXT NOT NULL DEFAULT "FALSE",
+                wasPageCheckedThisRun TEXT NOT NULL DEFAULT "FALSE"
+            )""")
+            connectionManager.closeConnection()
+
+            for methodName, (statement, getParameters) in ALL_STATEMENTS.items():
+                startTime = time.perf_counter()
+
+                for pageID in range(numCalls):
+                    if pattern == "per-call connection":
+                        dbConnector = sqlite3.connect(connectionManager.getDBPath())
+                        dbConnector.executescript(SQLHelper().SQL_QUERIES + SQLHelper().SQL_TRUNCATE_CHECKPOINT)
+                        dbConnector.execute(statement, getParameters(str(pageID))).fetchall()
+                        dbConnector.commit()
+                        dbConnector.close()
+                    else:
+                        connectionManager.getConnection().execute(statement, getParameters(str(pageID))).fetchall()
+                        connectionManager.commit()
+
+                allTimings[(pattern, methodName)] = (time.perf_counter() - startTime) / numCalls
+
+            connectionManager.closeConnection()
+
+    for methodName in ALL_STATEMENTS:
+        print(f"{methodName}: {allTimings[('per-call connection', methodName)] * 1e6:.0f} us per call with a per-call connection, {allTimings[('shared connection', methodName)] * 1e6:.0f} us per call with the shared connection")
+
+if __name__ == "__main__":
+    runBenchmark()
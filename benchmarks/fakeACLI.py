@@ -0,0 +1,40 @@
+# The Python source of a stand-in for ACLI, for benchmarkHelper.fakeACLIOnPath.  It answers from memory, without a server, and starts a Python interpreter instead of a JVM.
+#
+# - getPageList lists FAKE_ACLI_NUM_PAGES synthetic pages, in ACLI's CSV output format
+# - run runs the getContentHistoryList actions of a run script, and writes each page's FAKE_ACLI_NUM_VERSIONS versions to the action's --file, the way ConfluenceRestStub.getVersions lists them
+FAKE_ACLI_SCRIPT = """
+import os
+import shlex
+import sys
+from datetime import datetime, timedelta
+
+acliAction = sys.argv[sys.argv.index("--action") + 1]
+numPages = int(os.environ.get("FAKE_ACLI_NUM_PAGES", "1000"))
+numVersions = int(os.environ.get("FAKE_ACLI_NUM_VERSIONS", "5"))
+
+if acliAction == "getPageList":
+    print(f"{numPages} pages in list")
+    print('"Space","Id","Title","Parent","Creator","Created","Modifier","Version","Modified"')
+
+    for pageID in range(1, numPages + 1):
+        sys.stdout.write(f'"public","{pageID}","Page {pageID}, a synthetic page","1","author","2022-01-01 09:00:00","author","{pageID % 50 + 1}","2022-06-01 09:00:00"\\n')
+elif acliAction == "run":
+    today = datetime.now()
+
+    with open(sys.argv[sys.argv.index("--file") + 1], encoding="utf-8") as scriptFile:
+        for line in scriptFile:
+            args = shlex.split(line)
+            pageID = int(args[args.index("--id") + 1])
+
+            with open(args[args.index("--file") + 1], "w", encoding="utf-8") as historyFile:
+                historyFile.write('"Id","Title","Space","Version","Creator","Date","Username","Comment","Name"\\n')
+
+                for versionNum in range(numVersions, 0, -1):
+                    authorNum = (pageID + versionNum) % 50
+                    versionDate = (today - timedelta(days=30 * (numVersions - versionNum))).strftime("%Y-%m-%d")
+
+                    historyFile.write(f'"{pageID}","Page {pageID}","public","{versionNum}","author","{versionDate}","author{authorNum}","","Author {authorNum}"\\n')
+else:
+    sys.stderr.write(f"The stand-in acli doesn't know the {acliAction} action\\n")
+    sys.exit(1)
+"""
@@ -0,0 +1,94 @@
+import time
+from datetime import date, datetime, timedelta
+from historyAnalyzer import HistoryAnalyzer
+
+def getRecentAuthorsByDateArithmetic(allRevisions):
+    """
+    Receives a page's revisions, and returns a list of the authors who've recently updated the page, the way ACLIController.getRecentAuthors did before HistoryAnalyzer
+
+    Builds a date object for every revision, and walks the revisions three times.
+
+    Parameters
+    ----------
+    allRevisions : List
+        Three-item tuples of the date of the revision (yyyy-mm-dd), and the username and full name of the author who published it, newest first
+
+    Returns
+    ----------
+    List
+        A list of tuples.  Each tuple will contain the authors username and full name.  This list will contain no duplicates.
+    """
+
+    todaysDate = datetime.today().strftime('%Y-%m-%d')
+    todaysDate_obj = date(int(todaysDate[0:4]), int(todaysDate[5:7]), int(todaysDate[8:10]))
+
+    allRevisions_daysSinceLastEdit = []
+
+    for revisionDate, username, fullname in allRevisions:
+        revisionDate_obj = date(int(revisionDate[0:4]), int(revisionDate[5:7]), int(revisionDate[8:10]))
+        allRevisions_daysSinceLastEdit.append(((todaysDate_obj - revisionDate_obj).days, username, fullname))
+
+    if allRevisions_daysSinceLastEdit[0][0] > HistoryAnalyzer.RECENT_DAYS:
+        recentRevisions_daysSinceLastEdit = allRevisions_daysSinceLastEdit[:HistoryAnalyzer.NUM_FALLBACK_REVISIONS]
+    else:
+        recentRevisions_daysSinceLastEdit = [revision for revision in allRevisions_daysSinceLastEdit if revision[0] <= HistoryAnalyzer.RECENT_DAYS]
+
+    recentAuthors_dict = {}
+
+    for _, username, fullname in recentRevisions_daysSinceLastEdit:
+        recentAuthors_dict[username] = fullname
+
+    return list(recentAuthors_dict.items())
+
+def runBenchmark(numPages=20, numRevisionsPerPage=10000):
+    """
+    Times HistoryAnalyzer.getRecentAuthors against the per-revision date arithmetic it replaced, and prints the milliseconds per page of each
+
+    Two sets of synthetic pages are timed: pages whose revisions all fall in the last RECENT_DAYS days, and stale pages that haven't been updated in longer than that.  A RuntimeError is raised if the two find different recent authors.
+
+    Run with `python -m benchmarks.historyAnalyzerBenchmark` from the repo's root folder.
+
+    Parameters
+    ----------
+    numPages (optional) : Integer
+        The number of pages in each set
+
+    numRevisionsPerPage (optional) : Integer
+        The number of revisions of each page
+
+    Returns
+    ----------
+    none
+    """
+
+    today = date.today()
+    allPageSets = {
+        "all revisions in the window": [
+            [((today - timedelta(days=revisionNum * HistoryAnalyzer.RECENT_DAYS // numRevisionsPerPage)).isoformat(), f"author{(pageNum + revisionNum) % 50}", f"Author {(pageNum + revisionNum) % 50}") for revisionNum in range(numRevisionsPerPage)]
+            for pageNum in range(numPages)
+        ],
+        "stale pages": [
+            [((today - timedelta(days=HistoryAnalyzer.RECENT_DAYS + 1 + revisionNum // 10)).isoformat(), f"author{(pageNum + revisionNum) % 50}", f"Author {(pageNum + revisionNum) % 50}") for revisionNum in range(numRevisionsPerPage)]
+            for pageNum in range(numPages)
+        ],
+    }
+
+    historyAnalyzer = HistoryAnalyzer()
+
+    for pageSetName, allPages in allPageSets.items():
+        startTime = time.perf_counter()
+        allOldRecentAuthors = [getRecentAuthorsByDateArithmetic(allRevisions) for allRevisions in allPages]
+        oldSeconds = time.perf_counter() - startTime
+
+        startTime = time.perf_counter()
+        cutoffDate = historyAnalyzer.getCutoffDate()
+        allNewRecentAuthors = [historyAnalyzer.getRecentAuthors(allRevisions, cutoffDate) for allRevisions in allPages]
+        newSeconds = time.perf_counter() - startTime
+
+        if allNewRecentAuthors != allOldRecentAuthors:
+            raise RuntimeError(f"getRecentAuthors and the replaced code found different recent authors for the {pageSetName}")
+
+        print(f"{pageSetName.capitalize()}, {numPages} pages with {numRevisionsPerPage} revisions each: {oldSeconds / numPages * 1000:.2f} ms/page with date arithmetic, {newSeconds / numPages * 1000:.2f} ms/page with getRecentAuthors")
+
+if __name__ == "__main__":
+    runBenchmark()
@@ -0,0 +1,99 @@
+from benchmarks.benchmarkHelper import measure, temporaryWorkingDir
+from DBCreator import DBCreator
+from DBMigrator import DBMigrator
+from dbRecordHandler.connectionManager import ConnectionManager
+
+def fillLegacyDB(numPages, numPagesMissingAltText, numImagesPerPage):
+    """
+    Fills a db at the base schema (version 0) the way older versions of this script filled it
+
+    pageIDs, versions, and flags are stored as text, and each page's images missing alternate text as a string representation of a dict in imageNamesLinks.
+
+    Parameters
+    ----------
+    numPages : Integer
+        The number of pages in ALL_CONFLUENCE_PAGES
+
+    numPagesMissingAltText : Integer
+        The number of those pages that are missing alternate text, each with a recent author and a LOG_CONFLUENCE_PAGES_TO_FIX record
+
+    numImagesPerPage : Integer
+        The number of images missing alternate text on each of those pages
+
+    Returns
+    ----------
+    none
+    """
+
+    numAuthors = max(1, numPagesMissingAltText // 10)
+
+    with ConnectionManager().unitOfWork() as dbConnector:
+        dbConnector.executemany(
+            """INSERT INTO ALL_CONFLUENCE_PAGES (pageID, oldPageVersion, wasPageRecentlyUpdated, wasPageCheckedThisRun) VALUES (?, ?, ?, ?)""",
+            ((str(pageID), str(pageID % 50 + 1), "FALSE", "TRUE") for pageID in range(1, numPages + 1))
+        )
+
+        dbConnector.executemany(
+            """INSERT INTO ALL_CONFLUENCE_AUTHORS (username, email, fullname) VALUES (?, ?, ?)""",
+            ((f"author{authorNum}", f"author{authorNum}@example.com", f"Author {authorNum}") for authorNum in range(numAuthors))
+        )
+
+        dbConnector.executemany(
+            """INSERT INTO CONFLUENCE_PAGES_MISSING_ALT_TEXT (pageID, pageName, imageNamesLinks) VALUES (?, ?, ?)""",
+            (
+                (
+                    str(pageID),
+                    f"Page {pageID}",
+                    str({f"https://confluence.example.com/download/attachments/{pageID}/image{imageNum}.png": f"image{imageNum}.png" for imageNum in range(numImagesPerPage)})
+                )
+                for pageID in range(1, numPagesMissingAltText + 1)
+            )
+        )
+
+        dbConnector.executemany(
+            """INSERT INTO RECENT_CONFLUENCE_AUTHORS (pageID, username) VALUES (?, ?)""",
+            ((str(pageID), f"author{pageID % numAuthors}") for pageID in range(1, numPagesMissingAltText + 1))
+        )
+
+        dbConnector.executemany(
+            """INSERT INTO LOG_CONFLUENCE_PAGES_TO_FIX (pageID, dateLastChecked, numDaysMissingAltText) VALUES (?, ?, ?)""",
+            ((str(pageID), "2022-01-01", pageID % 30) for pageID in range(1, numPagesMissingAltText + 1))
+        )
+
+def runBenchmark(numPages=100000, numPagesMissingAltText=20000, numImagesPerPage=3):
+    """
+    Times DBMigrator's migration steps on a synthetic db at the base schema (version 0), and prints the time and the peak memory they take
+
+    Run with `python -m benchmarks.migrationBenchmark` from the repo's root folder.
+
+    Parameters
+    ----------
+    numPages (optional) : Integer
+        The number of pages in ALL_CONFLUENCE_PAGES
+
+    numPagesMissingAltText (optional) : Integer
+        The number of those pages that are missing alternate text
+
+    numImagesPerPage (optional) : Integer
+        The number of images missing alternate text on each of those pages
+
+    Returns
+    ----------
+    none
+    """
+
+    with temporaryWorkingDir():
+        DBCreator().createBaseSchema()
+        fillLegacyDB(numPages, numPagesMissingAltText, numImagesPerPage)
+
+        appliedVersions, migrationSeconds, peakMemory = measure(DBMigrator().migrate)
+
+        dbConnector = ConnectionManager().getConnection()
+        numMigratedPages = dbConnector.execute("""SELECT COUNT(*) FROM ALL_CONFLUENCE_PAGES""").fetchone()[0]
+        numMigratedImages = dbConnector.execute("""SELECT COUNT(*) FROM PAGE_IMAGES_MISSING_ALT_TEXT""").fetchone()[0]
+
+    print(f"Migrated {numMigratedPages} pages and {numMigratedImages} images through schema versions {appliedVersions[0]} to {appliedVersions[-1]} in {migrationSeconds:.2f}s")
+    print(f"Peak Python memory during the migration: {peakMemory / 2**20:.1f} MiB")
+
+if __name__ == "__main__":
+    runBenchmark()
@@ -0,0 +1,80 @@
+import os
+from ACLIController import ACLIController
+from benchmarks.benchmarkHelper import fakeACLIOnPath, measure
+from benchmarks.fakeACLI import FAKE_ACLI_SCRIPT
+
+CREDENTIALS = {"username": "user", "password": "password", "serverAddr": "https://confluence.example.com"}
+
+def listWholeOutput():
+    """
+    Lists the pages the way getAllConfluencePageIDs did before it streamed: ACLI's whole output is captured, and then split into fields
+
+    Parameters
+    ----------
+    none
+
+    Returns
+    ----------
+    List
+        Two-item tuples of a pageID and the number of the current version of that page
+    """
+
+    results = ACLIController().runACLIaction(
+        acliAction="getPageList",
+        extraArgs=["--cql", "space=public", "--outputFormat", "2"],
+        **CREDENTIALS
+    ).stdout
+
+    results_SplitCommas = [result.split("\",\"") for index, result in enumerate(results.split("\n")) if index >= 2 and result]
+    results_NoQuotes = [[item.replace("\"", "") for item in result] for result in results_SplitCommas]
+
+    return [(result[1], result[7]) for result in results_NoQuotes]
+
+def countStreamedPages():
+    """
+    Counts the pages that streamAllConfluencePageIDs yields, as they arrive, the way run.py hands them to the Reconciler in chunks
+
+    Parameters
+    ----------
+    none
+
+    Returns
+    ----------
+    Integer
+        The number of pages
+    """
+
+    return sum(1 for _ in ACLIController().streamAllConfluencePageIDs(**CREDENTIALS))
+
+def runBenchmark(numPages=300000):
+    """
+    Times streamAllConfluencePageIDs against parsing ACLI's whole output at once, and prints the time and the peak memory of each
+
+    A stand-in acli (see fakeACLI.py) lists numPages synthetic pages, so the benchmark doesn't need ACLI or a Confluence server.  It only runs on Linux and macOS.
+
+    Run with `python -m benchmarks.pageListingBenchmark` from the repo's root folder.
+
+    Parameters
+    ----------
+    numPages (optional) : Integer
+        The number of pages in the listing
+
+    Returns
+    ----------
+    none
+    """
+
+    os.environ["FAKE_ACLI_NUM_PAGES"] = str(numPages)
+
+    with fakeACLIOnPath(FAKE_ACLI_SCRIPT):
+        detailedInfo, wholeOutputSeconds, wholeOutputPeakMemory = measure(listWholeOutput)
+        numWholeOutputPages = len(detailedInfo)
+        del detailedInfo
+
+        numStreamedPages, streamedSeconds, streamedPeakMemory = measure(countStreamedPages)
+
+    print(f"Whole output: {numWholeOutputPages} pages in {wholeOutputSeconds:.2f}s, peak Python memory {wholeOutputPeakMemory / 2**20:.1f} MiB")
+    print(f"Streamed: {numStreamedPages} pages in {streamedSeconds:.2f}s, peak Python memory {streamedPeakMemory / 2**20:.1f} MiB")
+
+if __name__ == "__main__":
+    runBenchmark()
@@ -0,0 +1,71 @@
+from benchmarks.benchmarkHelper import measure, temporaryWorkingDir
+from DBCreator import DBCreator
+from dbRecordHandler.reconciler import Reconciler
+
+def reconcileInventories(allInventories, inventoryMode, chunkSize):
+    """
+    Reconciles page inventories one after another, either whole or in chunks
+
+    Parameters
+    ----------
+    allInventories : List
+        Generators of two-item tuples of a pageID and the number of the current version of that page
+
+    inventoryMode : String
+        "whole" to read each inventory into a dict first, and reconcile it in one batch, the way run.py did before reconcilePageInventory took a stream.  "chunked" to reconcile each inventory in chunks as it streams in.
+
+    chunkSize : Integer
+        The number of pages to reconcile at a time, for "chunked".  Reconciler.INVENTORY_CHUNK_SIZE if None.
+
+    Returns
+    ----------
+    Dict
+        The counts that reconcilePageInventory returned for the last inventory
+    """
+
+    for detailedInfo in allInventories:
+        if inventoryMode == "whole":
+            dict_currentDetailedInfo = dict(detailedInfo)
+            reconciledCounts = Reconciler().reconcilePageInventory(dict_currentDetailedInfo.items(), chunkSize=max(1, len(dict_currentDetailedInfo)))
+            del dict_currentDetailedInfo
+        else:
+            reconciledCounts = Reconciler().reconcilePageInventory(detailedInfo, chunkSize=chunkSize)
+
+    return reconciledCounts
+
+def runBenchmark(numPages=500000, chunkSize=None):
+    """
+    Times page inventories that are reconciled in chunks as they stream in, against page inventories that are read into memory whole first, and prints the time and the peak memory of each
+
+    Each way runs two full inventories against a fresh db: one that adds numPages synthetic pages, and then one where 1% of the pages were removed and 10% changed.  The pages are generated as strings, the way ACLIController.streamAllConfluencePageIDs yields them.
+
+    Run with `python -m benchmarks.reconcilerBenchmark` from the repo's root folder.
+
+    Parameters
+    ----------
+    numPages (optional) : Integer
+        The number of pages in the first inventory
+
+    chunkSize (optional) : Integer
+        The number of pages to reconcile at a time.  Reconciler.INVENTORY_CHUNK_SIZE if not given.
+
+    Returns
+    ----------
+    none
+    """
+
+    for inventoryMode in ("whole", "chunked"):
+        with temporaryWorkingDir():
+            DBCreator().createDB()
+
+            allInventories = [
+                ((str(pageID), "1") for pageID in range(1, numPages + 1)),
+                ((str(pageID), "2" if pageID % 10 == 0 else "1") for pageID in range(1, numPages + 1) if pageID % 100 != 0)
+            ]
+
+            reconciledCounts, inventorySeconds, peakMemory = measure(reconcileInventories, allInventories, inventoryMode, chunkSize)
+
+        print(f"{inventoryMode.capitalize()} inventories of {numPages} pages: {inventorySeconds:.2f}s, peak Python memory {peakMemory / 2**20:.1f} MiB, second inventory {reconciledCounts}")
+
+if __name__ == "__main__":
+    runBenchmark()
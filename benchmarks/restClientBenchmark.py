@@ -0,0 +1,128 @@
+import math
+import os
+import time
+from ACLIController import ACLIController
+from benchmarks.benchmarkHelper import fakeACLIOnPath
+from benchmarks.fakeACLI import FAKE_ACLI_SCRIPT
+from confluenceRestClient import ConfluenceRestClient
+from confluenceRestStub import ConfluenceRestStub
+from htmlAltTextScanner import HTMLAltTextScanner
+from storageFormatScanner import StorageFormatScanner
+
+def timeInventoryAndHistories(controller, username, password, serverAddr, maxWorkers):
+    """
+    Lists every page, and then reads every page's content history, the way run.py does
+
+    Parameters
+    ----------
+    controller : Class (of type 'ACLIController' or 'ConfluenceRestClient')
+        The backend to time
+
+    username : String
+        The user's username
+
+    password : String
+        The user's password
+
+    serverAddr : String
+        The URL to the server
+
+    maxWorkers : Integer
+        The number of batches of histories to read at the same time
+
+    Returns
+    ----------
+    Tuple
+        A four item tuple of the number of pages listed, the seconds the listing took, the number of histories read, and the seconds that took
+    """
+
+    startTime = time.perf_counter()
+    pageIDs = [pageID for pageID, _ in controller.streamAllConfluencePageIDs(username, password, serverAddr)]
+    inventorySeconds = time.perf_counter() - startTime
+
+    startTime = time.perf_counter()
+    numHistories = sum(1 for _ in controller.getRevisionsForPages(username, password, serverAddr, pageIDs, maxWorkers=maxWorkers))
+    historySeconds = time.perf_counter() - startTime
+
+    return (len(pageIDs), inventorySeconds, numHistories, historySeconds)
+
+def runBenchmark(numPages=2000, numVersions=5, maxWorkers=None):
+    """
+    Times ConfluenceRestClient against ACLIController, listing pages and reading their content histories, and prints the pages/sec of each.  Also times HTMLAltTextScanner and StorageFormatScanner.
+
+    ConfluenceRestClient runs against a ConfluenceRestStub.  ACLIController runs the same calls it makes in production, against a stand-in acli (see fakeACLI.py) that serves the same pages and versions.  The stand-in starts a Python interpreter instead of a JVM, and answers without calling a server, so the ACLI figures are an upper bound on what ACLI itself would reach.  The ACLI side only runs on Linux and macOS.
+
+    Run with `python -m benchmarks.restClientBenchmark` from the repo's root folder.
+
+    Parameters
+    ----------
+    numPages (optional) : Integer
+        The number of pages that the stub and the stand-in serve
+
+    numVersions (optional) : Integer
+        The number of versions of each page
+
+    maxWorkers (optional) : Integer
+        The number of batches of histories to read at the same time.  ACLIController.ACLI_MAX_WORKERS if not given.
+
+    Returns
+    ----------
+    none
+    """
+
+    maxWorkers = maxWorkers or ACLIController.ACLI_MAX_WORKERS
+    stub = ConfluenceRestStub(numPages=numPages, numVersions=numVersions)
+    serverAddr = stub.start()
+
+    try:
+        restTimings = timeInventoryAndHistories(ConfluenceRestClient(), stub.username, stub.password, serverAddr, maxWorkers)
+        numRestRequests = stub.requestCount
+
+        scanner = HTMLAltTextScanner()
+        scanner.logInToConfluence(serverAddr, stub.username, stub.password)
+        numScannedPages = min(500, numPages)
+
+        startTime = time.perf_counter()
+
+        for pageID in range(1, numScannedPages + 1):
+            scanner.getImagesMissingAltTextFromHTML(*scanner.getPageHTML(f"{serverAddr}/pages/viewpage.action?pageId={pageID}"))
+
+        scanSeconds = time.perf_counter() - startTime
+
+        storageScanner = StorageFormatScanner()
+        storageScanner.logInToConfluence(serverAddr, stub.username, stub.password)
+        storageRequests = stub.requestCount
+
+        startTime = time.perf_counter()
+
+        for batchStart in range(1, numScannedPages + 1, storageScanner.STORAGE_BATCH_SIZE):
+            batchPageIDs = [str(pageID) for pageID in range(batchStart, min(batchStart + storageScanner.STORAGE_BATCH_SIZE, numScannedPages + 1))]
+
+            for pageID, (_, spaceKey, storageBody) in storageScanner.getStorageBodies(batchPageIDs).items():
+                storageScanner.getImagesMissingAltTextFromStorage(storageBody, pageID, spaceKey)
+
+        storageSeconds = time.perf_counter() - startTime
+        storageRequests = stub.requestCount - storageRequests
+    finally:
+        stub.stop()
+
+    os.environ["FAKE_ACLI_NUM_PAGES"] = str(numPages)
+    os.environ["FAKE_ACLI_NUM_VERSIONS"] = str(numVersions)
+
+    with fakeACLIOnPath(FAKE_ACLI_SCRIPT):
+        acliTimings = timeInventoryAndHistories(ACLIController(), "user", "password", "https://confluence.example.com", maxWorkers)
+
+    for backendName, (numListedPages, inventorySeconds, numHistories, historySeconds) in (("REST", restTimings), ("ACLI (stand-in)", acliTimings)):
+        print(f"{backendName} inventory: {numListedPages} pages, {numListedPages / inventorySeconds:.0f} pages/sec")
+        print(f"{backendName} content histories: {numHistories} pages of {numVersions} versions, {maxWorkers} at a time, {numHistories / historySeconds:.0f} pages/sec")
+
+    # One process lists the pages, and getRevisionsForPages starts one process per batch of histories
+    historyBatchSize = min(ACLIController.ACLI_BATCH_SIZE, math.ceil(numPages / maxWorkers))
+
+    print(f"REST requests for the inventory and histories: {numRestRequests}")
+    print(f"ACLI processes for the inventory and histories: {1 + math.ceil(numPages / historyBatchSize)}, each of which starts a JVM with real ACLI")
+    print(f"HTML page scan: {numScannedPages} pages with {stub.numImages} images each, one connection, {numScannedPages / scanSeconds:.0f} pages/sec")
+    print(f"Storage format scan: {numScannedPages} pages with {stub.numImages} images each in {storageRequests} requests, one connection, {numScannedPages / storageSeconds:.0f} pages/sec")
+
+if __name__ == "__main__":
+    runBenchmark()
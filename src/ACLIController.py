@@ -1,6 +1,15 @@
 import subprocess
 import gc
-from datetime import date, datetime
+import csv
+import io
+import math
+import queue
+import threading
+from itertools import islice
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from historyAnalyzer import HistoryAnalyzer
 
 class ACLIController:
     """Makes and returns calls to Bob Swift's ACLI app.
@@ -9,7 +18,11 @@ class ACLIController:
 
     Attributes
     ----------
-    None
+    ACLI_BATCH_SIZE (class) : Integer
+        The most pages that getRevisionsForPages fetches in one ACLI process (one JVM startup)
+
+    ACLI_MAX_WORKERS (class) : Integer
+        The default number of ACLI processes that getRevisionsForPages runs at the same time
     
     Methods
     ----------
@@ -17,15 +30,56 @@ class ACLIController:
         Makes a call to the ACLI app.
         Many of the methods in this ACLIController class calls this method.
 
+    runACLIscript(username, password, serverAddr, actions)
+        Makes one call to the ACLI app that runs many actions, by writing them to an ACLI run script
+
+    streamACLIaction(username, password, serverAddr, acliAction, extraArgs, numLinesToSkip)
+        Makes a call to the ACLI app, and yields the rows of its CSV output as they arrive
+
     testACLIauthentication(username, password, serverAddr)
         Ensure that the user provided the correct username and password
 
+    probeAuthentication(username, password, serverAddr)
+        Makes the cheapest call to the server that only succeeds with the correct username and password
+
     getAllConfluencePageIDs(username, password, serverAddr)
         Calls runACLIaction method to get pageIDs and current version numbers for all public Confluence pages
 
+    streamAllConfluencePageIDs(username, password, serverAddr, modifiedSince, spaceKey)
+        Yields the pageID and current version number of every page in a Confluence space (or only the ones modified since a given date), as ACLI lists them
+
+    streamPageIDChunksForSpaces(username, password, serverAddr, spaceKeys, modifiedSinceBySpace, chunkSize, maxWorkers)
+        Lists the pages of several Confluence spaces at the same time, and yields each space's pages in chunks as they arrive
+
+    listSpaceInChunks(chunkQueue, stopEvent, username, password, serverAddr, spaceKey, modifiedSince, chunkSize)
+        Lists the pages of one Confluence space, and puts them on a queue in chunks.  Runs on a worker thread of streamPageIDChunksForSpaces.
+
     instanceMethodName(username, password, serverAddr, pageID)
         Receives a pageID and returns a list of the authors who've recently updated the page.
+
+    getRecentAuthorsForPages(username, password, serverAddr, pageIDs, maxWorkers)
+        Receives pageIDs and yields the authors who've recently updated each page, fetching batches of pages in parallel ACLI processes
+
+    getRevisionsForPages(username, password, serverAddr, pageIDs, maxWorkers)
+        Receives pageIDs and yields the revisions of each page, fetching batches of pages in parallel ACLI processes
+
+    getRevisionsForBatch(username, password, serverAddr, pageIDs)
+        Receives a batch of pageIDs and returns the revisions of each page, from one call to the ACLI app
+
+    getRecentAuthorsFromHistory(historyRows)
+        Receives the rows of a page's content history, as ACLI lists them, and returns a list of the authors who've recently updated the page
+
+    getRevisionsFromHistory(historyRows)
+        Receives the rows of a page's content history, as ACLI lists them, and returns the date and author of each revision
+
+    getRecentAuthorsFromRevisions(allRevisions)
+        Receives a page's revisions, and returns a list of the authors who've recently updated the page
     """
+
+    ACLI_BATCH_SIZE = 200
+
+    ACLI_MAX_WORKERS = 4
+
     
     def __init__(self):
         """
@@ -94,6 +148,138 @@ class ACLIController:
 
         return acliAuthenticationObj
 
+    def runACLIscript(
+        self,
+        username,
+        password,
+        serverAddr,
+        actions
+    ):
+        """
+        Makes one call to the ACLI app that runs many actions, by writing them to an ACLI run script
+
+        Every call to the ACLI app starts a new JVM, which takes a few seconds.  The "run" action runs every line of a script in the same JVM, so that startup cost is only paid once.  The script continues past actions that fail.
+
+        Parameters
+        ----------
+        username: String
+            The user's username
+
+        password: String
+            The user's password
+
+        serverAddr: String
+            The address to the specific Confluence server the ACLI should connect to
+
+        actions : List
+            Lists of the arguments for each action (e.g. ["--action", "getContentHistoryList", "--id", pageID]).  Arguments must not contain double quotes.
+
+        Returns
+        ----------
+        Class (of type 'subprocess.CompletedProcess')
+            Value that is returned after calling the ACLI "run" action
+        """
+
+        with tempfile.TemporaryDirectory() as scriptDir:
+            scriptPath = Path(scriptDir) / "acliActions.txt"
+
+            scriptPath.write_text(
+                "\n".join(" ".join(f'"{arg}"' for arg in action) for action in actions) + "\n",
+                encoding="utf-8"
+            )
+
+            return ACLIController.runACLIaction(
+                self,
+                username=username,
+                password=password,
+                serverAddr=serverAddr,
+                acliAction="run",
+                extraArgs=["--file", scriptPath.as_posix(), "--continue"]
+            )
+
+    def streamACLIaction(
+        self,
+        username,
+        password,
+        serverAddr,
+        acliAction,
+        extraArgs=[],
+        numLinesToSkip=0
+    ):
+        """
+        Makes a call to the ACLI app, and yields the rows of its CSV output as they arrive
+
+        The output is parsed by csv.reader straight from the subprocess's stdout pipe, so it never sits in memory all at once, and quoted fields that contain commas or quotes are parsed correctly.
+
+        ACLI's error output goes to a temporary file, so it can't fill up a pipe and stall ACLI while stdout is being read.  If ACLI exits with an error (e.g. a failed login, a dropped connection, or a killed process), its output may look like a short but valid list, so a RuntimeError is raised once the output has been read, before the caller can treat the list as complete.
+
+        Parameters
+        ----------
+        username: String
+            The user's username
+
+        password: String
+            The user's password
+
+        serverAddr: String
+            The address to the specific Confluence server the ACLI should connect to
+
+        acliAction : String
+            The name of the specific ACLI action getting called
+
+        extraArgs : List
+            A list of extra arguments that could get passed to the ACLI, based on the specific ACLI action
+
+        numLinesToSkip : Integer
+            The number of lines before the CSV rows start (e.g. a count line, and the header)
+
+        Returns
+        ----------
+        Generator
+            Yields each CSV row as a list of fields.  Blank lines are skipped.
+        """
+
+        acliErrors = tempfile.TemporaryFile()
+
+        acliProcess = subprocess.Popen(
+            [
+                "acli",
+                "confluence",
+                "--server",
+                serverAddr,
+                "--user",
+                username, 
+                "--password",
+                password,
+                "--action",
+                acliAction
+            ] + extraArgs,
+            stdout=subprocess.PIPE,
+            stderr=acliErrors
+        )
+
+        # csv.reader needs the newlines untranslated, so that quoted fields can contain line breaks
+        acliOutput = io.TextIOWrapper(acliProcess.stdout, encoding="utf-8", newline="")
+
+        try:
+            for _ in islice(acliOutput, numLinesToSkip):
+                pass
+
+            for row in csv.reader(acliOutput):
+                if row:
+                    yield row
+        finally:
+            acliOutput.close()
+            acliProcess.wait()
+
+            acliErrors.seek(0)
+            errorOutput = acliErrors.read().decode("utf-8", errors="replace").strip()
+            acliErrors.close()
+
+        # Only checked once every row was read.  A caller that stops early closes the pipe, which ends ACLI with an error on purpose.
+        if acliProcess.returncode != 0:
+            raise RuntimeError(f"ACLI action {acliAction} failed with exit code {acliProcess.returncode}: {errorOutput}")
+
     def testACLIauthentication(
         self,
         username,
@@ -102,6 +288,8 @@ class ACLIController:
     ):
         """
         Ensure that the user provided the correct username and password
+
+        Makes one call to the server (see probeAuthentication) each time it's asked.
     
         Parameters
         ----------
@@ -119,19 +307,51 @@ class ACLIController:
         Boolean
             True if the user's credentials were authenticated, False otherwise
         """
+
+        return self.probeAuthentication(
+            username=username,
+            password=password,
+            serverAddr=serverAddr
+        )
+
+    def probeAuthentication(
+        self,
+        username,
+        password,
+        serverAddr
+    ):
+        """
+        Makes the cheapest call to the server that only succeeds with the correct username and password
+
+        Looks up the user's own account, instead of listing every space on the server.
     
-        
-        
-        if ACLIController.runACLIaction(
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+    
+        Returns
+        ----------
+        Boolean
+            True if the server accepted the user's credentials, False otherwise
+        """
+
+        acliProcess = ACLIController.runACLIaction(
             self,
             username=username,
             password=password,
             serverAddr=serverAddr,
-            acliAction="getSpaceList"
-        ).stderr != "":
-            return False
-        else:
-            return True
+            acliAction="getUser",
+            extraArgs=["--userId", username]
+        )
+
+        return acliProcess.returncode == 0 and acliProcess.stderr == ""
 
     def getAllConfluencePageIDs(
         self,
@@ -162,36 +382,226 @@ class ACLIController:
             - the number of the current version of the page,
         """
     
-        results = ACLIController.runACLIaction(
+        return list(self.streamAllConfluencePageIDs(
+            username=username,
+            password=password,
+            serverAddr=serverAddr
+        ))
+
+    def streamAllConfluencePageIDs(
+        self,
+        username,
+        password,
+        serverAddr,
+        modifiedSince=None,
+        spaceKey="public"
+    ):
+        """
+        Yields the pageID and current version number of every page in a Confluence space (or only the ones modified since a given date), as ACLI lists them
+
+        Memory use stays flat no matter how many pages are in the space.
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        modifiedSince (optional) : String
+            A date in the format yyyy-mm-dd.  If given, only pages modified on or after this date are listed.
+
+        spaceKey (optional) : String
+            The key of the Confluence space to list the pages of
+
+        Returns
+        ----------
+        Generator
+            Yields two-item tuples of
+            
+            - the ID number for a Confluence page,
+            - the number of the current version of the page,
+        """
+
+        cql = f"space={spaceKey}"
+
+        if modifiedSince is not None:
+            cql += f" and lastmodified >= \"{modifiedSince}\""
+
+        # The first line is a count of the pages, and the second line is the header
+        for row in ACLIController.streamACLIaction(
             self,
             username=username,
             password=password,
             serverAddr=serverAddr,
             acliAction="getPageList",
-            extraArgs=["--cql", "space=public", "--outputFormat", "2"]
-        ).stdout
+            extraArgs=["--cql", cql, "--outputFormat", "2"],
+            numLinesToSkip=2
+        ):
+            yield (
+                row[1], # <-- PageID number
+                row[7], # <-- Number of current version of Confluence page
+            )
 
-        results_SplitNewLine = results.split("\n")
-        results_SplitCommas = []
+    def streamPageIDChunksForSpaces(
+        self,
+        username,
+        password,
+        serverAddr,
+        spaceKeys,
+        modifiedSinceBySpace={},
+        chunkSize=5000,
+        maxWorkers=None
+    ):
+        """
+        Lists the pages of several Confluence spaces at the same time, and yields each space's pages in chunks as they arrive
 
-        for index, result in enumerate(results_SplitNewLine):
-            if index >= 2 and result:
-                results_SplitCommas.append([item for item in result.split("\",\"")])
+        Each space is listed by streamAllConfluencePageIDs on its own worker thread.  The chunks are handed over through a bounded queue, so memory use is bounded by chunkSize and the number of spaces, instead of by the size of the spaces.  Chunks of different spaces arrive interleaved.
 
-        results_NoQuotes = []
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        spaceKeys : List
+            The keys of the Confluence spaces to list the pages of
+
+        modifiedSinceBySpace (optional) : Dict
+            Key-value pairs of a space key and a date in the format yyyy-mm-dd.  A space with a date only lists the pages modified on or after that date.
+
+        chunkSize (optional) : Integer
+            The most pages in one chunk
+
+        maxWorkers (optional) : Integer
+            The number of spaces to list at the same time.  ACLI_MAX_WORKERS if not given.
+
+        Returns
+        ----------
+        Generator
+            Yields two-item tuples of a space key, and a list of two-item tuples of a pageID and its current version number.  Once a space has been fully listed, its key is yielded with an empty list.
+        """
+
+        maxWorkers = maxWorkers or self.ACLI_MAX_WORKERS
+
+        if not spaceKeys:
+            return
+
+        chunkQueue = queue.Queue(maxsize=2 * min(maxWorkers, len(spaceKeys)))
+        stopEvent = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            for spaceKey in spaceKeys:
+                executor.submit(
+                    self.listSpaceInChunks,
+                    chunkQueue=chunkQueue,
+                    stopEvent=stopEvent,
+                    username=username,
+                    password=password,
+                    serverAddr=serverAddr,
+                    spaceKey=spaceKey,
+                    modifiedSince=modifiedSinceBySpace.get(spaceKey),
+                    chunkSize=chunkSize
+                )
+
+            try:
+                numSpacesListed = 0
 
-        for result in results_SplitCommas:
-            results_NoQuotes.append([item.replace("\"", "") for item in result])
+                while numSpacesListed < len(spaceKeys):
+                    spaceKey, chunk = chunkQueue.get()
 
-        detailedInfo = []
+                    if isinstance(chunk, Exception):
+                        raise chunk
 
-        for result in results_NoQuotes:
-            detailedInfo.append((
-                result[1], # <-- PageID number
-                result[7], # <-- Number of current version of Confluence page
-            ))
+                    if not chunk:
+                        numSpacesListed += 1
+
+                    yield (spaceKey, chunk)
+            finally:
+                # Lets the workers give up, if the caller stops early or a worker failed
+                stopEvent.set()
+
+    def listSpaceInChunks(
+        self,
+        chunkQueue,
+        stopEvent,
+        username,
+        password,
+        serverAddr,
+        spaceKey,
+        modifiedSince=None,
+        chunkSize=5000
+    ):
+        """
+        Lists the pages of one Confluence space, and puts them on a queue in chunks.  Runs on a worker thread of streamPageIDChunksForSpaces.
+
+        Parameters
+        ----------
+        chunkQueue : Class (of type 'queue.Queue')
+            The queue to put (spaceKey, chunk) tuples on.  An empty chunk is put on it once the space has been fully listed, or the exception if listing failed.
+
+        stopEvent : Class (of type 'threading.Event')
+            Set once nothing reads from chunkQueue anymore
+
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
 
-        return detailedInfo
+        spaceKey : String
+            The key of the Confluence space to list the pages of
+
+        modifiedSince (optional) : String
+            A date in the format yyyy-mm-dd.  If given, only pages modified on or after this date are listed.
+
+        chunkSize (optional) : Integer
+            The most pages in one chunk
+
+        Returns
+        ----------
+        None
+        """
+
+        detailedInfo = self.streamAllConfluencePageIDs(
+            username=username,
+            password=password,
+            serverAddr=serverAddr,
+            modifiedSince=modifiedSince,
+            spaceKey=spaceKey
+        )
+
+        try:
+            while not stopEvent.is_set():
+                try:
+                    chunk = list(islice(detailedInfo, chunkSize))
+                except Exception as e:
+                    chunk = e
+
+                # Waits for room on the queue, but never past the point where nothing reads from it anymore
+                while not stopEvent.is_set():
+                    try:
+                        chunkQueue.put((spaceKey, chunk), timeout=1)
+                        break
+                    except queue.Full:
+                        continue
+
+                if not chunk or isinstance(chunk, Exception):
+                    return
+        finally:
+            detailedInfo.close()
 
     def getRecentAuthors(self, 
         username, 
@@ -222,95 +632,249 @@ class ACLIController:
             A list of tuples.  Each tuple will contain the authors username and full name.  This list will contain no duplicates.
         """
     
-        result = ACLIController.runACLIaction(
+        # The first line is a count of the history entries, and the second line is the header
+        return self.getRecentAuthorsFromHistory(ACLIController.streamACLIaction(
             self,
             username=username,
             password=password,
             serverAddr=serverAddr,
             acliAction="getContentHistoryList",
-            extraArgs=["--id", pageID, "--dateFormat", "yyyy-MM-dd"]
+            extraArgs=["--id", pageID, "--dateFormat", "yyyy-MM-dd"],
             # extraArgs=["--id", pageID, "--outputFormat", "2", "--dateFormat", "yyyy-MM-dd"]
-        ).stdout
-        
-        results_SplitNewLine = result.split("\n")
-        results_SplitCommas = []
+            numLinesToSkip=2
+        ))
+
+    def getRecentAuthorsForPages(
+        self,
+        username,
+        password,
+        serverAddr,
+        pageIDs,
+        maxWorkers=None
+    ):
+        """
+        Receives pageIDs and yields the authors who've recently updated each page, fetching batches of pages in parallel ACLI processes
+
+        Parameters
+        ----------
+        username : String
+            The user's username
 
-        for index, result in enumerate(results_SplitNewLine):
-            if index >= 2 and result:
-                results_SplitCommas.append([item for item in result.split("\",\"")])
+        password : String
+            The user's password
 
-        results_NoQuotes = []
+        serverAddr : String
+            The URL to the server
 
-        for result in results_SplitCommas:
-            results_NoQuotes.append([item.replace("\"", "") for item in result])
+        pageIDs : List
+            The unique IDs of Confluence pages
 
-        allRevisions = []
+        maxWorkers (optional) : Integer
+            The number of ACLI processes to run at the same time.  ACLI_MAX_WORKERS if not given.
 
-        for result in results_NoQuotes:
-            allRevisions.append((
-                result[5], # <-- Date of page revision
-                result[6], # <-- Username of the author who published the revision
-                result[8] # <-- Name of the author who published the revision
-            ))
+        Returns
+        ----------
+        Generator
+            Yields two-item tuples of a pageID, and the list that getRecentAuthors would return for that page
+        """
 
-        # Converts revision dates from yyyy-mm-dd to the number of days since the revision
-        
-        todaysDate = datetime.today().strftime('%Y-%m-%d')
-        todaysDate_obj = date(
-            int(todaysDate[0:4]), 
-            int(todaysDate[5:7]), 
-            int(todaysDate[8:10])
-        )
-        allRevisions_daysSinceLastEdit = []
-
-        for revision in allRevisions:
-            revisionDate = revision[0]
-            revisionDate_obj = date(
-                int(revisionDate[0:4]), 
-                int(revisionDate[5:7]), 
-                int(revisionDate[8:10])
+        for pageID, revisions in self.getRevisionsForPages(
+            username=username,
+            password=password,
+            serverAddr=serverAddr,
+            pageIDs=pageIDs,
+            maxWorkers=maxWorkers
+        ):
+            yield (pageID, self.getRecentAuthorsFromRevisions(revisions))
+
+    def getRevisionsForPages(
+        self,
+        username,
+        password,
+        serverAddr,
+        pageIDs,
+        maxWorkers=None
+    ):
+        """
+        Receives pageIDs and yields the revisions of each page, fetching batches of pages in parallel ACLI processes
+
+        The pages are split into at most ACLI_BATCH_SIZE pages per batch, and into enough batches to keep every worker busy.  Each batch's results are yielded as soon as that batch completes, so they don't come back in the order of pageIDs.
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        pageIDs : List
+            The unique IDs of Confluence pages
+
+        maxWorkers (optional) : Integer
+            The number of ACLI processes to run at the same time.  ACLI_MAX_WORKERS if not given.
+
+        Returns
+        ----------
+        Generator
+            Yields two-item tuples of a pageID, and the list that getRevisionsFromHistory would return for that page
+        """
+
+        maxWorkers = maxWorkers or self.ACLI_MAX_WORKERS
+
+        if not pageIDs:
+            return
+
+        batchSize = min(self.ACLI_BATCH_SIZE, math.ceil(len(pageIDs) / maxWorkers))
+
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            futures = [
+                executor.submit(
+                    self.getRevisionsForBatch,
+                    username=username,
+                    password=password,
+                    serverAddr=serverAddr,
+                    pageIDs=pageIDs[batchStart:batchStart + batchSize]
+                )
+                for batchStart in range(0, len(pageIDs), batchSize)
+            ]
+
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def getRevisionsForBatch(
+        self,
+        username,
+        password,
+        serverAddr,
+        pageIDs
+    ):
+        """
+        Receives a batch of pageIDs and returns the revisions of each page, from one call to the ACLI app
+
+        Each page's content history is written to its own file by the ACLI run script, so that the history can be matched back to its pageID afterwards.  If ACLI exits with an error (e.g. a failed login, or a page it couldn't read), or a page's history file is missing, a RuntimeError is raised.  Otherwise a page with no history would look like a page with no recent authors.
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        pageIDs : List
+            The unique IDs of Confluence pages
+
+        Returns
+        ----------
+        List
+            Two-item tuples of a pageID, and the list that getRevisionsFromHistory would return for that page
+        """
+
+        revisionsByPageID = []
+
+        with tempfile.TemporaryDirectory() as historyDir:
+            historyPaths = {
+                pageID : (Path(historyDir) / f"{pageID}.csv").as_posix()
+                for pageID in pageIDs
+            }
+
+            acliResult = ACLIController.runACLIscript(
+                self,
+                username=username,
+                password=password,
+                serverAddr=serverAddr,
+                actions=[
+                    [
+                        "--action", "getContentHistoryList",
+                        "--id", pageID,
+                        "--dateFormat", "yyyy-MM-dd",
+                        "--file", historyPath
+                    ]
+                    for pageID, historyPath in historyPaths.items()
+                ]
             )
 
-            delta = todaysDate_obj - revisionDate_obj
+            if acliResult.returncode != 0:
+                raise RuntimeError(f"ACLI failed to read the content histories of pages {pageIDs[0]} to {pageIDs[-1]} with exit code {acliResult.returncode}: {acliResult.stderr.strip()}")
 
-            allRevisions_daysSinceLastEdit.append((
-                delta.days,
-                revision[1],
-                revision[2]
-            ))
+            for pageID, historyPath in historyPaths.items():
+                if not Path(historyPath).exists():
+                    raise RuntimeError(f"ACLI didn't write the content history of page {pageID}")
 
-        # Identifies and returns recent revisions
+                with open(historyPath, encoding="utf-8", newline="") as historyFile:
+                    # A history file has no count line, so only the header is skipped
+                    historyRows = islice(csv.reader(historyFile), 1, None)
 
-        recentRevisions_daysSinceLastEdit = []
+                    revisionsByPageID.append((pageID, self.getRevisionsFromHistory(historyRows)))
 
-        if allRevisions_daysSinceLastEdit[0][0] > 30:
-            if len(allRevisions_daysSinceLastEdit) < 5:
-                recentRevisions_daysSinceLastEdit = allRevisions_daysSinceLastEdit
-            else:
-                index = 0
+        return revisionsByPageID
 
-                for num in range(5):
-                    recentRevisions_daysSinceLastEdit.append(allRevisions_daysSinceLastEdit[index])
-                    index+=1
-        else:
-            for revision in allRevisions_daysSinceLastEdit:
-                if revision[0] <= 30:
-                    recentRevisions_daysSinceLastEdit.append(revision)
+    def getRecentAuthorsFromHistory(self, historyRows):
+        """
+        Receives the rows of a page's content history, as ACLI lists them, and returns a list of the authors who've recently updated the page
 
-        # Removes duplicate authors
+        Parameters
+        ----------
+        historyRows : Iterable
+            The CSV rows of the page's content history (each a list of fields), without the header
+
+        Returns
+        ----------
+        List
+            A list of tuples.  Each tuple will contain the authors username and full name.  This list will contain no duplicates.
+        """
 
-        recentAuthors_dict = {}
+        return self.getRecentAuthorsFromRevisions(self.getRevisionsFromHistory(historyRows))
 
-        for revision in recentRevisions_daysSinceLastEdit:
-            recentAuthors_dict[revision[1]] = revision[2]
+    def getRevisionsFromHistory(self, historyRows):
+        """
+        Receives the rows of a page's content history, as ACLI lists them, and returns the date and author of each revision
 
-        recentAuthors_t = []
-        
-        for username, fullname in recentAuthors_dict.items():
-            recentAuthors_t.append((
-                username,
-                fullname
-            ))
+        Parameters
+        ----------
+        historyRows : Iterable
+            The CSV rows of the page's content history (each a list of fields), without the header
+
+        Returns
+        ----------
+        List
+            Three-item tuples of the date of the revision (yyyy-mm-dd), and the username and full name of the author who published it, newest first
+        """
 
-        return recentAuthors_t
+        allRevisions = []
+
+        for result in historyRows:
+            if result:
+                allRevisions.append((
+                    result[5], # <-- Date of page revision
+                    result[6], # <-- Username of the author who published the revision
+                    result[8] # <-- Name of the author who published the revision
+                ))
+
+        return allRevisions
+
+    def getRecentAuthorsFromRevisions(self, allRevisions):
+        """
+        Receives a page's revisions, and returns a list of the authors who've recently updated the page
+
+        The authors of every revision in the last 30 days are recent.  If the page hasn't been updated in the last 30 days, the authors of the last 5 revisions are recent instead.  This only depends on today's date, so revisions cached from an earlier run can be reused.  See HistoryAnalyzer.getRecentAuthors.
+
+        Parameters
+        ----------
+        allRevisions : List
+            Three-item tuples of the date of the revision (yyyy-mm-dd), and the username and full name of the author who published it, newest first, as returned by getRevisionsFromHistory
+
+        Returns
+        ----------
+        List
+            A list of tuples.  Each tuple will contain the authors username and full name.  This list will contain no duplicates.
+        """
 
+        return HistoryAnalyzer().getRecentAuthors(allRevisions)
@@ -1,6 +1,6 @@
-import sqlite3
 import os
-from pathlib import Path
+from dbRecordHandler.connectionManager import ConnectionManager
+from DBMigrator import DBMigrator
 
 class DBCreator:
     """Creates .db for script
@@ -13,7 +13,10 @@ class DBCreator:
     Methods
     ----------
     createDB
-        Creates .db for .py script
+        Creates .db for .py script, at the base schema (version 0), and then runs DBMigrator's migration steps to bring it up to the latest schema
+
+    createBaseSchema
+        Creates the tables of the base schema (version 0), which older versions of this script created
 
     doesDBexist
         Checks to see if webscraper.db already exists 
@@ -31,7 +34,7 @@ class DBCreator:
 
     def createDB(self):
         """
-        Creates .db for .py script
+        Creates .db for .py script, at the base schema (version 0), and then runs DBMigrator's migration steps to bring it up to the latest schema
     
         Parameters
         ----------
@@ -42,7 +45,24 @@ class DBCreator:
         nonef
         """
 
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        self.createBaseSchema()
+
+        DBMigrator().migrate()
+
+    def createBaseSchema(self):
+        """
+        Creates the tables of the base schema (version 0), which older versions of this script created
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
         dbCursor.execute("""CREATE TABLE ALL_CONFLUENCE_PAGES (
@@ -105,8 +125,7 @@ class DBCreator:
         dbCursor.executemany("""INSERT INTO LOG_CLI_MAJOR_TASKS (majorTaskCode, majorTaskDesc) VALUES (?,?)""", 
                             defaultValues_LOG_CLI_MAJOR_TASKS)
 
-        dbConnector.commit()
-        dbConnector.close()
+        ConnectionManager().commit()
 
     def doesDBexist(self):
         """
@@ -122,4 +141,4 @@ class DBCreator:
             True if .db exist, False otherwise
         """
     
-        return os.path.exists(str(Path.cwd())+"/src/sensitive/webscraper.db")
\ No newline at end of file
+        return os.path.exists(ConnectionManager().getDBPath())
@@ -0,0 +1,609 @@
+import ast
+from datetime import datetime
+from dbRecordHandler.connectionManager import ConnectionManager
+from dbRecordHandler.sqlHelper import SQLHelper
+
+class DBMigrator:
+    """Brings an existing webscraper.db up to the latest schema, one versioned migration step at a time.
+
+    The db's schema version is tracked with PRAGMA user_version.  A db that DBCreator.createDB built without any migrations is at version 0.  Each migration step runs in its own transaction, together with the bump of user_version, so a step is either fully applied or not applied at all.
+
+    Attributes
+    ----------
+    MIGRATIONS (class) : List
+        Three-item tuples of the schema version a step migrates to, a description of the step, and the name of the DBMigrator method that runs the step.  Steps are run in this order.
+
+    ALLOWED_SCANS (class) : Tuple
+        The only "SCAN" steps of a query plan that don't count as a full table scan.  Every other SCAN step does, including a scan of a whole covering index.
+
+
+    Methods
+    ----------
+    getSchemaVersion()
+        Returns the db's current schema version
+
+    getLatestSchemaVersion()
+        Returns the schema version the db will be at, after all migration steps have run
+
+    migrate()
+        Runs every migration step that hasn't been applied to the db yet
+
+    getFullTableScans(queries)
+        Returns the names of the statements that SQLite would answer with a full table scan
+
+    getFullTableScanSteps(query, allowedScans)
+        Returns the steps of a statement's query plan that read a whole table or index
+
+    rebuildTable(tableName, createTableStatement, columnsToCopy, createIndexStatements)
+        Rebuilds a table with a new definition, and copies the existing rows into it in bulk
+
+    migrateImagesToOwnTable()
+        Migration step 1.  Moves the images stored in CONFLUENCE_PAGES_MISSING_ALT_TEXT.imageNamesLinks to the PAGE_IMAGES_MISSING_ALT_TEXT table
+
+    migrateToTypedSchema()
+        Migration step 2.  Rebuilds the page tables so that pageIDs and page versions are stored as integers, and flags are stored as 0/1 instead of "TRUE"/"FALSE"
+
+    addHotPredicateIndexes()
+        Migration step 3.  Adds indexes for the predicates that the Retriever and Deleter filter on, and drops the unique indexes that duplicate primary keys
+
+    addExcludedAuthorsTable()
+        Migration step 4.  Adds the EXCLUDED_AUTHORS table, which persists the authors who should never be written to the db or have their email address looked up
+
+    addPageInventoryLogTable()
+        Migration step 5.  Adds the LOG_PAGE_INVENTORY table, which holds the high-water marks for incremental page inventories
+
+    addPageRevisionsCacheTable()
+        Migration step 6.  Adds the CACHED_PAGE_REVISIONS table, which caches each page's content history for the page version it was fetched at
+
+    addSpaceKeys()
+        Migration step 7.  Records which Confluence space each page is in, and keeps the page inventory marks and progress checkpoints per space
+    """
+
+    MIGRATIONS = [
+        (1, "Move images missing alternate text to PAGE_IMAGES_MISSING_ALT_TEXT", "migrateImagesToOwnTable"),
+        (2, "Store pageIDs and versions as integers, and flags as 0/1", "migrateToTypedSchema"),
+        (3, "Index the hot predicates, and drop redundant unique indexes", "addHotPredicateIndexes"),
+        (4, "Persist VIPs, service accounts, and authors without an address in EXCLUDED_AUTHORS", "addExcludedAuthorsTable"),
+        (5, "Track the last page inventories in LOG_PAGE_INVENTORY", "addPageInventoryLogTable"),
+        (6, "Cache content histories by page version in CACHED_PAGE_REVISIONS", "addPageRevisionsCacheTable"),
+        (7, "Track the space of each page, and the inventory marks and checkpoints of each space", "addSpaceKeys"),
+    ]
+
+    ALLOWED_SCANS = (
+        # Reads the list of IDs bound to the statement as JSON, not a table
+        "SCAN json_each VIRTUAL TABLE",
+        # A partial index that only holds the recently updated pages
+        "SCAN ALL_CONFLUENCE_PAGES USING INDEX IX_ALL_CONFLUENCE_PAGES_RECENTLYUPDATED",
+    )
+
+    def __init__(self):
+        """
+        Parameters
+        ----------
+        none
+        """
+
+    def __repr__(self):
+        return f'DBMigrator()'
+
+    def getSchemaVersion(self):
+        """
+        Returns the db's current schema version
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        Integer
+            The value of PRAGMA user_version
+        """
+
+        return ConnectionManager().getConnection().execute("PRAGMA user_version").fetchone()[0]
+
+    def getLatestSchemaVersion(self):
+        """
+        Returns the schema version the db will be at, after all migration steps have run
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        Integer
+            The version of the last migration step
+        """
+
+        return self.MIGRATIONS[-1][0]
+
+    def migrate(self):
+        """
+        Runs every migration step that hasn't been applied to the db yet
+
+        Foreign keys are turned off while a step runs, so that tables can be rebuilt without cascading deletes.  Before each step is committed, PRAGMA foreign_key_check ensures the step left no broken references behind.
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        List
+            The versions of the migration steps that were applied
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+
+        appliedVersions = []
+
+        for version, description, methodName in self.MIGRATIONS:
+            if version <= self.getSchemaVersion():
+                continue
+
+            print(f"Migrating webscraper.db to schema version {version} ({description}) now...")
+
+            # PRAGMA foreign_keys can't be changed inside a transaction
+            dbConnector.execute("PRAGMA foreign_keys = OFF")
+
+            try:
+                with ConnectionManager().unitOfWork():
+                    getattr(self, methodName)()
+
+                    if dbConnector.execute("PRAGMA foreign_key_check").fetchone() is not None:
+                        raise RuntimeError(f"Migration to schema version {version} left broken foreign keys behind")
+
+                    dbConnector.execute(f"PRAGMA user_version = {int(version)}")
+            finally:
+                dbConnector.execute("PRAGMA foreign_keys = ON")
+
+            appliedVersions.append(version)
+
+        return appliedVersions
+
+    def getFullTableScans(self, queries=None):
+        """
+        Returns the names of the statements that SQLite would answer with a full table scan
+
+        Parameters
+        ----------
+        queries (optional) : Dict
+            Key-value pairs of a name and a statement.  SQLHelper.SQL_INDEXED_QUERIES if not given.
+
+        Returns
+        ----------
+        List
+            The names of the statements that fall back to a full table scan.  Empty if every statement is served by an index.
+        """
+
+        if queries is None:
+            queries = SQLHelper.SQL_INDEXED_QUERIES
+
+        return [queryName for queryName, query in queries.items() if self.getFullTableScanSteps(query)]
+
+    def getFullTableScanSteps(self, query, allowedScans=()):
+        """
+        Returns the steps of a statement's query plan that read a whole table or index
+
+        The statement is run through EXPLAIN QUERY PLAN, with NULL bound to every parameter.  Every "SCAN" step counts, unless it starts with one of ALLOWED_SCANS or allowedScans.  A SEARCH step only reads the rows that match its index key, so it never counts.
+
+        Parameters
+        ----------
+        query : String
+            The statement to check
+
+        allowedScans (optional) : Iterable
+            More SCAN steps that don't count for this statement, e.g. "SCAN EXCLUDED_AUTHORS" for a statement that's meant to read the whole table
+
+        Returns
+        ----------
+        List
+            The details of the steps that read a whole table or index, e.g. "SCAN ALL_CONFLUENCE_AUTHORS USING COVERING INDEX ...".  Empty if the statement is served by an index.
+        """
+
+        queryPlan = ConnectionManager().getConnection().execute(
+            f"EXPLAIN QUERY PLAN {query}",
+            (None,) * query.count("?")
+        ).fetchall()
+
+        # The last column of each row is its detail, e.g. "SCAN ALL_CONFLUENCE_AUTHORS" or "SEARCH ALL_CONFLUENCE_AUTHORS USING INDEX ..."
+        return [
+            row[-1] for row in queryPlan
+            if row[-1].startswith("SCAN") and not any(
+                row[-1] == allowedScan or row[-1].startswith(allowedScan + " ")
+                for allowedScan in (*self.ALLOWED_SCANS, *allowedScans)
+            )
+        ]
+
+    def rebuildTable(
+        self,
+        tableName,
+        createTableStatement,
+        columnsToCopy,
+        createIndexStatements=[]
+    ):
+        """
+        Rebuilds a table with a new definition, and copies the existing rows into it in bulk
+
+        SQLite can't change a column's type or constraints in place.  So the new table is created under a temporary name, filled with one INSERT ... SELECT, and then swapped in for the old table.  The rows never pass through Python, so memory use doesn't grow with the size of the table.
+
+        Parameters
+        ----------
+        tableName : String
+            The name of the table to rebuild
+
+        createTableStatement : String
+            The CREATE TABLE statement for the new definition.  Must use "{tableName}" in place of the table's name.
+
+        columnsToCopy : Dict
+            Key-value pairs of a column in the new table, and the SQL expression (over the old table's columns) that fills it
+
+        createIndexStatements : List
+            CREATE INDEX statements to run once the new table has replaced the old one
+
+        Returns
+        ----------
+        Integer
+            The number of rows copied
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        newTableName = f"{tableName}_MIGRATING"
+
+        dbCursor.execute(f"DROP TABLE IF EXISTS {newTableName}")
+        dbCursor.execute(createTableStatement.replace("{tableName}", newTableName))
+
+        numRowsCopied = dbCursor.execute(f"""
+            INSERT INTO {newTableName} ({", ".join(columnsToCopy.keys())})
+            SELECT {", ".join(columnsToCopy.values())} FROM {tableName}
+        """).rowcount
+
+        dbCursor.execute(f"DROP TABLE {tableName}")
+        dbCursor.execute(f"ALTER TABLE {newTableName} RENAME TO {tableName}")
+
+        for createIndexStatement in createIndexStatements:
+            dbCursor.execute(createIndexStatement)
+
+        return numRowsCopied
+
+    def migrateImagesToOwnTable(self):
+        """
+        Migration step 1.  Moves the images stored in CONFLUENCE_PAGES_MISSING_ALT_TEXT.imageNamesLinks to the PAGE_IMAGES_MISSING_ALT_TEXT table
+
+        Older versions of this script stored each page's images as a string representation of a dict.  Each of these strings is parsed once, here, and the imageNamesLinks column is emptied afterwards.
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        dbCursor.execute("""CREATE TABLE IF NOT EXISTS PAGE_IMAGES_MISSING_ALT_TEXT (
+            pageID TEXT NOT NULL,
+            imageSrc TEXT NOT NULL,
+            imageName TEXT,
+            firstSeen TEXT NOT NULL,
+            lastSeen TEXT NOT NULL,
+            FOREIGN KEY (pageID) REFERENCES CONFLUENCE_PAGES_MISSING_ALT_TEXT (pageID)
+                ON DELETE CASCADE ON UPDATE CASCADE
+            PRIMARY KEY(pageID, imageSrc)
+        )""")
+
+        dbCursor.execute("""CREATE INDEX IF NOT EXISTS IX_PAGE_IMAGES_MISSING_ALT_TEXT_IMAGESRC ON PAGE_IMAGES_MISSING_ALT_TEXT(imageSrc)""")
+
+        todaysDate = datetime.today().strftime('%Y-%m-%d')
+
+        # A second cursor streams the old rows, so that they never all sit in memory at once
+        legacyRows = dbConnector.execute("""
+            SELECT pagesMissingAltText.pageID,
+                pagesMissingAltText.imageNamesLinks,
+                pagesToFix.dateLastChecked
+            FROM CONFLUENCE_PAGES_MISSING_ALT_TEXT AS pagesMissingAltText
+            LEFT JOIN LOG_CONFLUENCE_PAGES_TO_FIX AS pagesToFix
+                ON pagesToFix.pageID = pagesMissingAltText.pageID
+            WHERE pagesMissingAltText.imageNamesLinks != (?)
+        """, ("",))
+
+        dbCursor.executemany("""
+            INSERT OR IGNORE INTO PAGE_IMAGES_MISSING_ALT_TEXT (pageID, imageSrc, imageName, firstSeen, lastSeen)
+            VALUES (?, ?, ?, ?, ?)""",
+            (
+                (pageID, imageSrc, imageName, dateLastChecked or todaysDate, todaysDate)
+                for pageID, imageNamesLinks, dateLastChecked in legacyRows
+                for imageSrc, imageName in ast.literal_eval(imageNamesLinks).items()
+            )
+        )
+
+        dbCursor.execute("""
+            UPDATE CONFLUENCE_PAGES_MISSING_ALT_TEXT
+            SET imageNamesLinks = (?)
+        """, ("",))
+
+    def migrateToTypedSchema(self):
+        """
+        Migration step 2.  Rebuilds the page tables so that pageIDs and page versions are stored as integers, and flags are stored as 0/1 instead of "TRUE"/"FALSE"
+
+        ALL_CONFLUENCE_PAGES.pageID and CONFLUENCE_PAGES_MISSING_ALT_TEXT.pageID become INTEGER PRIMARY KEYs, which SQLite stores as the rowid itself, instead of in a separate index.  The now empty CONFLUENCE_PAGES_MISSING_ALT_TEXT.imageNamesLinks column is dropped.  The record handlers still accept and return pageIDs as strings and flags as "TRUE"/"FALSE", so their callers don't change.
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        self.rebuildTable(
+            tableName="ALL_CONFLUENCE_PAGES",
+            createTableStatement="""CREATE TABLE {tableName} (
+                pageID INTEGER NOT NULL PRIMARY KEY,
+                oldPageVersion INTEGER NOT NULL,
+                wasPageRecentlyUpdated INTEGER NOT NULL DEFAULT 0,
+                wasPageCheckedThisRun INTEGER NOT NULL DEFAULT 0
+            )""",
+            columnsToCopy={
+                "pageID": "CAST(pageID AS INTEGER)",
+                "oldPageVersion": "CAST(oldPageVersion AS INTEGER)",
+                "wasPageRecentlyUpdated": "wasPageRecentlyUpdated IN ('TRUE', 1)",
+                "wasPageCheckedThisRun": "wasPageCheckedThisRun IN ('TRUE', 1)"
+            }
+        )
+
+        self.rebuildTable(
+            tableName="CONFLUENCE_PAGES_MISSING_ALT_TEXT",
+            createTableStatement="""CREATE TABLE {tableName} (
+                pageID INTEGER NOT NULL PRIMARY KEY,
+                pageName TEXT NOT NULL,
+                FOREIGN KEY (pageID) REFERENCES ALL_CONFLUENCE_PAGES (pageID)
+                    ON DELETE CASCADE ON UPDATE CASCADE
+            )""",
+            columnsToCopy={
+                "pageID": "CAST(pageID AS INTEGER)",
+                "pageName": "pageName"
+            }
+        )
+
+        self.rebuildTable(
+            tableName="RECENT_CONFLUENCE_AUTHORS",
+            createTableStatement="""CREATE TABLE {tableName} (
+                pageID INTEGER NOT NULL,
+                username TEXT NOT NULL,
+                FOREIGN KEY (pageID) REFERENCES CONFLUENCE_PAGES_MISSING_ALT_TEXT (pageID)
+                    ON DELETE CASCADE ON UPDATE CASCADE
+                FOREIGN KEY (username) REFERENCES ALL_CONFLUENCE_AUTHORS (username)
+                    ON DELETE CASCADE ON UPDATE CASCADE
+                PRIMARY KEY(pageID, username)
+            )""",
+            columnsToCopy={
+                "pageID": "CAST(pageID AS INTEGER)",
+                "username": "username"
+            }
+        )
+
+        self.rebuildTable(
+            tableName="LOG_CONFLUENCE_PAGES_TO_FIX",
+            createTableStatement="""CREATE TABLE {tableName} (
+                pageID INTEGER NOT NULL PRIMARY KEY,
+                dateLastChecked TEXT NOT NULL,
+                numDaysMissingAltText INTEGER NOT NULL DEFAULT 0,
+                FOREIGN KEY (pageID) REFERENCES CONFLUENCE_PAGES_MISSING_ALT_TEXT (pageID)
+                    ON DELETE CASCADE ON UPDATE CASCADE
+            )""",
+            columnsToCopy={
+                "pageID": "CAST(pageID AS INTEGER)",
+                "dateLastChecked": "dateLastChecked",
+                "numDaysMissingAltText": "numDaysMissingAltText"
+            }
+        )
+
+        self.rebuildTable(
+            tableName="PAGE_IMAGES_MISSING_ALT_TEXT",
+            createTableStatement="""CREATE TABLE {tableName} (
+                pageID INTEGER NOT NULL,
+                imageSrc TEXT NOT NULL,
+                imageName TEXT,
+                firstSeen TEXT NOT NULL,
+                lastSeen TEXT NOT NULL,
+                FOREIGN KEY (pageID) REFERENCES CONFLUENCE_PAGES_MISSING_ALT_TEXT (pageID)
+                    ON DELETE CASCADE ON UPDATE CASCADE
+                PRIMARY KEY(pageID, imageSrc)
+            )""",
+            columnsToCopy={
+                "pageID": "CAST(pageID AS INTEGER)",
+                "imageSrc": "imageSrc",
+                "imageName": "imageName",
+                "firstSeen": "firstSeen",
+                "lastSeen": "lastSeen"
+            },
+            createIndexStatements=[
+                """CREATE INDEX IX_PAGE_IMAGES_MISSING_ALT_TEXT_IMAGESRC ON PAGE_IMAGES_MISSING_ALT_TEXT(imageSrc)"""
+            ]
+        )
+
+        self.rebuildTable(
+            tableName="LOG_CLI_MAJOR_TASKS",
+            createTableStatement="""CREATE TABLE {tableName} (
+                majorTaskCode TEXT NOT NULL PRIMARY KEY,
+                majorTaskDesc TEXT NOT NULL,
+                wasTaskCompletedThisRun INTEGER NOT NULL DEFAULT 0
+            )""",
+            columnsToCopy={
+                "majorTaskCode": "majorTaskCode",
+                "majorTaskDesc": "majorTaskDesc",
+                "wasTaskCompletedThisRun": "wasTaskCompletedThisRun IN ('TRUE', 1)"
+            }
+        )
+
+    def addHotPredicateIndexes(self):
+        """
+        Migration step 3.  Adds indexes for the predicates that the Retriever and Deleter filter on, and drops the unique indexes that duplicate primary keys
+
+        Only pages that were recently updated are kept in IX_ALL_CONFLUENCE_PAGES_RECENTLYUPDATED, so that index stays small however large the space gets.  IX_RECENT_CONFLUENCE_AUTHORS_USERNAME also serves the cascading deletes from ALL_CONFLUENCE_AUTHORS, and holds the pageID so that looking up an author's pages never touches the table.
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        dbCursor = ConnectionManager().getConnection().cursor()
+
+        # Primary keys already have their own index, so these only slowed down writes
+        dbCursor.execute("""DROP INDEX IF EXISTS UX_ALL_CONFLUENCE_PAGES_PAGEID""")
+        dbCursor.execute("""DROP INDEX IF EXISTS UX_CONFLUENCE_PAGES_MISSING_ALT_TEXT_PAGEID""")
+        dbCursor.execute("""DROP INDEX IF EXISTS UX_CONFLUENCE_AUTHORS_USERNAME""")
+
+        dbCursor.execute("""
+            CREATE INDEX IF NOT EXISTS IX_ALL_CONFLUENCE_PAGES_RECENTLYUPDATED ON ALL_CONFLUENCE_PAGES(pageID)
+            WHERE wasPageRecentlyUpdated = 1
+        """)
+
+        dbCursor.execute("""CREATE INDEX IF NOT EXISTS IX_LOG_CONFLUENCE_PAGES_TO_FIX_NUMDAYSMISSINGALTTEXT ON LOG_CONFLUENCE_PAGES_TO_FIX(numDaysMissingAltText)""")
+
+        dbCursor.execute("""CREATE INDEX IF NOT EXISTS IX_ALL_CONFLUENCE_AUTHORS_EMAIL ON ALL_CONFLUENCE_AUTHORS(email)""")
+
+        dbCursor.execute("""CREATE INDEX IF NOT EXISTS IX_ALL_CONFLUENCE_AUTHORS_FULLNAME ON ALL_CONFLUENCE_AUTHORS(fullname)""")
+
+        dbCursor.execute("""CREATE INDEX IF NOT EXISTS IX_RECENT_CONFLUENCE_AUTHORS_USERNAME ON RECENT_CONFLUENCE_AUTHORS(username, pageID)""")
+
+    def addExcludedAuthorsTable(self):
+        """
+        Migration step 4.  Adds the EXCLUDED_AUTHORS table, which persists the authors who should never be written to the db or have their email address looked up
+
+        An author can be excluded by username, email address, or full name.  When an author's email address turns out to be excluded, their username is saved in resolvedUsername, so that later runs can skip that author before looking up their email address.  The "Confluence Admin" account that Deleter.removeInactiveAuthorsFromDB removes is excluded from the start.
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        dbCursor = ConnectionManager().getConnection().cursor()
+
+        dbCursor.execute("""CREATE TABLE IF NOT EXISTS EXCLUDED_AUTHORS (
+            identifierType TEXT NOT NULL,
+            identifier TEXT NOT NULL,
+            resolvedUsername TEXT,
+            reason TEXT NOT NULL,
+            PRIMARY KEY(identifierType, identifier)
+        )""")
+
+        dbCursor.execute("""
+            INSERT OR IGNORE INTO EXCLUDED_AUTHORS (identifierType, identifier, reason)
+            VALUES (?, ?, ?)
+        """, ("fullname", "Confluence Admin", "service account"))
+
+    def addPageInventoryLogTable(self):
+        """
+        Migration step 5.  Adds the LOG_PAGE_INVENTORY table, which holds the high-water marks for incremental page inventories
+
+        There's one row per inventory mode ("full" or "incremental"), with the time the last successful inventory of that mode started.
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        dbCursor = ConnectionManager().getConnection().cursor()
+
+        dbCursor.execute("""CREATE TABLE IF NOT EXISTS LOG_PAGE_INVENTORY (
+            inventoryMode TEXT NOT NULL PRIMARY KEY,
+            dateLastCompleted TEXT NOT NULL
+        )""")
+
+    def addPageRevisionsCacheTable(self):
+        """
+        Migration step 6.  Adds the CACHED_PAGE_REVISIONS table, which caches each page's content history for the page version it was fetched at
+
+        A page's content history only changes when its version does, so the cached revisions are reused until ALL_CONFLUENCE_PAGES.oldPageVersion moves past pageVersion.
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        dbCursor = ConnectionManager().getConnection().cursor()
+
+        dbCursor.execute("""CREATE TABLE IF NOT EXISTS CACHED_PAGE_REVISIONS (
+            pageID INTEGER NOT NULL,
+            pageVersion INTEGER NOT NULL,
+            revisionIndex INTEGER NOT NULL,
+            revisionDate TEXT NOT NULL,
+            username TEXT NOT NULL,
+            fullname TEXT NOT NULL,
+            FOREIGN KEY (pageID) REFERENCES ALL_CONFLUENCE_PAGES (pageID)
+                ON DELETE CASCADE ON UPDATE CASCADE
+            PRIMARY KEY(pageID, pageVersion, revisionIndex)
+        )""")
+
+    def addSpaceKeys(self):
+        """
+        Migration step 7.  Records which Confluence space each page is in, and keeps the page inventory marks and progress checkpoints per space
+
+        Every page already in the db came from the "public" space, which was the only space scanned before this step.  LOG_PAGE_INVENTORY is rebuilt with the space key as part of its primary key.  LOG_SPACE_MAJOR_TASKS holds the per-space checkpoints of the major CLI tasks that run once per space, so that one space finishing doesn't mark the task done for the others.
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        dbCursor = ConnectionManager().getConnection().cursor()
+
+        dbCursor.execute("""ALTER TABLE ALL_CONFLUENCE_PAGES ADD COLUMN spaceKey TEXT NOT NULL DEFAULT 'public'""")
+
+        # Serves the per-space unflagging and sweeping of the page inventory, and the per-space page checks
+        dbCursor.execute("""
+            CREATE INDEX IF NOT EXISTS IX_ALL_CONFLUENCE_PAGES_SPACEKEY ON ALL_CONFLUENCE_PAGES(spaceKey, wasPageCheckedThisRun)
+            """)
+
+        self.rebuildTable(
+            tableName="LOG_PAGE_INVENTORY",
+            createTableStatement="""CREATE TABLE {tableName} (
+                spaceKey TEXT NOT NULL,
+                inventoryMode TEXT NOT NULL,
+                dateLastCompleted TEXT NOT NULL,
+                PRIMARY KEY(spaceKey, inventoryMode)
+            )""",
+            columnsToCopy={
+                "spaceKey": "'public'",
+                "inventoryMode": "inventoryMode",
+                "dateLastCompleted": "dateLastCompleted"
+            }
+        )
+
+        dbCursor.execute("""CREATE TABLE IF NOT EXISTS LOG_SPACE_MAJOR_TASKS (
+            spaceKey TEXT NOT NULL,
+            majorTaskCode TEXT NOT NULL,
+            wasTaskCompletedThisRun INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (majorTaskCode) REFERENCES LOG_CLI_MAJOR_TASKS (majorTaskCode)
+                ON DELETE CASCADE ON UPDATE CASCADE
+            PRIMARY KEY(spaceKey, majorTaskCode)
+        )""")
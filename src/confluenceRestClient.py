@@ -0,0 +1,468 @@
+import base64
+import http.client
+import json
+import threading
+from urllib.parse import urlencode, urlsplit
+from ACLIController import ACLIController
+
+class ConfluenceRestClient(ACLIController):
+    """Makes and returns calls to Confluence's REST API.  A drop-in alternative to ACLIController, which shells out to Bob Swift's ACLI app instead.
+
+    Each worker thread keeps one keep-alive connection to the Confluence server, so calls don't pay for a new process, TCP connection, or TLS handshake.  The credentials are sent in an Authorization header, instead of on the command line.
+
+        Link to REST API documentation -- https://docs.atlassian.com/ConfluenceServer/rest/latest/
+
+    Attributes
+    ----------
+    REST_PAGE_SIZE (class) : Integer
+        The number of results to ask for in each paginated call
+
+    VERSION_HISTORY_PATH (class) : String
+        The path to a page's paginated version history.  Must use "{pageID}" in place of the page's ID.
+
+    Methods
+    ----------
+    getConnection(serverAddr)
+        Returns the current thread's keep-alive connection to the Confluence server.  Opens that connection first, if necessary.
+
+    getResponse(username, password, serverAddr, path, queryParams, accept)
+        Makes a GET call to the Confluence server, and returns the status code, headers, and body of the response
+
+    getJSON(username, password, serverAddr, path, queryParams)
+        Makes a GET call to the REST API, and returns the status code and the decoded JSON body
+
+    probeAuthentication(username, password, serverAddr)
+        Makes the cheapest call to the server that only succeeds with the correct username and password
+
+    streamAllConfluencePageIDs(username, password, serverAddr, modifiedSince, spaceKey)
+        Yields the pageID and current version number of every page in a Confluence space (or only the ones modified since a given date), one page of results at a time
+
+    getRecentAuthors(username, password, serverAddr, pageID)
+        Receives a pageID and returns a list of the authors who've recently updated the page.
+
+    getRevisionsForBatch(username, password, serverAddr, pageIDs)
+        Receives a batch of pageIDs and returns the revisions of each page
+
+    getRevisionsForPage(username, password, serverAddr, pageID)
+        Receives a pageID and returns the date and author of each revision of the page
+    """
+
+    REST_PAGE_SIZE = 100
+
+    VERSION_HISTORY_PATH = "/rest/api/content/{pageID}/version"
+
+    def __init__(self):
+        """
+        Parameters
+        ----------
+        none
+        """
+
+        self._threadLocal = threading.local()
+
+    def __repr__(self):
+        return f'ConfluenceRestClient()'
+
+    def getConnection(self, serverAddr):
+        """
+        Returns the current thread's keep-alive connection to the Confluence server.  Opens that connection first, if necessary.
+
+        Parameters
+        ----------
+        serverAddr : String
+            The URL to the server
+
+        Returns
+        ----------
+        Class (of type 'http.client.HTTPConnection' or 'http.client.HTTPSConnection')
+            The current thread's connection to the server
+        """
+
+        connections = getattr(self._threadLocal, "connections", None)
+
+        if connections is None:
+            connections = self._threadLocal.connections = {}
+
+        if serverAddr not in connections:
+            splitServerAddr = urlsplit(serverAddr)
+
+            if splitServerAddr.scheme == "https":
+                connections[serverAddr] = http.client.HTTPSConnection(splitServerAddr.netloc, timeout=60)
+            else:
+                connections[serverAddr] = http.client.HTTPConnection(splitServerAddr.netloc, timeout=60)
+
+        return connections[serverAddr]
+
+    def getResponse(
+        self,
+        username,
+        password,
+        serverAddr,
+        path,
+        queryParams={},
+        accept="application/json"
+    ):
+        """
+        Makes a GET call to the Confluence server, and returns the status code, headers, and body of the response
+
+        If the server closed the keep-alive connection since the last call, the call is retried once on a new connection.
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        path : String
+            The path to the resource (e.g. "/rest/api/content/search").  May already have a query string.
+
+        queryParams (optional) : Dict
+            Key-value pairs of the query string's parameters
+
+        accept (optional) : String
+            The media type to ask for
+
+        Returns
+        ----------
+        Tuple
+            A three item tuple of the HTTP status code, the response headers (of type 'http.client.HTTPMessage'), and the body as bytes
+        """
+
+        basePath = urlsplit(serverAddr).path.rstrip("/")
+        credentials = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
+
+        url = basePath + path
+
+        if queryParams:
+            url += ("&" if "?" in path else "?") + urlencode(queryParams)
+
+        headers = {
+            "Authorization": f"Basic {credentials}",
+            "Accept": accept
+        }
+
+        for attempt in range(2):
+            connection = self.getConnection(serverAddr)
+
+            try:
+                connection.request("GET", url, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest, ConnectionError):
+                connection.close()
+
+                if attempt == 1:
+                    raise
+
+        return (response.status, response.headers, body)
+
+    def getJSON(
+        self,
+        username,
+        password,
+        serverAddr,
+        path,
+        queryParams={}
+    ):
+        """
+        Makes a GET call to the REST API, and returns the status code and the decoded JSON body
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        path : String
+            The path to the REST resource (e.g. "/rest/api/content/search")
+
+        queryParams (optional) : Dict
+            Key-value pairs of the query string's parameters
+
+        Returns
+        ----------
+        Tuple
+            A two item tuple of the HTTP status code, and the decoded JSON body (None if the body of an error response isn't JSON).  Raises a RuntimeError if the body of a successful response isn't JSON (e.g. a login page, or a proxy's error page).
+        """
+
+        status, _, body = self.getResponse(
+            username=username,
+            password=password,
+            serverAddr=serverAddr,
+            path=path,
+            queryParams=queryParams
+        )
+
+        try:
+            return (status, json.loads(body))
+        except ValueError:
+            # Callers only check the status, and would index into a None body
+            if status == 200:
+                raise RuntimeError(f"The response from {path} wasn't JSON, though its HTTP status was 200")
+
+            return (status, None)
+
+    def probeAuthentication(
+        self,
+        username,
+        password,
+        serverAddr
+    ):
+        """
+        Makes the cheapest call to the server that only succeeds with the correct username and password
+
+        Looks up the current user, which is one small JSON object no matter how big the server is.  Confluence answers anonymous calls to this resource too, so the user it returns must be a known one.  A login page instead of JSON also means the credentials weren't accepted.
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        Returns
+        ----------
+        Boolean
+            True if the server accepted the user's credentials, False otherwise
+        """
+
+        try:
+            status, currentUser = self.getJSON(
+                username=username,
+                password=password,
+                serverAddr=serverAddr,
+                path="/rest/api/user/current"
+            )
+        except (OSError, RuntimeError):
+            return False
+
+        return status == 200 and currentUser is not None and currentUser.get("type") != "anonymous"
+
+    def streamAllConfluencePageIDs(
+        self,
+        username,
+        password,
+        serverAddr,
+        modifiedSince=None,
+        spaceKey="public"
+    ):
+        """
+        Yields the pageID and current version number of every page in a Confluence space (or only the ones modified since a given date), one page of results at a time
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        modifiedSince (optional) : String
+            A date in the format yyyy-mm-dd.  If given, only pages modified on or after this date are listed.
+
+        spaceKey (optional) : String
+            The key of the Confluence space to list the pages of
+
+        Returns
+        ----------
+        Generator
+            Yields two-item tuples of
+
+            - the ID number for a Confluence page,
+            - the number of the current version of the page,
+
+            Raises a RuntimeError if any page of results can't be read, so an incomplete listing is never mistaken for a complete one.
+        """
+
+        cql = f"space={spaceKey} and type=page"
+
+        if modifiedSince is not None:
+            cql += f" and lastmodified >= \"{modifiedSince}\""
+
+        start = 0
+
+        while True:
+            status, results = self.getJSON(
+                username=username,
+                password=password,
+                serverAddr=serverAddr,
+                path="/rest/api/content/search",
+                queryParams={
+                    "cql": cql,
+                    "expand": "version",
+                    "start": start,
+                    "limit": self.REST_PAGE_SIZE
+                }
+            )
+
+            # A partial listing would look like a complete one, and a full page inventory removes every page that isn't listed
+            if status != 200:
+                raise RuntimeError(f"Listing the pages in Confluence space {spaceKey} failed with HTTP status {status}")
+
+            for page in results["results"]:
+                yield (
+                    str(page["id"]), # <-- PageID number
+                    str(page["version"]["number"]), # <-- Number of current version of Confluence page
+                )
+
+            if "next" not in results.get("_links", {}):
+                return
+
+            start += len(results["results"])
+
+    def getRecentAuthors(self,
+        username,
+        password,
+        serverAddr,
+        pageID
+    ):
+        """
+        Receives a pageID and returns a list of the authors who've recently updated the page.
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        pageID : String
+            The unique ID of a Confluence page
+
+        Returns
+        ----------
+        List
+            A list of tuples.  Each tuple will contain the authors username and full name.  This list will contain no duplicates.
+        """
+
+        return self.getRecentAuthorsFromRevisions(self.getRevisionsForPage(
+            username=username,
+            password=password,
+            serverAddr=serverAddr,
+            pageID=pageID
+        ))
+
+    def getRevisionsForBatch(
+        self,
+        username,
+        password,
+        serverAddr,
+        pageIDs
+    ):
+        """
+        Receives a batch of pageIDs and returns the revisions of each page
+
+        ACLIController.getRevisionsForPages runs each batch on its own worker thread, so each batch reuses that thread's keep-alive connection.
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        pageIDs : List
+            The unique IDs of Confluence pages
+
+        Returns
+        ----------
+        List
+            Two-item tuples of a pageID, and the list that getRevisionsForPage returns for that page
+        """
+
+        return [
+            (pageID, self.getRevisionsForPage(
+                username=username,
+                password=password,
+                serverAddr=serverAddr,
+                pageID=pageID
+            ))
+            for pageID in pageIDs
+        ]
+
+    def getRevisionsForPage(
+        self,
+        username,
+        password,
+        serverAddr,
+        pageID
+    ):
+        """
+        Receives a pageID and returns the date and author of each revision of the page
+
+        Parameters
+        ----------
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        serverAddr : String
+            The URL to the server
+
+        pageID : String
+            The unique ID of a Confluence page
+
+        Returns
+        ----------
+        List
+            Three-item tuples of the date of the revision (yyyy-mm-dd), and the username and full name of the author who published it, newest first.  Raises a RuntimeError if any page of the history can't be read.
+        """
+
+        allRevisions = []
+        start = 0
+
+        while True:
+            status, results = self.getJSON(
+                username=username,
+                password=password,
+                serverAddr=serverAddr,
+                path=self.VERSION_HISTORY_PATH.replace("{pageID}", str(pageID)),
+                queryParams={
+                    "start": start,
+                    "limit": self.REST_PAGE_SIZE
+                }
+            )
+
+            # A partial history would be cached for the page's version, and served on every later run
+            if status != 200:
+                raise RuntimeError(f"Reading the content history of page {pageID} failed with HTTP status {status}")
+
+            for version in results["results"]:
+                allRevisions.append((
+                    version["when"][0:10], # <-- Date of page revision
+                    version["by"]["username"], # <-- Username of the author who published the revision
+                    version["by"]["displayName"] # <-- Name of the author who published the revision
+                ))
+
+            if "next" not in results.get("_links", {}):
+                return allRevisions
+
+            start += len(results["results"])
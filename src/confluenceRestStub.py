@@ -0,0 +1,413 @@
+import base64
+import json
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+class ConfluenceRestStub:
+    """A local, in-memory stand-in for the parts of Confluence's REST API that ConfluenceRestClient calls.  Used for testing ConfluenceRestClient, and for benchmarking it against ACLI (see benchmarks/restClientBenchmark.py).
+
+    The stub serves numPages synthetic pages (with pageIDs 1 through numPages), spread evenly over the spaces in spaceKeys, and each page has numVersions versions, published one month apart by a rotating set of authors.
+
+    Attributes
+    ----------
+    numPages : Integer
+        The number of pages that the stub serves
+
+    numVersions : Integer
+        The number of versions of each page
+
+    spaceKeys : List
+        The keys of the Confluence spaces that the pages are spread over
+
+    numImages : Integer
+        The number of embedded images on each page.  Every third image is missing alternate text.
+
+    username : String
+        The only username that the stub accepts
+
+    password : String
+        The only password that the stub accepts
+
+    requestCount : Integer
+        The number of requests that the stub has served since it was started
+
+    unindexedPageIDs : Set
+        The pageIDs that CQL searches leave out, like pages that Confluence's search index hasn't caught up with yet.  They're still served by ID.
+
+    Methods
+    ----------
+    start()
+        Starts serving on a free local port, on a background thread, and returns the stub's server address
+
+    stop()
+        Stops serving
+
+    getVersions(pageID)
+        Returns every version of a page, newest first, as the REST API lists them
+
+    getPageHTML(pageID)
+        Returns a page's HTML, as Confluence renders it
+
+    getPageStorage(pageID)
+        Returns a page's body in Confluence's storage format
+
+    getPage(pageID)
+        Returns a page, with its space and storage body, as the REST API returns it
+    """
+
+    def __init__(self, numPages=1000, numVersions=5, username="stub", password="stub", spaceKeys=["public"], numImages=10):
+        """
+        Parameters
+        ----------
+        numPages (optional) : Integer
+            The number of pages that the stub serves
+
+        numVersions (optional) : Integer
+            The number of versions of each page
+
+        username (optional) : String
+            The only username that the stub accepts
+
+        password (optional) : String
+            The only password that the stub accepts
+
+        spaceKeys (optional) : List
+            The keys of the Confluence spaces that the pages are spread over.  Page n is in spaceKeys[n % len(spaceKeys)].
+
+        numImages (optional) : Integer
+            The number of embedded images on each page
+        """
+
+        self.numPages = numPages
+        self.numVersions = numVersions
+        self.username = username
+        self.password = password
+        self.spaceKeys = spaceKeys
+        self.numImages = numImages
+        self.requestCount = 0
+        self.unindexedPageIDs = set()
+        self._server = None
+        self._requestCountLock = threading.Lock()
+
+    def __repr__(self):
+        return f'ConfluenceRestStub(numPages={self.numPages}, numVersions={self.numVersions})'
+
+    def start(self):
+        """
+        Starts serving on a free local port, on a background thread, and returns the stub's server address
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        String
+            The URL to the stub server (e.g. "http://127.0.0.1:54321")
+        """
+
+        self.requestCount = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), ConfluenceRestStubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def stop(self):
+        """
+        Stops serving
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def getVersions(self, pageID):
+        """
+        Returns every version of a page, newest first, as the REST API lists them
+
+        Parameters
+        ----------
+        pageID : Integer
+            The unique ID of a Confluence page
+
+        Returns
+        ----------
+        List
+            Dicts of each version's number, publish date/time, and author
+        """
+
+        today = datetime.now()
+        allVersions = []
+
+        for versionNum in range(self.numVersions, 0, -1):
+            authorNum = (pageID + versionNum) % 50
+
+            allVersions.append({
+                "number": versionNum,
+                "when": (today - timedelta(days=30 * (self.numVersions - versionNum))).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "by": {
+                    "username": f"author{authorNum}",
+                    "displayName": f"Author {authorNum}"
+                }
+            })
+
+        return allVersions
+
+    def getPageHTML(self, pageID):
+        """
+        Returns a page's HTML, as Confluence renders it
+
+        Parameters
+        ----------
+        pageID : Integer
+            The unique ID of a Confluence page
+
+        Returns
+        ----------
+        String
+            The page's HTML, with its title in an ajs-page-title meta tag, and numImages embedded images
+        """
+
+        allImages = []
+
+        for imageNum in range(self.numImages):
+            altText = "" if imageNum % 3 == 0 else f' alt="Screenshot {imageNum}"'
+
+            allImages.append(
+                f'<p><span class="confluence-embedded-file-wrapper"><img class="confluence-embedded-image"{altText} '
+                f'src="/download/attachments/{pageID}/image{imageNum}.png?version=1&amp;api=v2" '
+                f'data-linked-resource-default-alias="image{imageNum}.png"></span></p>'
+            )
+
+        return (
+            f'<!DOCTYPE html><html><head><title>Page {pageID} - Confluence</title>'
+            f'<meta name="ajs-page-id" content="{pageID}"><meta name="ajs-page-title" content="Page {pageID}">'
+            f'</head><body><div id="main-content" class="wiki-content">{"".join(allImages)}</div></body></html>'
+        )
+
+    def getPageStorage(self, pageID):
+        """
+        Returns a page's body in Confluence's storage format
+
+        Parameters
+        ----------
+        pageID : Integer
+            The unique ID of a Confluence page
+
+        Returns
+        ----------
+        String
+            The page's storage XHTML, with the same numImages images as getPageHTML, each attached to the page
+        """
+
+        allImages = []
+
+        for imageNum in range(self.numImages):
+            altText = "" if imageNum % 3 == 0 else f' ac:alt="Screenshot {imageNum}"'
+
+            allImages.append(
+                f'<p>Screenshot&nbsp;{imageNum}:</p>'
+                f'<p><ac:image ac:height="250"{altText}><ri:attachment ri:filename="image{imageNum}.png" /></ac:image></p>'
+            )
+
+        return "".join(allImages)
+
+    def getPage(self, pageID):
+        """
+        Returns a page, with its space and storage body, as the REST API returns it
+
+        Parameters
+        ----------
+        pageID : Integer
+            The unique ID of a Confluence page
+
+        Returns
+        ----------
+        Dict
+            The page's ID, title, space, and storage body
+        """
+
+        return {
+            "id": str(pageID),
+            "type": "page",
+            "title": f"Page {pageID}",
+            "space": {"key": self.spaceKeys[pageID % len(self.spaceKeys)]},
+            "body": {"storage": {"value": self.getPageStorage(pageID), "representation": "storage"}}
+        }
+
+class ConfluenceRestStubHandler(BaseHTTPRequestHandler):
+    """Handles each request to a ConfluenceRestStub.  Speaks HTTP/1.1, so that the client's keep-alive connections are kept open between requests.
+
+    Methods
+    ----------
+    do_GET()
+        Answers a GET request to /rest/api/user/current, /rest/api/space, /rest/api/content/search, /rest/api/content/{pageID}, /rest/api/content/{pageID}/version, or /pages/viewpage.action
+
+    sendJSON(status, body)
+        Sends a JSON response
+
+    sendHTML(status, body)
+        Sends an HTML response
+
+    getPaginated(allResults, queryParams)
+        Returns one page of a paginated REST API result
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        """
+        Answers a GET request to /rest/api/user/current, /rest/api/space, /rest/api/content/search, /rest/api/content/{pageID}, /rest/api/content/{pageID}/version, or /pages/viewpage.action
+
+        Parameters
+        ----------
+        none
+
+        Returns
+        ----------
+        none
+        """
+
+        stub = self.server.stub
+
+        with stub._requestCountLock:
+            stub.requestCount += 1
+
+        credentials = base64.b64encode(f"{stub.username}:{stub.password}".encode("utf-8")).decode("ascii")
+
+        if self.headers.get("Authorization") != f"Basic {credentials}":
+            self.sendJSON(401, {"statusCode": 401, "message": "Unauthorized"})
+            return
+
+        splitPath = urlsplit(self.path)
+        queryParams = parse_qs(splitPath.query)
+        pathParts = splitPath.path.strip("/").split("/")
+
+        if splitPath.path == "/rest/api/user/current":
+            self.sendJSON(200, {"type": "known", "username": stub.username, "displayName": stub.username})
+        elif splitPath.path == "/rest/api/space":
+            self.sendJSON(200, self.getPaginated([{"key": "public", "name": "Public"}], queryParams))
+        elif splitPath.path == "/rest/api/content/search" and queryParams.get("cql", [""])[0].startswith("id in ("):
+            # A batch of pages by ID, e.g. "id in (1,2,3)", with their storage bodies
+            cqlPageIDs = queryParams["cql"][0][len("id in ("):].rstrip(")").split(",")
+            allPages = [
+                stub.getPage(pageID)
+                for pageID in (int(cqlPageID) for cqlPageID in cqlPageIDs if cqlPageID.strip().isdigit())
+                if 1 <= pageID <= stub.numPages and pageID not in stub.unindexedPageIDs
+            ]
+            self.sendJSON(200, self.getPaginated(allPages, queryParams))
+        elif splitPath.path == "/rest/api/content/search":
+            # Only the space in the CQL is honored, e.g. "space=public and type=page"
+            cqlSpaceKey = queryParams.get("cql", ["space=public"])[0].split(" ")[0].split("=")[-1]
+            allPages = [
+                {"id": str(pageID), "type": "page", "version": {"number": stub.numVersions}}
+                for pageID in range(1, stub.numPages + 1)
+                if stub.spaceKeys[pageID % len(stub.spaceKeys)] == cqlSpaceKey and pageID not in stub.unindexedPageIDs
+            ]
+            self.sendJSON(200, self.getPaginated(allPages, queryParams))
+        elif splitPath.path == "/pages/viewpage.action" and queryParams.get("pageId", [""])[0].isdigit() and 1 <= int(queryParams["pageId"][0]) <= stub.numPages:
+            self.sendHTML(200, stub.getPageHTML(int(queryParams["pageId"][0])))
+        elif (len(pathParts) == 4 and pathParts[:3] == ["rest", "api", "content"]
+              and pathParts[3].isdigit() and 1 <= int(pathParts[3]) <= stub.numPages):
+            self.sendJSON(200, stub.getPage(int(pathParts[3])))
+        elif (len(pathParts) == 5 and pathParts[:3] == ["rest", "api", "content"] and pathParts[4] == "version"
+              and pathParts[3].isdigit() and 1 <= int(pathParts[3]) <= stub.numPages):
+            self.sendJSON(200, self.getPaginated(stub.getVersions(int(pathParts[3])), queryParams))
+        else:
+            self.sendJSON(404, {"statusCode": 404, "message": "Not found"})
+
+    def sendJSON(self, status, body):
+        """
+        Sends a JSON response
+
+        Parameters
+        ----------
+        status : Integer
+            The HTTP status code
+
+        body : Dict
+            The body of the response, before it's encoded as JSON
+
+        Returns
+        ----------
+        none
+        """
+
+        encodedBody = json.dumps(body).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encodedBody)))
+        self.end_headers()
+        self.wfile.write(encodedBody)
+
+    def sendHTML(self, status, body):
+        """
+        Sends an HTML response
+
+        Parameters
+        ----------
+        status : Integer
+            The HTTP status code
+
+        body : String
+            The HTML of the page
+
+        Returns
+        ----------
+        none
+        """
+
+        encodedBody = body.encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        self.send_header("Content-Length", str(len(encodedBody)))
+        self.end_headers()
+        self.wfile.write(encodedBody)
+
+    def getPaginated(self, allResults, queryParams):
+        """
+        Returns one page of a paginated REST API result
+
+        Parameters
+        ----------
+        allResults : List
+            Every result, before pagination
+
+        queryParams : Dict
+            The request's query string, as parse_qs returns it
+
+        Returns
+        ----------
+        Dict
+            The results from "start" up to "limit" results, and a "next" link if there are more
+        """
+
+        start = int(queryParams.get("start", ["0"])[0])
+        limit = int(queryParams.get("limit", ["25"])[0])
+        results = allResults[start:start + limit]
+        links = {}
+
+        if start + limit < len(allResults):
+            links["next"] = f"{urlsplit(self.path).path}?start={start + limit}&limit={limit}"
+
+        return {"results": results, "start": start, "limit": limit, "size": len(results), "_links": links}
+
+    def log_message(self, format, *args):
+        pass
@@ -0,0 +1,179 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from dbRecordHandler.sqlHelper import SQLHelper
+
+
+class ConnectionManager:
+    """Shares one long-lived connection to the webscraper.db per thread, across the Creator, Retriever, Updater, and Deleter classes.
+
+    The connection is opened the first time a thread asks for it, and the SQLHelper PRAGMAs are run once on that connection (instead of on every call to the db).  The write-ahead log is checkpointed every CHECKPOINT_INTERVAL commits, and truncated when the connection is closed.
+
+    Attributes
+    ----------
+    CHECKPOINT_INTERVAL (class) : Integer
+        The number of commits between passive checkpoints of the write-ahead log
+
+    Methods
+    ----------
+    getDBPath()
+        Returns the path to the webscraper.db
+
+    getConnection()
+        Returns the connection to the webscraper.db for the current thread.  Opens that connection first, if necessary.
+
+    commit()
+        Commits the current thread's connection, and checkpoints the write-ahead log if CHECKPOINT_INTERVAL commits have passed since the last checkpoint.  Does nothing while a unit of work is open.
+
+    unitOfWork()
+        Context manager that groups every write made inside it into one transaction.
+
+    closeConnection()
+        Checkpoints and truncates the write-ahead log, and then closes the current thread's connection.
+    """
+
+    CHECKPOINT_INTERVAL = 500
+
+    _threadLocal = threading.local()
+
+    def __init__(self):
+        """
+        Parameters
+        ----------
+        None
+        """
+
+    def __repr__(self):
+        return f'ConnectionManager()'
+
+    def getDBPath(self):
+        """
+        Returns the path to the webscraper.db
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        String
+            The path to the webscraper.db
+        """
+
+        return str(Path.cwd())+"/src/sensitive/webscraper.db"
+
+    def getConnection(self):
+        """
+        Returns the connection to the webscraper.db for the current thread.  Opens that connection first, if necessary.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        Class (of type 'sqlite3.Connection')
+            The current thread's connection to the webscraper.db
+        """
+
+        dbConnector = getattr(self._threadLocal, "dbConnector", None)
+
+        if dbConnector is None:
+            dbConnector = sqlite3.connect(self.getDBPath())
+            dbConnector.executescript(SQLHelper().SQL_QUERIES)
+
+            self._threadLocal.dbConnector = dbConnector
+            self._threadLocal.numCommitsSinceCheckpoint = 0
+            self._threadLocal.unitOfWorkDepth = 0
+
+        return dbConnector
+
+    def commit(self):
+        """
+        Commits the current thread's connection, and checkpoints the write-ahead log if CHECKPOINT_INTERVAL commits have passed since the last checkpoint.  Does nothing while a unit of work is open, so that the record handlers' writes get committed together when the unit of work ends.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        None
+        """
+
+        dbConnector = self.getConnection()
+
+        if self._threadLocal.unitOfWorkDepth > 0:
+            return
+
+        dbConnector.commit()
+
+        self._threadLocal.numCommitsSinceCheckpoint += 1
+
+        if self._threadLocal.numCommitsSinceCheckpoint >= self.CHECKPOINT_INTERVAL:
+            dbConnector.execute(SQLHelper().SQL_PASSIVE_CHECKPOINT)
+            self._threadLocal.numCommitsSinceCheckpoint = 0
+
+    @contextmanager
+    def unitOfWork(self):
+        """
+        Context manager that groups every write made inside it into one transaction.
+
+        The transaction is committed when the `with` block ends, and rolled back if the block raises (including KeyboardInterrupt).  If the script crashes in the middle of a phase, none of that phase's writes are kept, so the phase can safely run again from the start.  Units of work can be nested; only the outermost one commits.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        Class (of type 'sqlite3.Connection')
+            The current thread's connection to the webscraper.db
+        """
+
+        dbConnector = self.getConnection()
+
+        if self._threadLocal.unitOfWorkDepth == 0 and not dbConnector.in_transaction:
+            dbConnector.execute("BEGIN IMMEDIATE")
+
+        self._threadLocal.unitOfWorkDepth += 1
+
+        try:
+            yield dbConnector
+        except BaseException:
+            self._threadLocal.unitOfWorkDepth -= 1
+
+            if self._threadLocal.unitOfWorkDepth == 0:
+                dbConnector.rollback()
+
+            raise
+
+        self._threadLocal.unitOfWorkDepth -= 1
+
+        if self._threadLocal.unitOfWorkDepth == 0:
+            self.commit()
+
+    def closeConnection(self):
+        """
+        Checkpoints and truncates the write-ahead log, and then closes the current thread's connection.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        None
+        """
+
+        dbConnector = getattr(self._threadLocal, "dbConnector", None)
+
+        if dbConnector is None:
+            return
+
+        dbConnector.commit()
+        dbConnector.execute(SQLHelper().SQL_TRUNCATE_CHECKPOINT)
+        dbConnector.close()
+
+        self._threadLocal.dbConnector = None
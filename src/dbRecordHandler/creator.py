@@ -1,9 +1,5 @@
-import sqlite3
-from time import sleep
-import os
-from pathlib import Path
 from datetime import datetime
-from dbRecordHandler.sqlHelper import SQLHelper
+from dbRecordHandler.connectionManager import ConnectionManager
 
 class Creator:
     """Creates new records in the webscraper.db.
@@ -22,6 +18,9 @@ class Creator:
 
         If the page is already in these two tables, then this method will update the existing records.  This method is one of the few creator methods that can update a record too.
 
+    addImagesMissingAltText(pageID, imagesNamesLinks)
+        Receives a pageID and all of the images on that page that are missing alternate text, and writes those images to the PAGE_IMAGES_MISSING_ALT_TEXT table in bulk.
+
     addAuthorToDB(pageID, username, fullname)
         Receives an author's name, username, and the pageID of the page the author recently updated, and adds those values to the db.
 
@@ -30,6 +29,12 @@ class Creator:
 
     methodName(username, email, fullname)
         Receives info about a Confluence Coordinator and adds that coordinator to the db.
+
+    addExcludedAuthor(identifierType, identifier, reason)
+        Receives a username, email address, or full name, and adds it to EXCLUDED_AUTHORS, so that the author is never written to the db or has their email address looked up again.
+
+    addCachedRevisions(pageID, revisions)
+        Receives a pageID and all of the page's revisions, and caches them in CACHED_PAGE_REVISIONS for the page's current version, replacing any revisions cached for an older version.
     """
 
     def __init__(self):
@@ -64,11 +69,9 @@ class Creator:
         None
         """
         
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
             INSERT INTO ALL_CONFLUENCE_PAGES (pageID, oldPageVersion)
             VALUES (?, ?)
@@ -76,10 +79,7 @@ class Creator:
             (pageID, versionNum)
         )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def addConfluencePageMissingAltText(
         self,
@@ -100,19 +100,17 @@ class Creator:
         pageName : String
             Title of the Confluence page
 
-        imageNamesLinks : String
-            A string representation of key-value pairs; each pair is an image link and its respective image name
+        imageNamesLinks : Dict
+            Key-value pairs; each pair is an image link and its respective image name.  These images are stored in the PAGE_IMAGES_MISSING_ALT_TEXT table.
     
         Returns
         ----------
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         todaysDate = datetime.today().strftime('%Y-%m-%d')
 
         if dbCursor.execute("""
@@ -121,10 +119,10 @@ class Creator:
         (pageID,)).fetchone() is None:
         
             dbCursor.execute("""
-                INSERT INTO CONFLUENCE_PAGES_MISSING_ALT_TEXT (pageID, pageName, imageNamesLinks)
-                VALUES (?, ?, ?)
+                INSERT INTO CONFLUENCE_PAGES_MISSING_ALT_TEXT (pageID, pageName)
+                VALUES (?, ?)
                 """,
-                (pageID, pageName, str(imageNamesLinks))
+                (pageID, pageName)
             )
 
             dbCursor.execute("""
@@ -157,17 +155,74 @@ class Creator:
             
             dbCursor.execute("""
                 UPDATE CONFLUENCE_PAGES_MISSING_ALT_TEXT 
-                SET pageName = (?), 
-                    imageNamesLinks = (?)
+                SET pageName = (?)
                 WHERE pageID = (?)
                 """,
-                (pageName, str(imageNamesLinks), pageID)
+                (pageName, pageID)
             )
-        
-        dbConnector.commit()
-        dbConnector.close()
 
-        sleep(1)
+        # Commits the page's record together with its images
+        self.addImagesMissingAltText(
+            pageID=pageID,
+            imagesNamesLinks=imageNamesLinks
+        )
+
+    def addImagesMissingAltText(
+        self,
+        pageID,
+        imagesNamesLinks
+    ):
+        """
+        Receives a pageID and all of the images on that page that are missing alternate text, and writes those images to the PAGE_IMAGES_MISSING_ALT_TEXT table in bulk.
+
+        Images that are already in the table get their lastSeen date updated.  Images of this page that are no longer missing alternate text are removed from the table.
+
+        Parameters
+        ----------
+        pageID : String
+            Unique ID of the Confluence page
+
+        imagesNamesLinks : Dict
+            Key-value pairs; each pair is an image link and its respective image name
+
+        Returns
+        ----------
+        None
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        todaysDate = datetime.today().strftime('%Y-%m-%d')
+
+        storedImageSrcs = [
+            result[0] for result in dbCursor.execute("""
+                SELECT imageSrc FROM PAGE_IMAGES_MISSING_ALT_TEXT
+                WHERE pageID = (?)""",
+                (pageID,)
+            ).fetchall()
+        ]
+
+        dbCursor.executemany("""
+            DELETE FROM PAGE_IMAGES_MISSING_ALT_TEXT
+            WHERE pageID = (?) AND imageSrc = (?)""",
+            [(pageID, imageSrc) for imageSrc in storedImageSrcs if imageSrc not in imagesNamesLinks]
+        )
+
+        dbCursor.executemany("""
+            INSERT INTO PAGE_IMAGES_MISSING_ALT_TEXT (pageID, imageSrc, imageName, firstSeen, lastSeen)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (pageID, imageSrc) DO UPDATE
+                SET imageName = excluded.imageName,
+                    lastSeen = excluded.lastSeen
+            """,
+            [
+                (pageID, imageSrc, imageName, todaysDate, todaysDate) 
+                for imageSrc, imageName in imagesNamesLinks.items()
+            ]
+        )
+
+        ConnectionManager().commit()
 
     def addAuthorToDB(
         self,
@@ -194,11 +249,9 @@ class Creator:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         if dbCursor.execute("""
             SELECT * FROM ALL_CONFLUENCE_AUTHORS
             WHERE username = (?)""", 
@@ -224,10 +277,7 @@ class Creator:
                 (username, pageID)
             )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def assignPageIDtoConfluenceCoordinators(self, pageID, ConfluenceCoordinators):
         """
@@ -246,11 +296,9 @@ class Creator:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         for coord_t in ConfluenceCoordinators:
             username = coord_t[0]
         
@@ -268,10 +316,7 @@ class Creator:
                     (username, pageID)
                 )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def addConfluenceCoordinatorToDB(self, username, email, fullname):
         """
@@ -293,10 +338,8 @@ class Creator:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
-
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
         
         if dbCursor.execute("""
             SELECT * FROM ALL_CONFLUENCE_AUTHORS
@@ -311,7 +354,77 @@ class Creator:
                 (username, email, fullname)
             )
         
-        dbConnector.commit()
-        dbConnector.close()
+        ConnectionManager().commit()
+
+    def addExcludedAuthor(self, identifierType, identifier, reason):
+        """
+        Receives a username, email address, or full name, and adds it to EXCLUDED_AUTHORS, so that the author is never written to the db or has their email address looked up again.
+
+        Parameters
+        ----------
+        identifierType : String
+            Either "username", "email", or "fullname"
+
+        identifier : String
+            The author's username, email address, or full name
+
+        reason : String
+            Why the author is excluded (e.g. "address not found")
+
+        Returns
+        ----------
+        None
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        dbCursor.execute("""
+            INSERT OR IGNORE INTO EXCLUDED_AUTHORS (identifierType, identifier, reason)
+            VALUES (?, ?, ?)
+            """,
+            (identifierType, identifier, reason)
+        )
+
+        ConnectionManager().commit()
+
+    def addCachedRevisions(self, pageID, revisions):
+        """
+        Receives a pageID and all of the page's revisions, and caches them in CACHED_PAGE_REVISIONS for the page's current version, replacing any revisions cached for an older version.
+
+        Parameters
+        ----------
+        pageID : String
+            The unique ID for a Confluence page
+
+        revisions : List
+            Three-item tuples of the date of a revision, and the username and full name of its author, newest first, as returned by ACLIController.getRevisionsFromHistory
+
+        Returns
+        ----------
+        None
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        dbCursor.execute("""
+            DELETE FROM CACHED_PAGE_REVISIONS
+            WHERE pageID = (?)
+            """,
+            (pageID,)
+        )
+
+        # The current version comes from ALL_CONFLUENCE_PAGES, so a page that's no longer in the db isn't cached
+        dbCursor.executemany("""
+            INSERT INTO CACHED_PAGE_REVISIONS (pageID, pageVersion, revisionIndex, revisionDate, username, fullname)
+            SELECT pageID, oldPageVersion, ?, ?, ?, ? FROM ALL_CONFLUENCE_PAGES
+            WHERE pageID = (?)
+            """,
+            [
+                (revisionIndex, revisionDate, username, fullname, pageID)
+                for revisionIndex, (revisionDate, username, fullname) in enumerate(revisions)
+            ]
+        )
 
-        sleep(1)
\ No newline at end of file
+        ConnectionManager().commit()
@@ -1,7 +1,5 @@
-import sqlite3
 from datetime import datetime
-from pathlib import Path
-from time import sleep
+from dbRecordHandler.connectionManager import ConnectionManager
 from dbRecordHandler.sqlHelper import SQLHelper
 
 
@@ -23,6 +21,9 @@ class Deleter:
     removeAuthorFromDB(username, email)
         Removes author from webscraper.db
 
+    removeAuthorsFromDB(usernames, emails)
+        Removes every author with one of the given usernames or email addresses from webscraper.db, in one transaction
+
     unassignPageIDFromConfluenceCoordinators(pageID, username)
         Receives a pageID and the username of a Confluence Coordinator, and unassigns that Coordinator from from that Confluence page
 
@@ -54,21 +55,16 @@ class Deleter:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
             DELETE FROM CONFLUENCE_PAGES_MISSING_ALT_TEXT
             WHERE pageID = (?)""",
             (pageID,)
         )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def removePageIDfromAllConfluencePagesTable(self, pageID):
         """
@@ -84,21 +80,16 @@ class Deleter:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
             DELETE FROM ALL_CONFLUENCE_PAGES
             WHERE pageID = (?)""",
             (pageID,)
         )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def removeAuthorFromDB(
         self,
@@ -121,28 +112,96 @@ class Deleter:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         if username == "not given":
-            dbCursor.execute("""
-                DELETE FROM ALL_CONFLUENCE_AUTHORS
-                WHERE email = (?)""",
+            dbCursor.execute(
+                SQLHelper.SQL_INDEXED_QUERIES["removeAuthorByEmail"],
                 (email,)
             )
         elif email == "not given":
-            dbCursor.execute("""
-                DELETE FROM ALL_CONFLUENCE_AUTHORS
-                WHERE username = (?)""",
+            dbCursor.execute(
+                SQLHelper.SQL_INDEXED_QUERIES["removeAuthorByUsername"],
                 (username,)
             )
         
-        dbConnector.commit()
-        dbConnector.close()
+        ConnectionManager().commit()
+
+    def removeAuthorsFromDB(
+        self,
+        usernames=[],
+        emails=[]
+    ):
+        """
+        Removes every author with one of the given usernames or email addresses from webscraper.db, in one transaction
+
+        The usernames and email addresses are loaded into a temp table, and the authors are removed with one DELETE that joins against it.  Removing an author cascades to their assignments in RECENT_CONFLUENCE_AUTHORS.
+
+        Parameters
+        ----------
+        usernames (optional) : Iterable
+            The usernames of the authors to remove
+
+        emails (optional) : Iterable
+            The email addresses of the authors to remove
+
+        Returns
+        ----------
+        Dict
+            The number of "authors" removed, and the number of "assignments" (pages assigned to those authors) that were removed with them
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
 
-        sleep(1)
+        with ConnectionManager().unitOfWork():
+            dbCursor.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS TEMP_EXCLUDED_AUTHORS (
+                    identifierType TEXT NOT NULL,
+                    identifier TEXT NOT NULL,
+                    PRIMARY KEY(identifierType, identifier)
+                )""")
+
+            dbCursor.execute("""DELETE FROM TEMP_EXCLUDED_AUTHORS""")
+
+            dbCursor.executemany("""
+                INSERT OR IGNORE INTO TEMP_EXCLUDED_AUTHORS (identifierType, identifier)
+                VALUES (?, ?)
+                """,
+                [("username", username) for username in usernames] +
+                [("email", email) for email in emails]
+            )
+
+            excludedAuthors = """
+                SELECT username FROM ALL_CONFLUENCE_AUTHORS
+                WHERE username IN (
+                    SELECT identifier FROM TEMP_EXCLUDED_AUTHORS
+                    WHERE identifierType = 'username'
+                )
+                OR email IN (
+                    SELECT identifier FROM TEMP_EXCLUDED_AUTHORS
+                    WHERE identifierType = 'email'
+                )"""
+
+            numAssignments = dbCursor.execute(f"""
+                SELECT COUNT(*) FROM RECENT_CONFLUENCE_AUTHORS
+                WHERE username IN ({excludedAuthors})
+                """
+            ).fetchone()[0]
+
+            numAuthors = dbCursor.execute(f"""
+                DELETE FROM ALL_CONFLUENCE_AUTHORS
+                WHERE username IN ({excludedAuthors})
+                """
+            ).rowcount
+
+            dbCursor.execute("""DELETE FROM TEMP_EXCLUDED_AUTHORS""")
+
+        return {
+            "authors": numAuthors,
+            "assignments": numAssignments
+        }
 
     def unassignPageIDFromConfluenceCoordinators(self, pageID, username):
         """
@@ -161,11 +220,9 @@ class Deleter:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
                 DELETE FROM RECENT_CONFLUENCE_AUTHORS
                 WHERE pageID = (?) AND 
@@ -173,10 +230,7 @@ class Deleter:
                 (pageID, username,)
             )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def removeInactiveAuthorsFromDB(self):
         """
@@ -191,27 +245,20 @@ class Deleter:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
-        dbCursor.execute("""
-                DELETE FROM ALL_CONFLUENCE_AUTHORS
-                WHERE fullname = (?)""",
+        dbCursor.execute(
+                SQLHelper.SQL_INDEXED_QUERIES["removeAuthorByFullname"],
                 ("Confluence Admin", )
             )
 
-        dbCursor.execute("""
-                DELETE FROM ALL_CONFLUENCE_AUTHORS
-                WHERE email = (?)""",
+        dbCursor.execute(
+                SQLHelper.SQL_INDEXED_QUERIES["removeAuthorByEmail"],
                 ("Address not found", )
             )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def unassignAuthorsFromStalePageIDs(self):
         """
@@ -226,23 +273,16 @@ class Deleter:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
-        stalePageIDs = dbCursor.execute("""
-                SELECT pageID FROM LOG_CONFLUENCE_PAGES_TO_FIX
-                WHERE numDaysMissingAltText > 30"""
+        stalePageIDs = dbCursor.execute(
+                SQLHelper.SQL_INDEXED_QUERIES["stalePageIDs"]
             ).fetchall()
         
-        dbCursor.executemany("""
-                DELETE FROM RECENT_CONFLUENCE_AUTHORS
-                WHERE pageID = (?)""",
+        dbCursor.executemany(
+                SQLHelper.SQL_INDEXED_QUERIES["removeRecentAuthorsByPageID"],
                 stalePageIDs
             )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
\ No newline at end of file
+        ConnectionManager().commit()
\ No newline at end of file
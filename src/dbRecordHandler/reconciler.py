@@ -0,0 +1,308 @@
+from datetime import datetime, timedelta
+from itertools import islice
+from dbRecordHandler.connectionManager import ConnectionManager
+from dbRecordHandler.retriever import Retriever
+from dbRecordHandler.sqlHelper import SQLHelper
+
+
+class Reconciler:
+    """Reconciles the records in the webscraper.db with the current state of the public Confluence space, using a few set-based SQL statements instead of one call to the db per page.
+
+    Attributes
+    ----------
+    FULL_INVENTORY_INTERVAL_DAYS (class) : Integer
+        The most days that can pass between full page inventories.  Every run in between only lists the pages modified since the last inventory.
+
+    INVENTORY_CHUNK_SIZE (class) : Integer
+        The default number of pages that reconcilePageInventory reconciles at a time
+
+    Methods
+    ----------
+    reconcilePageInventory(detailedInfo, isFullInventory, chunkSize, spaceKey)
+        Receives the pageIDs and current version numbers of all pages in a Confluence space, and then adds new pages to ALL_CONFLUENCE_PAGES, updates pages that have changed, and removes pages that are no longer in the space.
+
+    beginPageInventory(spaceKey, isFullInventory)
+        Prepares the db for a page inventory of a Confluence space
+
+    reconcilePageInventoryChunk(chunk, spaceKey)
+        Receives one chunk of a Confluence space's pages, and then adds the new pages to ALL_CONFLUENCE_PAGES, updates the pages that have changed, and flags every page in the chunk with wasPageCheckedThisRun = "TRUE"
+
+    finishPageInventory(spaceKey, isFullInventory, numCurrentPages)
+        Finishes a page inventory of a Confluence space, by removing the pages that are no longer in the space
+
+    getIncrementalInventoryMark(spaceKey)
+        Returns the date that an incremental page inventory of a Confluence space should list modified pages from, or None if a full page inventory is due
+    """
+
+    FULL_INVENTORY_INTERVAL_DAYS = 7
+
+    INVENTORY_CHUNK_SIZE = 5000
+
+    def __init__(self):
+        """
+        Parameters
+        ----------
+        None
+        """
+
+    def __repr__(self):
+        return f'Reconciler()'
+
+    def reconcilePageInventory(self, detailedInfo, isFullInventory=True, chunkSize=None, spaceKey="public"):
+        """
+        Receives the pageIDs and current version numbers of all pages in a Confluence space, and then adds new pages to ALL_CONFLUENCE_PAGES, updates pages that have changed, and removes pages that are no longer in the space.
+
+        New and changed pages are flagged with wasPageRecentlyUpdated = "TRUE", so that they get checked for missing alternate text.  Every current page is flagged with wasPageCheckedThisRun = "TRUE".  Removing a page from ALL_CONFLUENCE_PAGES cascades to the tables that reference it.
+
+        detailedInfo is read and reconciled chunkSize pages at a time, so it can be a generator that streams the pages in, and memory use is bounded by chunkSize instead of by the size of the Confluence space.  This method runs beginPageInventory, reconcilePageInventoryChunk, and finishPageInventory in turn, in one unit of work, so an inventory that's interrupted (e.g. because detailedInfo raises) leaves the db as it was.  Call those directly to reconcile several spaces whose chunks arrive interleaved, inside a unit of work of your own.
+
+        Parameters
+        ----------
+        detailedInfo : Iterable
+            Two-item tuples of a pageID and the number of the current version of that page, as yielded by ACLIController.streamAllConfluencePageIDs
+
+        isFullInventory (optional) : Boolean
+            False if detailedInfo only has the pages modified since the last inventory.  Pages are then never removed, since a page missing from detailedInfo may just be unchanged.
+
+        chunkSize (optional) : Integer
+            The number of pages to reconcile at a time.  INVENTORY_CHUNK_SIZE if not given.
+
+        spaceKey (optional) : String
+            The key of the Confluence space that detailedInfo lists
+
+        Returns
+        ----------
+        Dict
+            The number of "new", "changed", "unchanged", and "removed" pages
+        """
+
+        chunkSize = chunkSize or self.INVENTORY_CHUNK_SIZE
+
+        reconciledCounts = {"new": 0, "changed": 0, "unchanged": 0, "removed": 0}
+        detailedInfo = iter(detailedInfo)
+
+        with ConnectionManager().unitOfWork():
+            self.beginPageInventory(spaceKey=spaceKey, isFullInventory=isFullInventory)
+
+            while True:
+                chunk = list(islice(detailedInfo, chunkSize))
+
+                if not chunk:
+                    break
+
+                for countName, count in self.reconcilePageInventoryChunk(chunk, spaceKey=spaceKey).items():
+                    reconciledCounts[countName] += count
+
+            reconciledCounts["removed"] = self.finishPageInventory(
+                spaceKey=spaceKey,
+                isFullInventory=isFullInventory,
+                numCurrentPages=reconciledCounts["new"] + reconciledCounts["changed"] + reconciledCounts["unchanged"]
+            )
+
+        return reconciledCounts
+
+    def beginPageInventory(self, spaceKey="public", isFullInventory=True):
+        """
+        Prepares the db for a page inventory of a Confluence space
+
+        A full inventory unflags every page in the space, so that the pages that are no longer in the space are the ones left unflagged once every chunk has been reconciled.  Run everything from this method through finishPageInventory in one unit of work.  Otherwise a page inventory that stops partway through leaves the pages of the chunks that weren't reconciled unflagged.
+
+        Parameters
+        ----------
+        spaceKey (optional) : String
+            The key of the Confluence space
+
+        isFullInventory (optional) : Boolean
+            False if only the pages modified since the last inventory will be listed
+
+        Returns
+        ----------
+        None
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        dbCursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS TEMP_CURRENT_CONFLUENCE_PAGES (
+                pageID INTEGER NOT NULL PRIMARY KEY,
+                currentPageVersion INTEGER NOT NULL
+            )""")
+
+        if isFullInventory:
+            dbCursor.execute("""
+                UPDATE ALL_CONFLUENCE_PAGES
+                SET wasPageCheckedThisRun = (?)
+                WHERE spaceKey = (?)
+                """,
+                (SQLHelper().toDBBoolean("FALSE"), spaceKey)
+            )
+
+        ConnectionManager().commit()
+
+    def reconcilePageInventoryChunk(self, chunk, spaceKey="public"):
+        """
+        Receives one chunk of a Confluence space's pages, and then adds the new pages to ALL_CONFLUENCE_PAGES, updates the pages that have changed, and flags every page in the chunk with wasPageCheckedThisRun = "TRUE"
+
+        A page that moved in from another space is moved to this space.
+
+        Parameters
+        ----------
+        chunk : List
+            Two-item tuples of a pageID and the number of the current version of that page
+
+        spaceKey (optional) : String
+            The key of the Confluence space that the chunk's pages are in
+
+        Returns
+        ----------
+        Dict
+            The number of "new", "changed", and "unchanged" pages in the chunk.  A pageID that the chunk repeats is counted once.
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        dbCursor.execute("""DELETE FROM TEMP_CURRENT_CONFLUENCE_PAGES""")
+
+        dbCursor.executemany("""
+            INSERT OR REPLACE INTO TEMP_CURRENT_CONFLUENCE_PAGES (pageID, currentPageVersion)
+            VALUES (?, ?)
+            """,
+            chunk
+        )
+
+        numNewPages = dbCursor.execute("""
+            SELECT COUNT(*) FROM TEMP_CURRENT_CONFLUENCE_PAGES AS currentPages
+            WHERE NOT EXISTS (
+                SELECT 1 FROM ALL_CONFLUENCE_PAGES AS allPages
+                WHERE allPages.pageID = currentPages.pageID
+            )"""
+        ).fetchone()[0]
+
+        numChangedPages = dbCursor.execute("""
+            SELECT COUNT(*) FROM TEMP_CURRENT_CONFLUENCE_PAGES AS currentPages
+            JOIN ALL_CONFLUENCE_PAGES AS allPages
+                ON allPages.pageID = currentPages.pageID
+            WHERE currentPages.currentPageVersion > allPages.oldPageVersion
+            """
+        ).fetchone()[0]
+
+        # Counted from the temp table, which holds each pageID once, since a paginated listing can repeat a page that moved while it was being listed
+        numUnchangedPages = dbCursor.execute("""
+            SELECT COUNT(*) FROM TEMP_CURRENT_CONFLUENCE_PAGES AS currentPages
+            JOIN ALL_CONFLUENCE_PAGES AS allPages
+                ON allPages.pageID = currentPages.pageID
+            WHERE currentPages.currentPageVersion <= allPages.oldPageVersion
+            """
+        ).fetchone()[0]
+
+        # A page counts as recently updated both when it's new to the db and when its version number went up
+        dbCursor.execute("""
+            INSERT INTO ALL_CONFLUENCE_PAGES (pageID, oldPageVersion, wasPageRecentlyUpdated, spaceKey)
+            SELECT pageID, currentPageVersion, (?), (?) FROM TEMP_CURRENT_CONFLUENCE_PAGES
+            WHERE TRUE
+            ON CONFLICT (pageID) DO UPDATE
+                SET oldPageVersion = excluded.oldPageVersion,
+                    wasPageRecentlyUpdated = excluded.wasPageRecentlyUpdated
+                WHERE excluded.oldPageVersion > ALL_CONFLUENCE_PAGES.oldPageVersion
+            """,
+            (SQLHelper().toDBBoolean("TRUE"), spaceKey)
+        )
+
+        # An IN list keeps each chunk's update to primary key lookups.  UPDATE ... FROM scans all of ALL_CONFLUENCE_PAGES once per chunk.
+        dbCursor.execute("""
+            UPDATE ALL_CONFLUENCE_PAGES
+            SET wasPageCheckedThisRun = (?),
+                spaceKey = (?)
+            WHERE pageID IN (
+                SELECT pageID FROM TEMP_CURRENT_CONFLUENCE_PAGES
+            )""",
+            (SQLHelper().toDBBoolean("TRUE"), spaceKey)
+        )
+
+        dbCursor.execute("""DELETE FROM TEMP_CURRENT_CONFLUENCE_PAGES""")
+
+        ConnectionManager().commit()
+
+        return {
+            "new": numNewPages,
+            "changed": numChangedPages,
+            "unchanged": numUnchangedPages
+        }
+
+    def finishPageInventory(self, spaceKey="public", isFullInventory=True, numCurrentPages=0):
+        """
+        Finishes a page inventory of a Confluence space, by removing the pages that are no longer in the space
+
+        Parameters
+        ----------
+        spaceKey (optional) : String
+            The key of the Confluence space
+
+        isFullInventory (optional) : Boolean
+            False if only the pages modified since the last inventory were listed.  Pages are then never removed, since a page that wasn't listed may just be unchanged.
+
+        numCurrentPages (optional) : Integer
+            The number of pages that the inventory listed
+
+        Returns
+        ----------
+        Integer
+            The number of pages removed
+        """
+
+        numRemovedPages = 0
+
+        # Never empty the space because the Confluence space came back empty
+        if isFullInventory and numCurrentPages > 0:
+            dbConnector = ConnectionManager().getConnection()
+            dbCursor = dbConnector.cursor()
+
+            numRemovedPages = dbCursor.execute("""
+                DELETE FROM ALL_CONFLUENCE_PAGES
+                WHERE spaceKey = (?)
+                AND wasPageCheckedThisRun = (?)
+                """,
+                (spaceKey, SQLHelper().toDBBoolean("FALSE"))
+            ).rowcount
+
+            ConnectionManager().commit()
+
+        return numRemovedPages
+
+    def getIncrementalInventoryMark(self, spaceKey="public"):
+        """
+        Returns the date that an incremental page inventory of a Confluence space should list modified pages from, or None if a full page inventory is due
+
+        A full page inventory is due if none has completed yet, or if the last one started more than FULL_INVENTORY_INTERVAL_DAYS days ago.  The date goes back one day before the last inventory started, so that a difference between this machine's and the Confluence server's time zones can't hide a modified page.
+
+        Parameters
+        ----------
+        spaceKey (optional) : String
+            The key of the Confluence space
+
+        Returns
+        ----------
+        String
+            The date, in the format yyyy-mm-dd.  None if a full page inventory is due.
+        """
+
+        lastFullInventory = Retriever().getPageInventoryMark("full", spaceKey)
+
+        if lastFullInventory is None:
+            return None
+
+        lastFullInventory_obj = datetime.strptime(lastFullInventory, "%Y-%m-%d %H:%M:%S")
+
+        if datetime.today() - lastFullInventory_obj > timedelta(days=self.FULL_INVENTORY_INTERVAL_DAYS):
+            return None
+
+        lastIncrementalInventory = Retriever().getPageInventoryMark("incremental", spaceKey)
+
+        lastInventory_obj = max(
+            lastFullInventory_obj,
+            datetime.strptime(lastIncrementalInventory, "%Y-%m-%d %H:%M:%S") if lastIncrementalInventory else lastFullInventory_obj
+        )
+
+        return (lastInventory_obj - timedelta(days=1)).strftime("%Y-%m-%d")
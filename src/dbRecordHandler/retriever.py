@@ -1,6 +1,6 @@
-import sqlite3
-import os
-from pathlib import Path
+import json
+from itertools import groupby
+from dbRecordHandler.connectionManager import ConnectionManager
 from dbRecordHandler.sqlHelper import SQLHelper
 
 
@@ -16,6 +16,9 @@ class Retriever:
     wasMajorCLItaskCompleted(dbCode)
         Retrieves the value that reflects if a given major CLI task was completed
 
+    wasSpaceTaskCompleted(spaceKey, dbCode)
+        Retrieves the value that reflects if a given major CLI task was completed for a given Confluence space
+
     isPageIDInDB(pageID)
         Receives pageID, and determines if pageID exists in db.
 
@@ -25,7 +28,7 @@ class Retriever:
     getOldPageVersion(pageID)
         Receives a pageID and returns that the old page and returns ALL_CONFLUENCE_PAGES.oldPageVersion
 
-    getPageIDsToCheck()
+    getPageIDsToCheck(spaceKey)
         Returns all CONFLUENCE_PAGES_MISSING_ALT_TEXT.pageID, as well as ALL_CONFLUENCE_PAGES.pageID where wasPageRecentlyUpdated is "TRUE"
 
     getPageIDsMissingAltTextFromDB()
@@ -40,20 +43,20 @@ class Retriever:
     getRecentAuthorsForAllPagesMissingAltText()
         Get all recent authors for all pages that have images missing alternate text.
 
-    pairUsernamesWithPageIDsImagesMissingAltText(usernames)
-        Receives usernames, and then pairs all of these usernames with the pageIDs with images missing alternate text that are assigned to those usernames.
+    getNotificationDigests()
+        Yields every author who should be notified, along with their full name, email, and all of the pages with images missing alternate text that are assigned to them.
 
-    getFullName(username)
-        Receives the author's username and returns the author's full name.
+    getNumberOfStalePages()
+        Returns the number of pages that have been missing alternate text for 30_ days.
 
-    getEmail(username)
-        Receives the author's username and returns the author's email.
+    getExcludedAuthors()
+        Returns the usernames, email addresses, and full names of the authors in EXCLUDED_AUTHORS
 
-    getImagesBundle(pageID)
-        Receives a pageID and returns the name of the page, as well as a string representation of key-value pairs of the image links (key) and the image names (value)
+    getPageInventoryMark(inventoryMode, spaceKey)
+        Returns when the last successful page inventory of a given mode and Confluence space started
 
-    getNumberOfStalePages()
-        Returns the number of pages that have been missing alternate text for 30_ days.
+    getCachedRevisions(pageIDs)
+        Receives pageIDs and returns the cached revisions of the pages whose version hasn't changed since they were cached, in bulk.
     """
 
     def __init__(self):
@@ -81,11 +84,9 @@ class Retriever:
             "TRUE" if a given major CLI task was completed, "FALSE" otherwise 
         """
         
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
             SELECT wasTaskCompletedThisRun FROM LOG_CLI_MAJOR_TASKS
             WHERE majorTaskCode = (?)
@@ -93,11 +94,38 @@ class Retriever:
         (dbCode,))
 
         value = dbCursor.fetchall()[0][0]
+
+        return SQLHelper().fromDBBoolean(value)
+
+    def wasSpaceTaskCompleted(self, spaceKey, dbCode):
+        """
+        Retrieves the value that reflects if a given major CLI task was completed for a given Confluence space
+    
+        Parameters
+        ----------
+        spaceKey : String
+            The key of a Confluence space
+
+        dbCode : String
+            A shortened (code) representation of a given major CLI task
+    
+        Returns
+        ----------
+        String
+            "TRUE" if a given major CLI task was completed for the space, "FALSE" otherwise 
+        """
         
-        dbConnector.commit()
-        dbConnector.close()
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        result = dbCursor.execute("""
+            SELECT wasTaskCompletedThisRun FROM LOG_SPACE_MAJOR_TASKS
+            WHERE spaceKey = (?)
+            AND majorTaskCode = (?)
+        """,
+        (spaceKey, dbCode)).fetchone()
 
-        return value
+        return SQLHelper().fromDBBoolean(result[0] if result else 0)
 
     def isPageIDInDB(self, pageID):
         """
@@ -114,11 +142,9 @@ class Retriever:
             True if pageID is in db, False otherwise
         """
         
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
             SELECT * FROM ALL_CONFLUENCE_PAGES
             WHERE pageID = (?)
@@ -126,9 +152,6 @@ class Retriever:
         (pageID,))
 
         result = dbCursor.fetchall()
-        
-        dbConnector.commit()
-        dbConnector.close()
 
         return True if result else False
 
@@ -146,11 +169,9 @@ class Retriever:
             IDs for all Confluence pages in DB
         """
         
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
             SELECT * FROM ALL_CONFLUENCE_PAGES
         """
@@ -160,10 +181,7 @@ class Retriever:
         results = []
 
         for t_row in t_rows:
-            results.append(t_row[0])
-        
-        dbConnector.commit()
-        dbConnector.close()
+            results.append(str(t_row[0]))
 
         return results
 
@@ -182,11 +200,9 @@ class Retriever:
             Old version number for the Confluence page
         """
         
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
             SELECT oldPageVersion FROM ALL_CONFLUENCE_PAGES
             WHERE pageID = (?)
@@ -194,19 +210,17 @@ class Retriever:
         )
 
         result = dbCursor.fetchall()[0][0]
-        
-        dbConnector.commit()
-        dbConnector.close()
 
-        return result
+        return str(result)
 
-    def getPageIDsToCheck(self):
+    def getPageIDsToCheck(self, spaceKey=None):
         """
         Returns all CONFLUENCE_PAGES_MISSING_ALT_TEXT.pageID, as well as ALL_CONFLUENCE_PAGES.pageID where wasPageRecentlyUpdated is "TRUE"
     
         Parameters
         ----------
-        None
+        spaceKey (optional) : String
+            The key of a Confluence space.  If given, only the pages in that space are returned.
     
         Returns
         ----------
@@ -214,31 +228,40 @@ class Retriever:
             All pageIDs
         """
         
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         allPageIDs = []
         results = []
 
-        results = dbCursor.execute("""
-                SELECT pageID FROM CONFLUENCE_PAGES_MISSING_ALT_TEXT
-                """
-        ).fetchall()
+        if spaceKey is None:
+            results = dbCursor.execute("""
+                    SELECT pageID FROM CONFLUENCE_PAGES_MISSING_ALT_TEXT
+                    """
+            ).fetchall()
+        else:
+            results = dbCursor.execute("""
+                    SELECT missingAltText.pageID FROM CONFLUENCE_PAGES_MISSING_ALT_TEXT AS missingAltText
+                    JOIN ALL_CONFLUENCE_PAGES AS allPages
+                        ON allPages.pageID = missingAltText.pageID
+                    WHERE allPages.spaceKey = (?)
+                    """,
+                    (spaceKey,)
+            ).fetchall()
 
-        [allPageIDs.append(result[0]) for result in results]
+        [allPageIDs.append(str(result[0])) for result in results]
 
-        results = dbCursor.execute("""
-            SELECT pageID FROM ALL_CONFLUENCE_PAGES
-            WHERE wasPageRecentlyUpdated = "TRUE"
-            """
-        ).fetchall()
+        if spaceKey is None:
+            results = dbCursor.execute(
+                SQLHelper.SQL_INDEXED_QUERIES["recentlyUpdatedPageIDs"]
+            ).fetchall()
+        else:
+            results = dbCursor.execute(
+                SQLHelper.SQL_INDEXED_QUERIES["recentlyUpdatedPageIDsBySpace"],
+                (spaceKey,)
+            ).fetchall()
 
-        [allPageIDs.append(result[0]) for result in results]
-        
-        dbConnector.commit()
-        dbConnector.close()
+        [allPageIDs.append(str(result[0])) for result in results]
 
         noDups_allPageIDs = list(dict.fromkeys(allPageIDs))
 
@@ -258,20 +281,15 @@ class Retriever:
             PageIDs of Confluence pages with images missing alternate text
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         results = dbCursor.execute("""
                 SELECT pageID FROM CONFLUENCE_PAGES_MISSING_ALT_TEXT
                 """
         ).fetchall()
-        
-        dbConnector.commit()
-        dbConnector.close()
 
-        return [result[0] for result in results]
+        return [str(result[0]) for result in results]
 
     def getAuthorsUsernames(self):
         """
@@ -287,18 +305,13 @@ class Retriever:
             All of the author's usernames
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         results = dbCursor.execute("""
                 SELECT username FROM ALL_CONFLUENCE_AUTHORS
                 """
         ).fetchall()
-        
-        dbConnector.commit()
-        dbConnector.close()
 
         return [result[0] for result in results]
 
@@ -317,19 +330,14 @@ class Retriever:
             True if the db has a recent author for the page, False otherwise
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         result = dbCursor.execute("""
                 SELECT * FROM RECENT_CONFLUENCE_AUTHORS
                 WHERE pageID = (?)
                 """, (pageID,)
         ).fetchone()
-        
-        dbConnector.commit()
-        dbConnector.close()
 
         if result is None:
             return False
@@ -350,11 +358,9 @@ class Retriever:
             Usernames of all recent authors
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         results = dbCursor.execute("""
                 SELECT username FROM RECENT_CONFLUENCE_AUTHORS
                 """
@@ -366,157 +372,183 @@ class Retriever:
             usernames.append(result[0])
 
         usernames_NoDups = list(dict.fromkeys(usernames))
-        
-        dbConnector.commit()
-        dbConnector.close()
 
         return usernames_NoDups
 
-    def pairUsernamesWithPageIDsImagesMissingAltText(self, usernames):
+    def getNotificationDigests(self):
         """
-        Receives usernames, and then pairs all of these usernames with the pageIDs with images missing alternate text that are assigned to those usernames.
-    
+        Yields every author who should be notified, along with their full name, email, and all of the pages with images missing alternate text that are assigned to them.
+
+        All of this comes from one join over RECENT_CONFLUENCE_AUTHORS, ALL_CONFLUENCE_AUTHORS, CONFLUENCE_PAGES_MISSING_ALT_TEXT, and PAGE_IMAGES_MISSING_ALT_TEXT, and is streamed from the cursor one author at a time.
+
         Parameters
         ----------
-        usernames : List
-            The usernames of the authors who are assigned
-    
+        None
+
         Returns
         ----------
-        Dict
-            Key-value pairs of an author's username, and a list of the pageIDs assigned to that author
+        Generator
+            Yields four-item tuples
+            - The author's username
+            - The author's full name
+            - The author's email address
+            - A list of dicts, in the format that MessageBuilder.buildHTMLmessage expects for bundles_pageIDs.  Each dict has one key-value pair:
+                Key = pageID
+                Value = two-item tuple of the page name and a dict of the image links (key) and the image names (value)
         """
-    
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
-        dbCursor = dbConnector.cursor()
-
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
-        pairings_usernames_pageIDs = {}
-        
-        for username in usernames:
-        
-            results = dbCursor.execute("""
-                    SELECT pageID FROM RECENT_CONFLUENCE_AUTHORS
-                    WHERE username = (?)
-                    """, (username,)
-            ).fetchall()
-
-            pageIDs = [result[0] for result in results]
 
-            pairings_usernames_pageIDs[username] = pageIDs
-        
-        dbConnector.commit()
-        dbConnector.close()
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
 
-        return pairings_usernames_pageIDs
+        dbCursor.execute("""
+            SELECT recentAuthors.username,
+                allAuthors.fullname,
+                allAuthors.email,
+                pagesMissingAltText.pageID,
+                pagesMissingAltText.pageName,
+                images.imageSrc,
+                images.imageName
+            FROM RECENT_CONFLUENCE_AUTHORS AS recentAuthors
+            JOIN ALL_CONFLUENCE_AUTHORS AS allAuthors
+                ON allAuthors.username = recentAuthors.username
+            JOIN CONFLUENCE_PAGES_MISSING_ALT_TEXT AS pagesMissingAltText
+                ON pagesMissingAltText.pageID = recentAuthors.pageID
+            JOIN PAGE_IMAGES_MISSING_ALT_TEXT AS images
+                ON images.pageID = recentAuthors.pageID
+            ORDER BY recentAuthors.username, recentAuthors.rowid, images.rowid
+        """)
+
+        for (username, fullname, email), authorRows in groupby(dbCursor, key=lambda row: row[0:3]):
+            bundles_pageIDs = []
+
+            for (pageID, pageName), pageRows in groupby(authorRows, key=lambda row: row[3:5]):
+                bundles_pageIDs.append({
+                    str(pageID) : (pageName, {imageSrc : imageName for *_, imageSrc, imageName in pageRows})
+                })
+
+            yield (username, fullname, email, bundles_pageIDs)
 
-    def getFullName(self, username):
+    def getNumberOfStalePages(self):
         """
-        Receives the author's username and returns the author's full name.
-
+        Returns the number of pages that have been missing alternate text for 30_ days.
+    
         Parameters
         ----------
-        username : String
-            The author's username
+        None
     
         Returns
         ----------
         String
-            The author's full name
+            A string reprensation of the number of stale pages in db
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
+        stalePageIDs = dbCursor.execute(
+                SQLHelper.SQL_INDEXED_QUERIES["stalePageIDs"]
+            ).fetchall()
 
-        result = dbCursor.execute("""
-            SELECT fullname FROM ALL_CONFLUENCE_AUTHORS
-            WHERE username = (?)
-        """, (username,)).fetchone()
-        
-        return result[0]
+        return str(len(stalePageIDs))
 
-    def getEmail(self, username):
+    def getExcludedAuthors(self):
         """
-        Receives the author's username and returns the author's email.
+        Returns the usernames, email addresses, and full names of the authors in EXCLUDED_AUTHORS
+
+        The usernames include the resolvedUsername of every excluded email address that has been matched to an author.
 
         Parameters
         ----------
-        username : String
-            The author's username
-    
+        None
+
         Returns
         ----------
-        String
-            The author's email address
+        Dict
+            Sets of the excluded "usernames", "emails", and "fullnames"
         """
-    
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
+        excludedAuthors = {
+            "usernames": set(),
+            "emails": set(),
+            "fullnames": set()
+        }
 
-        result = dbCursor.execute("""
-            SELECT email FROM ALL_CONFLUENCE_AUTHORS
-            WHERE username = (?)
-        """, (username,)).fetchone()
-        
-        return result[0]
+        for identifierType, identifier, resolvedUsername in dbCursor.execute("""
+            SELECT identifierType, identifier, resolvedUsername FROM EXCLUDED_AUTHORS
+        """):
+            excludedAuthors[identifierType + "s"].add(identifier)
+
+            if resolvedUsername is not None:
+                excludedAuthors["usernames"].add(resolvedUsername)
 
-    def getImagesBundle(self, pageID):
+        return excludedAuthors
+
+    def getPageInventoryMark(self, inventoryMode, spaceKey="public"):
         """
-        Receives a pageID and returns the name of the page, as well as a string representation of key-value pairs of the image links (key) and the image names (value)
+        Returns when the last successful page inventory of a given mode and Confluence space started
 
         Parameters
         ----------
-        pageID : String
-            The unique ID for a Confluence page
-    
+        inventoryMode : String
+            Either "full" or "incremental"
+
+        spaceKey (optional) : String
+            The key of a Confluence space
+
         Returns
         ----------
-        Tuple
-            A two item tuple containing the name of the Confluence page, and a dict of the image links (key) and the image names (value)
+        String
+            The date and time, in the format yyyy-mm-dd hh:mm:ss.  None if no page inventory of that mode has completed yet.
         """
-    
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
-        dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
 
         result = dbCursor.execute("""
-            SELECT pageName, imageNamesLinks FROM CONFLUENCE_PAGES_MISSING_ALT_TEXT
-            WHERE pageID = (?)
-        """, (pageID,)).fetchone()
-        
-        return result
+            SELECT dateLastCompleted FROM LOG_PAGE_INVENTORY
+            WHERE spaceKey = (?)
+            AND inventoryMode = (?)
+        """, (spaceKey, inventoryMode)).fetchone()
 
-    def getNumberOfStalePages(self):
+        return result[0] if result else None
+
+    def getCachedRevisions(self, pageIDs):
         """
-        Returns the number of pages that have been missing alternate text for 30_ days.
-    
+        Receives pageIDs and returns the cached revisions of the pages whose version hasn't changed since they were cached, in bulk.
+
         Parameters
         ----------
-        None
-    
+        pageIDs : List
+            The unique IDs for Confluence pages
+
         Returns
         ----------
-        String
-            A string reprensation of the number of stale pages in db
+        Dict
+            Key-value pairs of a pageID, and a list of three-item tuples of the date of a revision, and the username and full name of its author, newest first.  Pages without up-to-date cached revisions are left out.
         """
-    
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
-        dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
-        stalePageIDs = dbCursor.execute("""
-                SELECT pageID FROM LOG_CONFLUENCE_PAGES_TO_FIX
-                WHERE numDaysMissingAltText > 30"""
-            ).fetchall()
-        
-        dbConnector.commit()
-        dbConnector.close()
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
 
-        return str(len(stalePageIDs))
\ No newline at end of file
+        dbCursor.execute("""
+            SELECT cachedRevisions.pageID,
+                cachedRevisions.revisionDate,
+                cachedRevisions.username,
+                cachedRevisions.fullname
+            FROM CACHED_PAGE_REVISIONS AS cachedRevisions
+            JOIN ALL_CONFLUENCE_PAGES AS allPages
+                ON allPages.pageID = cachedRevisions.pageID
+                AND allPages.oldPageVersion = cachedRevisions.pageVersion
+            WHERE cachedRevisions.pageID IN (SELECT value FROM json_each(?))
+            ORDER BY cachedRevisions.pageID, cachedRevisions.revisionIndex
+        """, (json.dumps([int(pageID) for pageID in pageIDs]),))
+
+        revisionsByPageID = {}
+
+        for pageID, revisionDate, username, fullname in dbCursor:
+            revisionsByPageID.setdefault(str(pageID), []).append((revisionDate, username, fullname))
+
+        return revisionsByPageID
@@ -1,17 +1,30 @@
 class SQLHelper:
-    """Provides a variable of repetitive SQL statements that improves the performance of the db.  These statements should be run before each call to the db.
+    """Provides variables of repetitive SQL statements that improve the performance of the db.
 
     ref:  https://phiresky.github.io/blog/2020/sqlite-performance-tuning/
-        
+
     Attributes
     ----------
     SQL_QUERIES : String
-        The repetitive SQL statements that improves performance
-    
-    
+        The repetitive SQL statements that improve performance.  ConnectionManager runs these statements once, when it opens a connection to the db.
+
+    SQL_PASSIVE_CHECKPOINT : String
+        Copies as much of the write-ahead log (WAL) back into the db as it can, without blocking other connections.  ConnectionManager runs this statement every ConnectionManager.CHECKPOINT_INTERVAL commits.
+
+    SQL_TRUNCATE_CHECKPOINT : String
+        Copies the whole WAL back into the db and truncates the WAL file.  ConnectionManager runs this statement when it closes a connection.
+
+    SQL_INDEXED_QUERIES : Dict
+        Key-value pairs of a name and a Retriever or Deleter statement that filters on a hot predicate.  Each of these statements must be served by an index, which DBMigrator.getFullTableScans checks with EXPLAIN QUERY PLAN.
+
+
     Methods
     ----------
-    None
+    toDBBoolean(value)
+        Receives "TRUE" or "FALSE" and returns the 1 or 0 that the typed schema stores
+
+    fromDBBoolean(value)
+        Receives a 1 or 0 from the typed schema and returns "TRUE" or "FALSE"
     """
 
     SQL_QUERIES = """
@@ -19,6 +32,75 @@ class SQLHelper:
         PRAGMA synchronous = normal;
         PRAGMA temp_store = memory;
         PRAGMA mmap_size = 30000000000;
-        PRAGMA wal_checkpoint(TRUNCATE);
         PRAGMA foreign_keys = ON;
-    """
\ No newline at end of file
+    """
+
+    SQL_PASSIVE_CHECKPOINT = "PRAGMA wal_checkpoint(PASSIVE);"
+
+    SQL_TRUNCATE_CHECKPOINT = "PRAGMA wal_checkpoint(TRUNCATE);"
+
+    SQL_INDEXED_QUERIES = {
+        "recentlyUpdatedPageIDs": """
+            SELECT pageID FROM ALL_CONFLUENCE_PAGES
+            WHERE wasPageRecentlyUpdated = 1
+            """,
+        "recentlyUpdatedPageIDsBySpace": """
+            SELECT pageID FROM ALL_CONFLUENCE_PAGES
+            WHERE wasPageRecentlyUpdated = 1
+            AND spaceKey = (?)
+            """,
+        "stalePageIDs": """
+            SELECT pageID FROM LOG_CONFLUENCE_PAGES_TO_FIX
+            WHERE numDaysMissingAltText > 30
+            """,
+        "removeRecentAuthorsByPageID": """
+            DELETE FROM RECENT_CONFLUENCE_AUTHORS
+            WHERE pageID = (?)
+            """,
+        "removeAuthorByUsername": """
+            DELETE FROM ALL_CONFLUENCE_AUTHORS
+            WHERE username = (?)
+            """,
+        "removeAuthorByEmail": """
+            DELETE FROM ALL_CONFLUENCE_AUTHORS
+            WHERE email = (?)
+            """,
+        "removeAuthorByFullname": """
+            DELETE FROM ALL_CONFLUENCE_AUTHORS
+            WHERE fullname = (?)
+            """,
+    }
+
+    def toDBBoolean(self, value):
+        """
+        Receives "TRUE" or "FALSE" and returns the 1 or 0 that the typed schema stores
+
+        Parameters
+        ----------
+        value : String
+            Either "TRUE" or "FALSE"
+
+        Returns
+        ----------
+        Integer
+            1 if value is "TRUE", 0 otherwise
+        """
+
+        return 1 if value == "TRUE" else 0
+
+    def fromDBBoolean(self, value):
+        """
+        Receives a 1 or 0 from the typed schema and returns "TRUE" or "FALSE"
+
+        Parameters
+        ----------
+        value : Integer
+            Either 1 or 0
+
+        Returns
+        ----------
+        String
+            "TRUE" if value is 1, "FALSE" otherwise
+        """
+
+        return "TRUE" if value else "FALSE"
@@ -1,7 +1,6 @@
-import sqlite3
+import json
 from datetime import datetime
-from pathlib import Path
-from time import sleep
+from dbRecordHandler.connectionManager import ConnectionManager
 from dbRecordHandler.sqlHelper import SQLHelper
 
 
@@ -17,6 +16,9 @@ class Updater:
     changeCLIMajorTasksLogValue(value, dbCode)
         Receives "TRUE" or "FALSE" and updates the value in the respective LOG_CLI_MAJOR_TASKS table
 
+    changeSpaceTasksLogValue(spaceKey, value, dbCode)
+        Receives "TRUE" or "FALSE" and updates the value of a major CLI task for a given Confluence space in LOG_SPACE_MAJOR_TASKS
+
     updateOldPageVersion(pageID, newPageVersion)
         Receives a pageID and updates ALL_CONFLUENCE_PAGES.oldPageVersion
 
@@ -31,6 +33,15 @@ class Updater:
 
     resetKeyDBValuesToDefault()
         Reset key DB values back to their default values.  This method is called when the script has emailed the individualized messages to the Confluence authors
+
+    replaceExcludedAuthors(reason, usernames, emails)
+        Receives the current usernames and email addresses of the authors excluded for a given reason, and replaces the ones in EXCLUDED_AUTHORS with them
+
+    resolveExcludedEmail(email, username)
+        Receives an excluded email address and the username of the author it belongs to, and saves that username in EXCLUDED_AUTHORS.resolvedUsername
+
+    updatePageInventoryMark(inventoryMode, dateLastCompleted, spaceKey)
+        Receives an inventory mode and the time its latest page inventory of a Confluence space started, and saves it in LOG_PAGE_INVENTORY
     """
 
     def __init__(self):
@@ -60,23 +71,52 @@ class Updater:
         none
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
-
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
         
         dbCursor.execute("""
             UPDATE LOG_CLI_MAJOR_TASKS
             SET wasTaskCompletedThisRun = (?)
             WHERE majorTaskCode = (?)
             """,
-            (value, dbCode)
+            (SQLHelper().toDBBoolean(value), dbCode)
         )
         
-        dbConnector.commit()
-        dbConnector.close()
+        ConnectionManager().commit()
+
+    def changeSpaceTasksLogValue(self, spaceKey, value, dbCode):
+        """
+        Receives "TRUE" or "FALSE" and updates the value of a major CLI task for a given Confluence space in LOG_SPACE_MAJOR_TASKS
+    
+        Parameters
+        ----------
+        spaceKey : String
+            The key of a Confluence space
+
+        value : String
+            The value to pass to the db
 
-        sleep(1)
+        dbCode: String
+            A shortened (code) representation of a given major CLI task
+    
+        Returns
+        ----------
+        none
+        """
+    
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+        
+        dbCursor.execute("""
+            INSERT INTO LOG_SPACE_MAJOR_TASKS (spaceKey, majorTaskCode, wasTaskCompletedThisRun)
+            VALUES (?, ?, ?)
+            ON CONFLICT (spaceKey, majorTaskCode) DO UPDATE
+                SET wasTaskCompletedThisRun = excluded.wasTaskCompletedThisRun
+            """,
+            (spaceKey, dbCode, SQLHelper().toDBBoolean(value))
+        )
+        
+        ConnectionManager().commit()
 
     def updateOldPageVersion(self, pageID, newPageVersion):
         """
@@ -95,11 +135,9 @@ class Updater:
         none
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
             UPDATE ALL_CONFLUENCE_PAGES
             SET oldPageVersion = (?)
@@ -108,10 +146,7 @@ class Updater:
             (newPageVersion, pageID)
         )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def updateWasPageCheckedThisRun(self, pageID, value):
         """
@@ -130,23 +165,18 @@ class Updater:
         none
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
 
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
-
         dbCursor.execute("""
             UPDATE ALL_CONFLUENCE_PAGES
             SET waspageCheckedThisRun = (?)
             WHERE pageID = (?)
             """,
-            (value, pageID)
+            (SQLHelper().toDBBoolean(value), pageID)
         )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def updateWasPageRecentlyUpdated(self, pageID, value):
         """
@@ -165,23 +195,18 @@ class Updater:
         none
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
-
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
         
         dbCursor.execute("""
             UPDATE ALL_CONFLUENCE_PAGES
             SET wasPageRecentlyUpdated = (?)
             WHERE pageID = (?)
             """,
-            (value, pageID)
+            (SQLHelper().toDBBoolean(value), pageID)
         )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def addAuthorEmailToDB(self, username, address):
         """
@@ -200,10 +225,8 @@ class Updater:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
-
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
         
         if dbCursor.execute("""
             SELECT * FROM ALL_CONFLUENCE_AUTHORS
@@ -218,10 +241,7 @@ class Updater:
                 (address, username)
             )
         
-        dbConnector.commit()
-        dbConnector.close()
-
-        sleep(1)
+        ConnectionManager().commit()
 
     def resetKeyDBValuesToDefault(self):
         """
@@ -236,25 +256,142 @@ class Updater:
         None
         """
     
-        dbConnector = sqlite3.connect(str(Path.cwd())+"/src/sensitive/webscraper.db")
+        dbConnector = ConnectionManager().getConnection()
         dbCursor = dbConnector.cursor()
-
-        dbCursor.executescript(SQLHelper().SQL_QUERIES)
         
         dbCursor.execute("""
             UPDATE LOG_CLI_MAJOR_TASKS
-            SET wasTaskCompletedThisRun = "FALSE"
+            SET wasTaskCompletedThisRun = 0
+            """
+        )
+
+        dbCursor.execute("""
+            UPDATE LOG_SPACE_MAJOR_TASKS
+            SET wasTaskCompletedThisRun = 0
             """
         )
 
         dbCursor.execute("""
             UPDATE ALL_CONFLUENCE_PAGES
-            SET wasPageCheckedThisRun = "FALSE",
-            wasPageRecentlyUpdated = "FALSE"
+            SET wasPageCheckedThisRun = 0,
+            wasPageRecentlyUpdated = 0
             """
         )
         
-        dbConnector.commit()
-        dbConnector.close()
+        ConnectionManager().commit()
+
+    def replaceExcludedAuthors(
+        self,
+        reason,
+        usernames=[],
+        emails=[]
+    ):
+        """
+        Receives the current usernames and email addresses of the authors excluded for a given reason, and replaces the ones in EXCLUDED_AUTHORS with them
+
+        Email addresses that were already excluded keep their resolvedUsername.  Usernames and email addresses that are no longer given are removed, so that those authors get emailed again.
+
+        Parameters
+        ----------
+        reason : String
+            Why these authors are excluded (e.g. "VIP")
+
+        usernames (optional) : Iterable
+            The usernames of the excluded authors
+
+        emails (optional) : Iterable
+            The email addresses of the excluded authors
+
+        Returns
+        ----------
+        None
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        excludedIdentifiers = [("username", username) for username in usernames] + [("email", email) for email in emails]
+
+        dbCursor.execute("""
+            DELETE FROM EXCLUDED_AUTHORS
+            WHERE reason = (?)
+                AND (identifierType, identifier) NOT IN (
+                    SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]') FROM json_each(?)
+                )
+            """,
+            (reason, json.dumps(excludedIdentifiers))
+        )
+
+        dbCursor.executemany("""
+            INSERT OR IGNORE INTO EXCLUDED_AUTHORS (identifierType, identifier, reason)
+            VALUES (?, ?, ?)
+            """,
+            [(identifierType, identifier, reason) for identifierType, identifier in excludedIdentifiers]
+        )
+
+        ConnectionManager().commit()
+
+    def resolveExcludedEmail(self, email, username):
+        """
+        Receives an excluded email address and the username of the author it belongs to, and saves that username in EXCLUDED_AUTHORS.resolvedUsername
+
+        Parameters
+        ----------
+        email : String
+            The excluded email address
+
+        username : String
+            The username of the author with that email address
+
+        Returns
+        ----------
+        None
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        dbCursor.execute("""
+            UPDATE EXCLUDED_AUTHORS
+            SET resolvedUsername = (?)
+            WHERE identifierType = (?)
+                AND identifier = (?)
+            """,
+            (username, "email", email)
+        )
+
+        ConnectionManager().commit()
+
+    def updatePageInventoryMark(self, inventoryMode, dateLastCompleted, spaceKey="public"):
+        """
+        Receives an inventory mode and the time its latest page inventory of a Confluence space started, and saves it in LOG_PAGE_INVENTORY
+
+        Parameters
+        ----------
+        inventoryMode : String
+            Either "full" or "incremental"
+
+        dateLastCompleted : String
+            When the page inventory started, in the format yyyy-mm-dd hh:mm:ss
+
+        spaceKey (optional) : String
+            The key of a Confluence space
+
+        Returns
+        ----------
+        None
+        """
+
+        dbConnector = ConnectionManager().getConnection()
+        dbCursor = dbConnector.cursor()
+
+        dbCursor.execute("""
+            INSERT INTO LOG_PAGE_INVENTORY (spaceKey, inventoryMode, dateLastCompleted)
+            VALUES (?, ?, ?)
+            ON CONFLICT (spaceKey, inventoryMode) DO UPDATE
+                SET dateLastCompleted = excluded.dateLastCompleted
+            """,
+            (spaceKey, inventoryMode, dateLastCompleted)
+        )
 
-        sleep(1)
\ No newline at end of file
+        ConnectionManager().commit()
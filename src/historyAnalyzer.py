@@ -0,0 +1,93 @@
+from datetime import date, timedelta
+from itertools import islice
+
+class HistoryAnalyzer:
+    """Works out the recent authors of a Confluence page from its content history.
+
+    Revision dates are compared as yyyy-mm-dd strings against a cutoff date, which sorts the same as comparing the dates themselves.  So no date objects are built per revision, and each page's revisions are walked once.
+
+    Attributes
+    ----------
+    RECENT_DAYS (class) : Integer
+        The authors of every revision in this many days are recent
+
+    NUM_FALLBACK_REVISIONS (class) : Integer
+        The number of latest revisions whose authors are recent, if the page hasn't been updated in RECENT_DAYS days
+
+    Methods
+    ----------
+    getCutoffDate(today)
+        Returns the oldest revision date that still counts as recent
+
+    getRecentAuthors(allRevisions, cutoffDate)
+        Receives a page's revisions, and returns a list of the authors who've recently updated the page
+    """
+
+    RECENT_DAYS = 30
+
+    NUM_FALLBACK_REVISIONS = 5
+
+    def __init__(self):
+        """
+        Parameters
+        ----------
+        none
+        """
+
+    def __repr__(self):
+        return f'HistoryAnalyzer()'
+
+    def getCutoffDate(self, today=None):
+        """
+        Returns the oldest revision date that still counts as recent
+
+        Parameters
+        ----------
+        today (optional) : Class (of type 'datetime.date')
+            The date to count back from.  Today's date if not given.
+
+        Returns
+        ----------
+        String
+            The date, in the format yyyy-mm-dd
+        """
+
+        return ((today or date.today()) - timedelta(days=self.RECENT_DAYS)).isoformat()
+
+    def getRecentAuthors(self, allRevisions, cutoffDate=None):
+        """
+        Receives a page's revisions, and returns a list of the authors who've recently updated the page
+
+        The authors of every revision in the last RECENT_DAYS days are recent.  If the page hasn't been updated in the last RECENT_DAYS days, the authors of the last NUM_FALLBACK_REVISIONS revisions are recent instead.
+
+        Parameters
+        ----------
+        allRevisions : List
+            Three-item tuples of the date of the revision (starting with yyyy-mm-dd), and the username and full name of the author who published it, newest first
+
+        cutoffDate (optional) : String
+            The oldest revision date that still counts as recent, as returned by getCutoffDate.  Pass it in when analyzing many pages, so it's only worked out once.
+
+        Returns
+        ----------
+        List
+            A list of tuples.  Each tuple will contain the authors username and full name, in the order of their latest recent revision.  This list will contain no duplicates.
+        """
+
+        if not allRevisions:
+            return []
+
+        cutoffDate = cutoffDate or self.getCutoffDate()
+
+        if allRevisions[0][0] < cutoffDate:
+            recentRevisions = islice(allRevisions, self.NUM_FALLBACK_REVISIONS)
+        else:
+            recentRevisions = (revision for revision in allRevisions if revision[0] >= cutoffDate)
+
+        # Keeps each author's first position, and the full name from their oldest recent revision
+        recentAuthors_dict = {}
+
+        for _, username, fullname in recentRevisions:
+            recentAuthors_dict[username] = fullname
+
+        return list(recentAuthors_dict.items())
@@ -0,0 +1,343 @@
+from html.parser import HTMLParser
+from urllib.parse import quote, urljoin, urlsplit, urlunsplit
+from confluenceRestClient import ConfluenceRestClient
+
+class HTMLAltTextScanner:
+    """Finds the images missing alternate text on Confluence pages without a browser.  A drop-in alternative to SeleniumManager.getImagesMisssingAltText.
+
+    Each page's HTML is fetched over ConfluenceRestClient's keep-alive connections, and parsed by AltTextHTMLParser.  The parser reads the attributes the way Selenium's get_attribute does, so both scanners return the same results for the same HTML.  Images that Confluence's JavaScript adds after the page loads are only seen by SeleniumManager.
+
+    A page only counts as gone (a page name of None) when Confluence answers 404 or 403 for it.  Any other error status, a redirect off the Confluence server (e.g. to a single sign-on or maintenance page), or a page without a title (e.g. a login page) raises a RuntimeError instead, so an outage never looks like a page that was removed.
+
+    Attributes
+    ----------
+    MAX_REDIRECTS (class) : Integer
+        The most redirects followed to reach a page, as long as they stay on the Confluence server
+
+    Methods
+    ----------
+    logInToConfluence(serverAddr, username, password)
+        Receives the user's login credentials, which every page request is then authenticated with
+
+    getImagesMisssingAltText(baseLink, pageID)
+        Receives a pageID, then identifies images on the Confluence page that are missing alternate text, and then returns a tuple of detailed information about the page and its images
+
+    scanPages(baseLink, pageIDs)
+        Receives pageIDs, and yields detailed information about each page and its images missing alternate text, one page at a time
+
+    getPageHTML(pageURL)
+        Fetches a page's HTML, following redirects on the Confluence server.  Returns None for the HTML if the page doesn't exist or the user can't view it.
+
+    getImagesMissingAltTextFromHTML(pageHTML, pageURL)
+        Parses a page's HTML, and returns a tuple of detailed information about the page and its images
+    """
+
+    MAX_REDIRECTS = 5
+
+    def __init__(self):
+        """
+        Parameters
+        ----------
+        None
+        """
+
+        self._restClient = ConfluenceRestClient()
+        self._serverAddr = None
+        self._username = None
+        self._password = None
+
+    def __repr__(self):
+        return f'HTMLAltTextScanner()'
+
+    def logInToConfluence(self, serverAddr, username, password):
+        """
+        Receives the user's login credentials, which every page request is then authenticated with
+
+        Parameters
+        ----------
+        serverAddr : String
+            The URL to the Confluence server
+
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        Returns
+        ----------
+        None
+        """
+
+        self._serverAddr = serverAddr
+        self._username = username
+        self._password = password
+
+    def getImagesMisssingAltText(self, baseLink, pageID):
+        """
+        Receives a pageID, then identifies images on the Confluence page that are missing alternate text, and then returns a tuple of detailed information about the page and its images
+
+        Parameters
+        ----------
+        baseLink : String
+            The base link for a Confluence page.  Will look something like "https://confluence.xyz.com/pages/viewpage.action?pageId="
+
+        pageID : String
+            The unique ID for a Confluence page
+
+        Returns
+        ----------
+        Tuple
+            A two item tuple
+            - The first item is a dict of key-value pairs of links to images and the image names.  Will return an empty dict if either the page has no images, or all images have alernate text.
+            - The second item is the page name.  Will be None if the page no longer exists or isn't public.
+        """
+
+        pageHTML, pageURL = self.getPageHTML(baseLink+pageID)
+
+        if pageHTML is None:
+            return ({}, None)
+
+        imagesNamesLinks, pageName, numImages = self.getImagesMissingAltTextFromHTML(pageHTML, pageURL)
+
+        # Every Confluence page has a title, so a page without one is most likely a login or error page, and isn't a sign that the page is gone
+        if pageName is None:
+            raise RuntimeError(f"Page {pageID} was fetched from {pageURL} without an ajs-page-title meta tag, so it isn't a Confluence page")
+
+        print(f"\tNumber of images found: {numImages}")
+        print(f"\tNumber of images that have alternate text: {numImages-len(imagesNamesLinks)}")
+        print(f"\tNumber of images that are missing alternate text: {len(imagesNamesLinks)}")
+
+        return (imagesNamesLinks, pageName)
+
+    def scanPages(self, baseLink, pageIDs):
+        """
+        Receives pageIDs, and yields detailed information about each page and its images missing alternate text, one page at a time
+
+        Parameters
+        ----------
+        baseLink : String
+            The base link for a Confluence page.  Will look something like "https://confluence.xyz.com/pages/viewpage.action?pageId="
+
+        pageIDs : List
+            The unique IDs of Confluence pages
+
+        Returns
+        ----------
+        Generator
+            Yields three-item tuples of a pageID, and the two items that getImagesMisssingAltText returns for the page
+        """
+
+        for index, pageID in enumerate(pageIDs):
+            print(f"\nChecking page #{index+1} ({pageID}) for alternate text now...")
+
+            yield (pageID, *self.getImagesMisssingAltText(baseLink, pageID))
+
+    def getPageHTML(self, pageURL):
+        """
+        Fetches a page's HTML, following redirects on the Confluence server.  Returns None for the HTML if the page doesn't exist or the user can't view it.
+
+        Raises a RuntimeError if the page couldn't be fetched for any other reason (any other status that isn't 2xx, a redirect off the Confluence server, or too many redirects).
+
+        Parameters
+        ----------
+        pageURL : String
+            The URL to the page
+
+        Returns
+        ----------
+        Tuple
+            A two item tuple of the page's HTML, and the URL it was finally fetched from.  The HTML is None if Confluence answered 404 or 403.
+        """
+
+        serverAddr = self._serverAddr or "{0.scheme}://{0.netloc}".format(urlsplit(pageURL))
+
+        for _ in range(self.MAX_REDIRECTS + 1):
+            splitPageURL = urlsplit(pageURL)
+
+            status, headers, body = self._restClient.getResponse(
+                username=self._username,
+                password=self._password,
+                serverAddr=serverAddr,
+                path=splitPageURL.path + ("?" + splitPageURL.query if splitPageURL.query else ""),
+                accept="text/html"
+            )
+
+            if status in (301, 302, 303, 307, 308) and headers.get("Location"):
+                pageURL = urljoin(pageURL, headers.get("Location"))
+
+                # Redirects off the Confluence server (e.g. to a single sign-on or maintenance page) aren't followed
+                if urlsplit(pageURL).netloc != urlsplit(serverAddr).netloc:
+                    raise RuntimeError(f"Fetching a page was redirected off the Confluence server, to {pageURL}")
+
+                continue
+
+            # Confluence answers 404 for a deleted page, and 404 or 403 for a page the user can't view
+            if status in (403, 404):
+                return (None, pageURL)
+
+            if not 200 <= status < 300:
+                raise RuntimeError(f"Fetching {pageURL} failed with HTTP status {status}")
+
+            return (body.decode(headers.get_content_charset() or "utf-8", errors="replace"), pageURL)
+
+        raise RuntimeError(f"Fetching {pageURL} was redirected more than {self.MAX_REDIRECTS} times")
+
+    def getImagesMissingAltTextFromHTML(self, pageHTML, pageURL):
+        """
+        Parses a page's HTML, and returns a tuple of detailed information about the page and its images
+
+        Parameters
+        ----------
+        pageHTML : String
+            The page's HTML
+
+        pageURL : String
+            The URL the page was fetched from, which relative image links are resolved against
+
+        Returns
+        ----------
+        Tuple
+            A three item tuple
+            - The first item is a dict of key-value pairs of links to images and the image names, as getImagesMisssingAltText returns it.
+            - The second item is the page name.  Will be None if the page has no ajs-page-title meta tag.
+            - The third item is the number of images found on the page.
+        """
+
+        parser = AltTextHTMLParser(pageURL)
+        parser.feed(pageHTML)
+        parser.close()
+
+        return (parser.imagesNamesLinks, parser.pageName, parser.numImages)
+
+class AltTextHTMLParser(HTMLParser):
+    """Collects the images missing alternate text, and the page title, from a Confluence page's HTML.  Used by HTMLAltTextScanner.
+
+    Attributes are read the way Selenium's get_attribute reads them from the DOM.  An img's missing alt reads as "", so it's missing alternate text.  An img's non-empty src is resolved to an absolute link, the way the browser resolves it, and an empty or missing src is read as is ("" or None).  Any element with the confluence-embedded-image class counts as an image, but only an img can be missing alternate text.
+
+    Attributes
+    ----------
+    pageURL : String
+        The URL the page was fetched from
+
+    imagesNamesLinks : Dict
+        Key-value pairs of links to images missing alternate text, and the image names
+
+    pageName : String
+        The content of the first ajs-page-title meta tag.  None if the page has none.
+
+    numImages : Integer
+        The number of elements with the confluence-embedded-image class
+
+    PATH_SAFE_CHARS (class) : String
+        The characters that a browser leaves as they are in a link's path.  Every other character is percent-encoded.
+
+    QUERY_SAFE_CHARS (class) : String
+        The characters that a browser leaves as they are in a link's query string
+
+    FRAGMENT_SAFE_CHARS (class) : String
+        The characters that a browser leaves as they are in a link's fragment
+
+    Methods
+    ----------
+    handle_starttag(tag, attrs)
+        Checks each start tag for an embedded image or the page title
+
+    resolveLink(src)
+        Resolves an img's src against the page's URL, the way the browser does for the img's src property
+    """
+
+    PATH_SAFE_CHARS = "!$%&'()*+,-./:;=@[]^_|~"
+
+    QUERY_SAFE_CHARS = "!$%&()*+,-./:;=?@[\\]^_`{|}~"
+
+    FRAGMENT_SAFE_CHARS = "!#$%&'()*+,-./:;=?@[\\]^_{|}~"
+
+    def __init__(self, pageURL):
+        """
+        Parameters
+        ----------
+        pageURL : String
+            The URL the page was fetched from, which relative image links are resolved against
+        """
+
+        super().__init__()
+
+        self.pageURL = pageURL
+        self.imagesNamesLinks = {}
+        self.pageName = None
+        self.numImages = 0
+
+    def __repr__(self):
+        return f'AltTextHTMLParser({self.pageURL})'
+
+    def handle_starttag(self, tag, attrs):
+        """
+        Checks each start tag for an embedded image or the page title
+
+        Parameters
+        ----------
+        tag : String
+            The tag's name, in lowercase
+
+        attrs : List
+            Two-item tuples of each attribute's name and value.  A value is None if the attribute has no value.
+
+        Returns
+        ----------
+        None
+        """
+
+        # A browser keeps the first of any repeated attribute
+        attrs = dict(reversed(attrs))
+
+        if "confluence-embedded-image" in (attrs.get("class") or "").split():
+            self.numImages += 1
+
+            if tag == "img" and not attrs.get("alt"):
+                # get_attribute only resolves a src that isn't empty
+                src = attrs.get("src")
+
+                self.imagesNamesLinks[
+                    self.resolveLink(src) if src else src
+                ] = attrs.get("data-linked-resource-default-alias")
+
+        elif tag == "meta" and attrs.get("name") == "ajs-page-title" and self.pageName is None:
+            self.pageName = attrs.get("content") or ""
+
+    def resolveLink(self, src):
+        """
+        Resolves an img's src against the page's URL, the way the browser does for the img's src property
+
+        Leading and trailing whitespace is dropped, tabs and line breaks are removed, and characters that can't appear in a URL (e.g. spaces and non-ASCII letters) are percent-encoded.  Characters that are already percent-encoded are left alone.
+
+        Parameters
+        ----------
+        src : String
+            The value of the img's src attribute
+
+        Returns
+        ----------
+        String
+            The absolute link to the image
+        """
+
+        src = src.strip(" \t\n\r\f")
+
+        for character in "\t\n\r":
+            src = src.replace(character, "")
+
+        splitLink = urlsplit(urljoin(self.pageURL, src))
+        path = splitLink.path
+
+        # In http(s) links, the browser reads a backslash in the path as a slash
+        if splitLink.scheme in ("http", "https"):
+            path = path.replace("\\", "/")
+
+        return urlunsplit((
+            splitLink.scheme,
+            splitLink.netloc,
+            quote(path, safe=self.PATH_SAFE_CHARS),
+            quote(splitLink.query, safe=self.QUERY_SAFE_CHARS),
+            quote(splitLink.fragment, safe=self.FRAGMENT_SAFE_CHARS)
+        ))
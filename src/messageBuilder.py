@@ -1,5 +1,3 @@
-import ast
-
 class MessageBuilder:
     """Builds the custom message for the Confluence author
         
@@ -52,7 +50,7 @@ class MessageBuilder:
                 Key = pageID
                 Value = two-item tuple
                     - pageName
-                    - string representation of a dict
+                    - dict
                         Key = image link
                         Value = image name
 
@@ -72,9 +70,7 @@ class MessageBuilder:
         for bundle in bundles_pageIDs:
             pageID = list(bundle.keys())[0]
             pageName = bundle.get(pageID)[0]
-            imagesLinksNames_d = ast.literal_eval(
-                bundle.get(pageID)[1]
-            )
+            imagesLinksNames_d = bundle.get(pageID)[1]
 
             completeListItem = f"<li><a href=\"{baseLink+pageID}\">{pageName}</a><ul>"
 
@@ -1,29 +1,42 @@
 from credentialsHandler import CredentialsHandler
 from ACLIController import ACLIController
+from confluenceRestClient import ConfluenceRestClient
 from DBCreator import DBCreator
+from DBMigrator import DBMigrator
 from dbRecordHandler.creator import Creator
 from dbRecordHandler.deleter import Deleter
 from dbRecordHandler.retriever import Retriever
 from dbRecordHandler.updater import Updater
+from dbRecordHandler.reconciler import Reconciler
+from dbRecordHandler.connectionManager import ConnectionManager
 from sensitive.keyInfo import KeyInfo
 from seleniumManager import SeleniumManager
+from seleniumPool import SeleniumPool
+from htmlAltTextScanner import HTMLAltTextScanner
+from storageFormatScanner import StorageFormatScanner
 from sensitive.emailTemplate import EmailTemplate
 from messageBuilder import MessageBuilder
 from mailHandler import MailHandler
 from getpass import getpass
+from datetime import datetime
 import sys
 
-acli = ACLIController()
+if KeyInfo().CONFLUENCE_BACKEND == "rest":
+    acli = ConfluenceRestClient()
+else:
+    acli = ACLIController()
+
 while True:
     print("Provide the credentials for your assigned organizational Gmail account.")
     credsConfCoord = CredentialsHandler()
 
-    if (acli.testACLIauthentication(
+    # The email address is checked first, so that a mistyped address doesn't cost a call to the server
+    if ("@" in credsConfCoord.emailAddr
+    and acli.testACLIauthentication(
         username=credsConfCoord.username,
         password=credsConfCoord.password,
         serverAddr=KeyInfo().CONFLUENCE_SERVER_ADDRESS
-    ) == True 
-    and "@" in credsConfCoord.emailAddr):
+    ) == True):
         break # <-- The user provided the correct credentials and likely a valid email address.
     else:
         print("credentials were invalid.  please try again.")
@@ -31,16 +44,26 @@ while True:
 dbCrtr = DBCreator()
 if dbCrtr.doesDBexist() == True:
     print("webscraper.db detected")
+
+    dbMgrtr = DBMigrator()
+    if dbMgrtr.getSchemaVersion() < dbMgrtr.getLatestSchemaVersion():
+        print(f"webscraper.db is at schema version {dbMgrtr.getSchemaVersion()}.  Migrating it to schema version {dbMgrtr.getLatestSchemaVersion()} now...")
+        dbMgrtr.migrate()
 else:
     print("webscraper.db not detected")
     print("creating base webscraper.db now")
     dbCrtr.createDB()
 
+fullTableScans = DBMigrator().getFullTableScans()
+if fullTableScans:
+    print(f"Warning: these webscraper.db queries aren't served by an index, and will slow down as the space grows: {', '.join(fullTableScans)}")
+
 # Instantiating all necessary objs, for this Python script to interact with webscraper.db
 creator = Creator()
 deleter = Deleter()
 retriever = Retriever()
 updater = Updater()
+reconciler = Reconciler()
 
 # Instantiating SeleniumManager object and using the user's credentials, to log in to Confluence.
 # This script uses Selenium to scrape specific Confluence pages for images missing alternate text.
@@ -51,180 +74,181 @@ slmMgr.logInToConfluence(
     password=credsConfCoord.password
 )
 
-print("Getting all current pageIDs from public Confluence space now...")
-
-currentDetailedInfo = acli.getAllConfluencePageIDs(
-    username=credsConfCoord.username, 
-    password=credsConfCoord.password,
-    serverAddr=KeyInfo().CONFLUENCE_SERVER_ADDRESS
-)
-
-if len(currentDetailedInfo) == 0:
-    sys.exit("""
-        This script was able to connect to Bob Swift's Atlassian Command Line Interface (ACLI), but ACLI did not return any public Confluence pages.
-        Something may be wrong with ACLI.
-        Exiting this script now.
-        Review /src/ACLIController.py:getAllConfluencePageIDs and try again.
-    """)
-    
-
-# This script will add pageIDs-pageVersions as key-value pairs to the following dict.  
-# Later on, this script will loop through this dict later, to find pages that were recently updated, and to ensure that pages in the db are currently public and accessible
-dict_currentDetailedInfo = {}
+# Pages are checked for images missing alternate text either by the Selenium instance, by a pool of Selenium instances, by parsing their HTML without a browser, or by parsing their storage format
+if KeyInfo().PAGE_SCANNER == "html":
+    pageScanner = HTMLAltTextScanner()
+elif KeyInfo().PAGE_SCANNER == "storage":
+    pageScanner = StorageFormatScanner()
+elif KeyInfo().SELENIUM_POOL_SIZE > 1:
+    # The pool's browsers are started the first time it checks pages, check every space, and are quit once the pages are checked
+    pageScanner = SeleniumPool(
+        poolSize=KeyInfo().SELENIUM_POOL_SIZE,
+        leanScanProfile=KeyInfo().SELENIUM_LEAN_SCAN_PROFILE,
+        pageLoadTimeout=KeyInfo().SELENIUM_PAGE_LOAD_TIMEOUT,
+        implicitWait=KeyInfo().SELENIUM_IMPLICIT_WAIT
+    )
+else:
+    # With one browser, the Selenium instance that's already logged in checks the pages
+    pageScanner = slmMgr
+    pageScanner.applyScanProfile(
+        leanScanProfile=KeyInfo().SELENIUM_LEAN_SCAN_PROFILE,
+        pageLoadTimeout=KeyInfo().SELENIUM_PAGE_LOAD_TIMEOUT,
+        implicitWait=KeyInfo().SELENIUM_IMPLICIT_WAIT
+    )
 
-for detailedItem in currentDetailedInfo:
-    pageID, currentVersionNum = detailedItem
-    dict_currentDetailedInfo[pageID] = currentVersionNum
+if pageScanner is not slmMgr:
+    pageScanner.logInToConfluence(
+        serverAddr=KeyInfo().CONFLUENCE_SERVER_ADDRESS, 
+        username=credsConfCoord.username, 
+        password=credsConfCoord.password
+    )
 
 if retriever.wasMajorCLItaskCompleted("GOTIDS") == "FALSE":
 
-    print(f"Number of pageIDs found in public Confluence space: {len(currentDetailedInfo)}")
-    print("Checking to see if each of these pageIDs are in the db now...")
-    
-    for index, detailedItem in enumerate(currentDetailedInfo):
-        pageID, currentVersionNum = detailedItem
-        
-        if retriever.isPageIDInDB(pageID) is False:
-            print(f"Page #{index+1} ({pageID}) wasn't in db.  Adding it now...")
-            
-            creator.addNewConfluencePageToDB(
-                versionNum=currentVersionNum, 
-                pageID=pageID
-            )
+    # Spaces whose page inventory already completed this run are skipped
+    spaceKeysToInventory = [
+        spaceKey for spaceKey in KeyInfo().CONFLUENCE_SPACE_KEYS
+        if retriever.wasSpaceTaskCompleted(spaceKey, "GOTIDS") == "FALSE"
+    ]
+
+    modifiedSinceBySpace = {}
+    reconciledCountsBySpace = {}
+    inventoryStartedAt = datetime.today().strftime("%Y-%m-%d %H:%M:%S")
+
+    # The spaces' inventories run in one unit of work, from unflagging each space's pages to logging its checkpoint.  Their chunks arrive interleaved, so if this script stops partway through (or exits because a space came back empty), none of the inventories are kept, and the next run lists every space that wasn't logged as done again.
+    with ConnectionManager().unitOfWork():
+        for spaceKey in spaceKeysToInventory:
+            # Between full page inventories, only the pages modified since the last inventory are listed
+            modifiedSinceBySpace[spaceKey] = reconciler.getIncrementalInventoryMark(spaceKey)
+            reconciledCountsBySpace[spaceKey] = {"new": 0, "changed": 0, "unchanged": 0, "removed": 0}
+
+            if modifiedSinceBySpace[spaceKey] is None:
+                print(f"Getting all current pageIDs from Confluence space {spaceKey} now...")
+            else:
+                print(f"Getting pageIDs of pages in Confluence space {spaceKey} modified since {modifiedSinceBySpace[spaceKey]} now...")
 
-            # Technically speaking, when a pageID is added to the db, that counts as a recent update too.  Calling this method and passing "TRUE" ensures that newly added pages get checked for missing alternate text when they're added to the db 
-            updater.updateWasPageRecentlyUpdated(
-                pageID=pageID, 
-                value="TRUE"
+            reconciler.beginPageInventory(
+                spaceKey=spaceKey,
+                isFullInventory=modifiedSinceBySpace[spaceKey] is None
             )
 
-        else:
-            print(f"Page #{index+1} ({pageID}) was already in db.")
-
-            if (
-                pageID in dict_currentDetailedInfo.keys() 
-                and int(currentVersionNum) > int(retriever.getOldPageVersion(pageID))
-            ):
-                
-                print(f"Page #{index+1} ({pageID}) has recently been updated.  Updating db now...")
-                
-                updater.updateOldPageVersion(
-                    pageID=pageID, 
-                    newPageVersion=dict_currentDetailedInfo[pageID]
-                )
-
-                updater.updateWasPageRecentlyUpdated(
-                    pageID=pageID, 
-                    value="TRUE"
-                )
+        # Every space is listed at the same time, and each space's pageIDs-pageVersions are reconciled with the db KeyInfo().PAGE_INVENTORY_CHUNK_SIZE pages at a time, so no inventory is ever held in memory
+        for spaceKey, chunk in acli.streamPageIDChunksForSpaces(
+            username=credsConfCoord.username, 
+            password=credsConfCoord.password,
+            serverAddr=KeyInfo().CONFLUENCE_SERVER_ADDRESS,
+            spaceKeys=spaceKeysToInventory,
+            modifiedSinceBySpace=modifiedSinceBySpace,
+            chunkSize=KeyInfo().PAGE_INVENTORY_CHUNK_SIZE
+        ):
+            reconciledCounts = reconciledCountsBySpace[spaceKey]
+
+            if chunk:
+                for countName, count in reconciler.reconcilePageInventoryChunk(chunk, spaceKey=spaceKey).items():
+                    reconciledCounts[countName] += count
+
+                continue
+
+            isFullInventory = modifiedSinceBySpace[spaceKey] is None
+            numCurrentPages = reconciledCounts["new"] + reconciledCounts["changed"] + reconciledCounts["unchanged"]
+
+            if isFullInventory and numCurrentPages == 0:
+                sys.exit(f"""
+                    This script was able to connect to Bob Swift's Atlassian Command Line Interface (ACLI), but ACLI did not return any pages in Confluence space {spaceKey}.
+                    Something may be wrong with ACLI, or with KeyInfo().CONFLUENCE_SPACE_KEYS.
+                    Exiting this script now.
+                    Review /src/ACLIController.py:streamAllConfluencePageIDs and try again.
+                """)
+
+            reconciledCounts["removed"] = reconciler.finishPageInventory(
+                spaceKey=spaceKey,
+                isFullInventory=isFullInventory,
+                numCurrentPages=numCurrentPages
+            )
 
-            elif pageID not in dict_currentDetailedInfo.keys():
-                print(f"Page #{index+1} ({pageID}) is no longer public.  Removing it from db now...")
-                deleter.removePageIDfromAllConfluencePagesTable(pageID)
+            updater.updatePageInventoryMark(
+                inventoryMode="full" if isFullInventory else "incremental",
+                dateLastCompleted=inventoryStartedAt,
+                spaceKey=spaceKey
+            )
 
-            else:
-                print(f"Page #{index+1} ({pageID}) hasn't been updated recently.  So this CLI will not check this page for missing alternate text...")
+            updater.changeSpaceTasksLogValue(
+                spaceKey=spaceKey,
+                value="TRUE", 
+                dbCode="GOTIDS"
+            )
 
-        updater.updateWasPageCheckedThisRun(
-            pageID=pageID, 
-            value="TRUE")
+            print(f"\nConfluence space {spaceKey}:")
+            print(f"Number of pageIDs found in Confluence space: {numCurrentPages}")
+            print(f"Number of pages that weren't in db and were added: {reconciledCounts['new']}")
+            print(f"Number of pages that have recently been updated: {reconciledCounts['changed']}")
+            print(f"Number of pages that haven't been updated recently: {reconciledCounts['unchanged']}")
+            print(f"Number of pages that are no longer in the space and were removed from db: {reconciledCounts['removed']}")
 
     updater.changeCLIMajorTasksLogValue(
         value="TRUE", 
         dbCode="GOTIDS"
     )
 
-if retriever.wasMajorCLItaskCompleted("PAGESCHECKED") == "FALSE":
-    
-    print("Gathering pageIDs to check for images missing alternate text now...")
-
-    allPageIDsFromDB = retriever.getPageIDsToCheck()
-
-    allPageIDsPublic = []
+try:
+    if retriever.wasMajorCLItaskCompleted("PAGESCHECKED") == "FALSE":
 
-    for pageID in allPageIDsFromDB:
-        if pageID in dict_currentDetailedInfo.keys():
-            allPageIDsPublic.append(pageID)
-    
-    print(f"Getting ready to check {len(allPageIDsPublic)} pages for missing alternate text now...")
+        # Each space's pages are checked in their own unit of work, so a space that was fully checked stays checked if this script stops partway through another space
+        for spaceKey in KeyInfo().CONFLUENCE_SPACE_KEYS:
+            if retriever.wasSpaceTaskCompleted(spaceKey, "PAGESCHECKED") == "TRUE":
+                continue
 
-    for index, pageID in enumerate(allPageIDsPublic):
-        print(f"\nChecking page #{index+1} ({pageID}) for alternate text now...")
+            print(f"Gathering pageIDs in Confluence space {spaceKey} to check for images missing alternate text now...")
 
-        imagesNamesLinks, pageName = slmMgr.getImagesMisssingAltText(
-            baseLink=(
-                KeyInfo().CONFLUENCE_SERVER_ADDRESS + 
-                KeyInfo().SUB_LINK_VIEW_CONFLUENCE_PAGE
-            ), 
-            pageID=pageID
-        )
+            # Pages that are no longer public are removed from the db by a full page inventory, or when they're checked below
+            allPageIDsPublic = retriever.getPageIDsToCheck(spaceKey)
         
-        if imagesNamesLinks:
-            print(f"Page #{index+1} ({pageID}) has images missing alternate text")
-            
-            creator.addConfluencePageMissingAltText(
-                pageID=pageID, 
-                pageName=pageName, 
-                imageNamesLinks=str(imagesNamesLinks)
-            )
-
-        else:
-            print(f"Page #{index+1} ({pageID}) either has no images, or all images have alternate text")
+            print(f"Getting ready to check {len(allPageIDsPublic)} pages for missing alternate text now...")
+
+            with ConnectionManager().unitOfWork():
+                pageScanResults = pageScanner.scanPages(
+                    baseLink=(
+                        KeyInfo().CONFLUENCE_SERVER_ADDRESS + 
+                        KeyInfo().SUB_LINK_VIEW_CONFLUENCE_PAGE
+                    ), 
+                    pageIDs=allPageIDsPublic
+                )
 
-            deleter.removePageIDfromMissingAltTextTable(pageID)
+                for index, (pageID, imagesNamesLinks, pageName) in enumerate(pageScanResults):
+                    # Every page scanner only returns no page name on a positive signal that the page is gone (a 404 or 403, or a successful search that left the page out), and raises if a page couldn't be read
+                    if pageName is None:
+                        print(f"Page #{index+1} ({pageID}) is no longer public, and was removed from db")
 
-    updater.changeCLIMajorTasksLogValue(
-        value="TRUE", 
-        dbCode="PAGESCHECKED"
-    )
-    
-print("Getting pageIDs of pages missing alternate text...")
-pageIDs = retriever.getPageIDsMissingAltTextFromDB()
+                        deleter.removePageIDfromAllConfluencePagesTable(pageID)
 
-print(f"Number of pageIDs found: {len(pageIDs)}")
+                    elif imagesNamesLinks:
+                        print(f"Page #{index+1} ({pageID}) has images missing alternate text")
+                
+                        creator.addConfluencePageMissingAltText(
+                            pageID=pageID, 
+                            pageName=pageName, 
+                            imageNamesLinks=imagesNamesLinks
+                        )
 
-print("Gathering recent authors for all pages missing alternate text...")
+                    else:
+                        print(f"Page #{index+1} ({pageID}) either has no images, or all images have alternate text")
 
-for index, pageID in enumerate(pageIDs):
-    print(f"Getting recent authors for page #{index+1} ({pageID}) and adding them to db now...")
+                        deleter.removePageIDfromMissingAltTextTable(pageID)
 
-    recentAuthors = acli.getRecentAuthors(
-        username=credsConfCoord.username, 
-        password=credsConfCoord.password, 
-        serverAddr=KeyInfo().CONFLUENCE_SERVER_ADDRESS, 
-        pageID=pageID
-    )
+                updater.changeSpaceTasksLogValue(
+                    spaceKey=spaceKey,
+                    value="TRUE", 
+                    dbCode="PAGESCHECKED"
+                )
 
-    for author_t in recentAuthors:
-        username, fullname = author_t
-        creator.addAuthorToDB(
-            pageID=pageID, 
-            username=username, 
-            fullname=fullname
+        updater.changeCLIMajorTasksLogValue(
+            value="TRUE", 
+            dbCode="PAGESCHECKED"
         )
-
-print("Getting the author's usernames now, in order to find their email addresses")
-
-usernames = retriever.getAuthorsUsernames()
-
-print(f"Number of usernames found: {len(usernames)}")
-print("Finding the authors' email addresses now...")
-
-for index, username in enumerate(usernames):
-    print(f"Finding the email address for author #{index+1} ({username}) now and pushing it (or a placeholder) to the db now...")
-
-    address = slmMgr.getEmailAddressFromConfluence(
-        username=username, 
-        baseLink=(
-            KeyInfo().CONFLUENCE_SERVER_ADDRESS +
-            KeyInfo().SUB_LINK_AUTHOR_PAGE
-        )
-    )
-
-    updater.addAuthorEmailToDB(
-        username=username, 
-        address=address
-    )
+finally:
+    # The pool's browsers are quit however the pages' checks ended
+    if isinstance(pageScanner, SeleniumPool):
+        pageScanner.close()
 
 print("Getting email addresses of some VIPs (departmental members) now...")
 
@@ -243,13 +267,6 @@ if len(VIPsInDept) == 0:
 
 print(f"Number of email addresses for VIPs in department found: {len(VIPsInDept)}")
 
-print("Removing these VIPs from db now...")
-for index, email in enumerate(VIPsInDept):
-    print(f"Removing VIP address #{index+1} ({email}) now...")
-    deleter.removeAuthorFromDB(
-        email=email
-    )
-
 print("Logging in to your assigned organizational Gmail account now...")
 
 while True:
@@ -278,12 +295,121 @@ if len(VIPsInOrg) == 0:
 
 print(f"Number of usernames for VIPs in other departments found: {len(VIPsInOrg)}")
 
-print("Removing these VIPs from db now...")
-for index, username in enumerate(VIPsInOrg):
-    print(f"Removing VIP username #{index+1} ({username}) now...")
-    deleter.removeAuthorFromDB(
-        username=username
-    )
+# VIPs, service accounts, and authors whose address was never found are excluded before they're written to the db or their email address is looked up
+updater.replaceExcludedAuthors(
+    reason="VIP",
+    usernames=VIPsInOrg,
+    emails=VIPsInDept
+)
+
+excludedAuthors = retriever.getExcludedAuthors()
+
+print(f"Number of excluded usernames: {len(excludedAuthors['usernames'])}")
+print(f"Number of excluded email addresses: {len(excludedAuthors['emails'])}")
+
+print("Removing excluded authors that are still in db from previous runs now...")
+removedCounts = deleter.removeAuthorsFromDB(
+    usernames=excludedAuthors["usernames"],
+    emails=excludedAuthors["emails"]
+)
+print(f"Number of excluded authors removed from db: {removedCounts['authors']}")
+print(f"Number of page assignments removed along with them: {removedCounts['assignments']}")
+
+print("Getting pageIDs of pages missing alternate text...")
+pageIDs = retriever.getPageIDsMissingAltTextFromDB()
+
+print(f"Number of pageIDs found: {len(pageIDs)}")
+
+print("Gathering recent authors for all pages missing alternate text...")
+
+# A page's content history is only fetched when its version has changed since the history was cached.  
+# Otherwise, the recent authors are worked out from the cached revisions.
+cachedRevisions = retriever.getCachedRevisions(pageIDs)
+uncachedPageIDs = [pageID for pageID in pageIDs if pageID not in cachedRevisions]
+
+print(f"Number of pages with cached content histories: {len(cachedRevisions)}")
+print(f"Number of pages whose content histories will be fetched: {len(uncachedPageIDs)}")
+
+with ConnectionManager().unitOfWork():
+    # The uncached pages' content histories are fetched in batches, by up to ACLIController.ACLI_MAX_WORKERS workers running in parallel (ACLI processes, or keep-alive REST connections).  Each batch is cached as soon as it completes.
+    for pageID, revisions in acli.getRevisionsForPages(
+        username=credsConfCoord.username, 
+        password=credsConfCoord.password, 
+        serverAddr=KeyInfo().CONFLUENCE_SERVER_ADDRESS, 
+        pageIDs=uncachedPageIDs
+    ):
+        creator.addCachedRevisions(
+            pageID=pageID,
+            revisions=revisions
+        )
+
+        cachedRevisions[pageID] = revisions
+
+    for index, (pageID, revisions) in enumerate(cachedRevisions.items()):
+        print(f"Adding recent authors for page #{index+1} ({pageID}) to db now...")
+
+        recentAuthors = acli.getRecentAuthorsFromRevisions(revisions)
+
+        for author_t in recentAuthors:
+            username, fullname = author_t
+
+            if username in excludedAuthors["usernames"] or fullname in excludedAuthors["fullnames"]:
+                continue
+
+            creator.addAuthorToDB(
+                pageID=pageID, 
+                username=username, 
+                fullname=fullname
+            )
+
+print("Getting the author's usernames now, in order to find their email addresses")
+
+usernames = retriever.getAuthorsUsernames()
+
+print(f"Number of usernames found: {len(usernames)}")
+print("Finding the authors' email addresses now...")
+
+newlyExcludedUsernames = []
+
+with ConnectionManager().unitOfWork():
+    for index, username in enumerate(usernames):
+        print(f"Finding the email address for author #{index+1} ({username}) now and pushing it (or a placeholder) to the db now...")
+
+        address = slmMgr.getEmailAddressFromConfluence(
+            username=username, 
+            baseLink=(
+                KeyInfo().CONFLUENCE_SERVER_ADDRESS +
+                KeyInfo().SUB_LINK_AUTHOR_PAGE
+            )
+        )
+
+        # Remember who this address belongs to, so that this author is skipped before the lookup next time
+        if address in excludedAuthors["emails"]:
+            updater.resolveExcludedEmail(
+                email=address,
+                username=username
+            )
+            newlyExcludedUsernames.append(username)
+            continue
+
+        if address == "Address not found":
+            creator.addExcludedAuthor(
+                identifierType="username",
+                identifier=username,
+                reason="address not found"
+            )
+            newlyExcludedUsernames.append(username)
+            continue
+
+        updater.addAuthorEmailToDB(
+            username=username, 
+            address=address
+        )
+
+print("Removing newly excluded authors from db now...")
+removedCounts = deleter.removeAuthorsFromDB(usernames=newlyExcludedUsernames)
+print(f"Number of newly excluded authors removed from db: {removedCounts['authors']}")
+print(f"Number of page assignments removed along with them: {removedCounts['assignments']}")
 
 print("Removing inactive authors from db now...")
 
@@ -297,13 +423,14 @@ deleter.unassignAuthorsFromStalePageIDs()
 
 print("Adding Confluence Coordinators to db now...")
 
-for author_t in KeyInfo().CONFLUENCE_COORDINATORS_INFO:
-    username, email, fullname = author_t
-    creator.addConfluenceCoordinatorToDB(
-        username=username, 
-        email=email,
-        fullname=fullname
-    )
+with ConnectionManager().unitOfWork():
+    for author_t in KeyInfo().CONFLUENCE_COORDINATORS_INFO:
+        username, email, fullname = author_t
+        creator.addConfluenceCoordinatorToDB(
+            username=username, 
+            email=email,
+            fullname=fullname
+        )
 
 print("Assigning pages with no recent authors to Confluence Coordinators now...")
 
@@ -311,33 +438,23 @@ pageIDsMissingAltText = retriever.getPageIDsMissingAltTextFromDB()
 
 print(f"Number of pages with images missing alternate text: {len(pageIDsMissingAltText)}")
 
-for index, pageID in enumerate(pageIDsMissingAltText):
-    print(f"Checking page #{index+1} ({pageID}) now...")
-    if retriever.doesPageHaveRecentAuthor(pageID) is False:
-        creator.assignPageIDtoConfluenceCoordinators(
-            pageID=pageID, 
-            ConfluenceCoordinators=KeyInfo().CONFLUENCE_COORDINATORS_INFO
-        )
+with ConnectionManager().unitOfWork():
+    for index, pageID in enumerate(pageIDsMissingAltText):
+        print(f"Checking page #{index+1} ({pageID}) now...")
+        if retriever.doesPageHaveRecentAuthor(pageID) is False:
+            creator.assignPageIDtoConfluenceCoordinators(
+                pageID=pageID, 
+                ConfluenceCoordinators=KeyInfo().CONFLUENCE_COORDINATORS_INFO
+            )
 
 print("Building individualized emails to the Confluence authors now...")    
-print("Getting usernames of all authors who are assigned to update Confluence pages with images missing alternate text...")
-
-usernames = retriever.getRecentAuthorsForAllPagesMissingAltText()
-
-pairings_usernames_pageIDs = retriever.pairUsernamesWithPageIDsImagesMissingAltText(usernames)
+print("Getting all authors who are assigned to update Confluence pages with images missing alternate text, along with their pages...")
 
 messages = {}
 
-print(f"Number of individual messages to generate: {len(pairings_usernames_pageIDs)}")
-
-for index, (username, pageIDs) in enumerate(pairings_usernames_pageIDs.items()):
+for index, (username, fullname, email, bundles_pageIDs) in enumerate(retriever.getNotificationDigests()):
     print(f"Generating message #{index+1} for {username} now...")
 
-    fullname = retriever.getFullName(username)
-    email = retriever.getEmail(username)
-
-    bundles_pageIDs = [{pageID : retriever.getImagesBundle(pageID)} for pageID in pageIDs]
-    
     msgBldr = MessageBuilder()
     
     customMsg = msgBldr.buildHTMLmessage(
@@ -354,6 +471,8 @@ for index, (username, pageIDs) in enumerate(pairings_usernames_pageIDs.items()):
 
     messages[email] = customMsg
 
+print(f"Number of individual messages generated: {len(messages)}")
+
 if retriever.wasMajorCLItaskCompleted("SENTMSGS") == "FALSE":
     print("Provide the credentials for the departmental Gmail account now.")
     print("Be sure to provide the app password for this account (not the main password).")
@@ -382,3 +501,5 @@ print("Summary:")
 print(f"Number of pages that have images with missing alternate text: {len(pageIDsMissingAltText)}")
 print(f"Number of pages that have been missing this alternate text for 30+ days: {retriever.getNumberOfStalePages()}")
 print(f"Number of authors that have been notified about this missing text: {len(messages)}")
+
+ConnectionManager().closeConnection()
\ No newline at end of file
@@ -3,8 +3,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
+from selenium.common.exceptions import WebDriverException
+import json
 import sys
-from time import sleep
+from time import perf_counter, sleep
 
 class SeleniumManager:
     """Uses the Selenium module to get the page source of Confluence pages
@@ -16,6 +19,27 @@ class SeleniumManager:
 
     chrome_options (class) : Options
         Necessary to add arguments to pass to the driver attribute
+
+    implicitWait (class) : Integer
+        The seconds that the driver waits for an element to appear, before giving up.  startOwnDriver can change it for one SeleniumManager.
+
+    SCAN_BLOCKED_URLS (class) : List
+        URL patterns that a lean scan profile's browser never requests (fonts, stylesheets, media, and analytics).  None of them change the attributes that findImagesMissingAltText reads.
+
+    DOM_EXTRACTION_MODE (class) : String
+        How findImagesMissingAltText reads the images and page title from a loaded page.  Either "script" (one execute_script call that returns everything as JSON) or "elements" (a WebDriver call per attribute of each image, which is over 600 calls for a page with 200 images).
+
+    DOM_EXTRACTION_SCRIPT (class) : String
+        The JavaScript that the "script" mode runs.  It reads each attribute the way get_attribute does, so both modes return the same results.
+
+    RESPONSE_STATUS_SCRIPT (class) : String
+        The JavaScript that returns the HTTP status of the loaded page, from the Navigation Timing API.  Returns null if the browser doesn't report it (Chrome 108 and earlier).
+
+    MAX_ATTEMPTS_PER_PAGE (class) : Integer
+        The number of times getImagesMisssingAltText tries a page, restarting the browser in between, before it gives up
+
+    lastPageTimings : Tuple
+        Two-item tuple of the seconds that findImagesMissingAltText spent loading the last page, and reading its images and title
     
     
     Methods
@@ -23,6 +47,30 @@ class SeleniumManager:
     getImagesMisssingAltText(baseLink, pageID)
         Receives a pageID, then identifies images on the Confluence page that are missing alternate text, and then returns a tuple of detailed information about the page and its images
 
+    findImagesMissingAltText(baseLink, pageID)
+        Receives a pageID, and returns the images on the Confluence page that are missing alternate text, the page name, and the number of images, without printing anything
+
+    findImagesMissingAltTextWithRetries(baseLink, pageID, maxAttempts)
+        Runs findImagesMissingAltText, and tries the page again on a restarted browser if it fails
+
+    scanPages(baseLink, pageIDs)
+        Receives pageIDs, and yields detailed information about each page and its images missing alternate text, one page at a time
+
+    startOwnDriver(leanScanProfile, pageLoadTimeout, implicitWait)
+        Starts a headless Chrome instance for this SeleniumManager only, instead of the one that every SeleniumManager shares
+
+    applyScanProfile(leanScanProfile, pageLoadTimeout, implicitWait)
+        Applies the settings for checking pages to the browser that's already running
+
+    restartDriver()
+        Quits this SeleniumManager's browser, and starts and logs in a new one with the same settings
+
+    isDriverResponsive()
+        Checks that this SeleniumManager's Chrome instance still answers commands
+
+    quitDriver()
+        Quits this SeleniumManager's own Chrome instance
+
     logInToConfluence(serverAddr, username, password)
         Receives the user's login credentials and logs the Selenium instance that this Python script uses into Confluence
 
@@ -44,8 +92,53 @@ class SeleniumManager:
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--start-maximized")
+    implicitWait = 5
     driver = webdriver.Chrome(chrome_options=chrome_options)
-    driver.implicitly_wait(5)
+    driver.implicitly_wait(implicitWait)
+
+    SCAN_BLOCKED_URLS = [
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+        "*.css", "*.css?*",
+        "*.mp4", "*.webm", "*.mov",
+        "*/rest/analytics/*", "*google-analytics.com/*", "*googletagmanager.com/*"
+    ]
+
+    DOM_EXTRACTION_MODE = "script"
+
+    # get_attribute reads the element's property when it has one, and the HTML attribute otherwise.  An img's src is the exception: only a non-empty src is read from the property (the absolute URL), so an empty src reads as "", and a missing one as null.
+    DOM_EXTRACTION_SCRIPT = """
+        var getAttribute = function (element, name) {
+            if (name === "src" && element.tagName === "IMG") {
+                return element.getAttribute("src") ? element.src : element.getAttribute("src");
+            }
+            return (name in element) ? element[name] : element.getAttribute(name);
+        };
+        var imgElements = document.getElementsByClassName("confluence-embedded-image");
+        var imagesMissingAltText = [];
+        for (var i = 0; i < imgElements.length; i++) {
+            if (getAttribute(imgElements[i], "alt") === "") {
+                imagesMissingAltText.push([
+                    getAttribute(imgElements[i], "src"),
+                    imgElements[i].getAttribute("data-linked-resource-default-alias")
+                ]);
+            }
+        }
+        var pageTitleElement = document.querySelector('meta[name="ajs-page-title"]');
+        var navigationEntries = performance.getEntriesByType("navigation");
+        return JSON.stringify({
+            numImages: imgElements.length,
+            imagesMissingAltText: imagesMissingAltText,
+            pageName: pageTitleElement ? getAttribute(pageTitleElement, "content") : null,
+            responseStatus: (navigationEntries.length && navigationEntries[0].responseStatus) || null
+        });
+    """
+
+    RESPONSE_STATUS_SCRIPT = """
+        var navigationEntries = performance.getEntriesByType("navigation");
+        return (navigationEntries.length && navigationEntries[0].responseStatus) || null;
+    """
+
+    MAX_ATTEMPTS_PER_PAGE = 2
     
     def __init__(self):
         """
@@ -54,6 +147,12 @@ class SeleniumManager:
         None
         """
 
+        self.lastPageTimings = (0.0, 0.0)
+        self._scanProfile = {"leanScanProfile": False, "pageLoadTimeout": None, "implicitWait": self.implicitWait}
+        self._serverAddr = None
+        self._username = None
+        self._password = None
+
     def __repr__(self):
         return f'SeleniumManager()'
 
@@ -74,47 +173,312 @@ class SeleniumManager:
         Tuple
             A two item tuple
             - The first item is a dict of key-value pairs of links to images and the image names.  Will return an empty dict if either the page has no images, or all images have alernate text.
-            - The second item is the page name.
+            - The second item is the page name.  Will be None if the page no longer exists or isn't public.
         """
-    
+
+        imagesNamesLinks, pageName, numImages = self.findImagesMissingAltTextWithRetries(baseLink, pageID, self.MAX_ATTEMPTS_PER_PAGE)
+
+        print(f"\tNumber of images found: {numImages}")
+        print(f"\tNumber of images that have alternate text: {numImages-len(imagesNamesLinks)}")
+        print(f"\tNumber of images that are missing alternate text: {len(imagesNamesLinks)}")
+        print(f"\tPage loaded in {self.lastPageTimings[0]:.3f}s, images read in {self.lastPageTimings[1]:.3f}s ({self.DOM_EXTRACTION_MODE} mode)")
+
+        return (imagesNamesLinks, pageName)
+
+    def findImagesMissingAltText(self, baseLink, pageID):
+        """
+        Receives a pageID, and returns the images on the Confluence page that are missing alternate text, the page name, and the number of images, without printing anything
+
+        A page only counts as no longer existing or not public if Confluence answered it with a 404 or a 403.  Raises a RuntimeError for any other error status, and for a page without a page title (e.g. a login page that an expired session redirected to), so a page that couldn't be read is never taken for a removed page.
+
+        Parameters
+        ----------
+        baseLink : String
+            The base link for a Confluence page.  Will look something like "https://confluence.xyz.com/pages/viewpage.action?pageId="
+
+        pageID : String
+            The unique ID for a Confluence page
+
+        Returns
+        ----------
+        Tuple
+            A three item tuple
+            - The first item is a dict of key-value pairs of links to images and the image names, as getImagesMisssingAltText returns it.
+            - The second item is the page name.  Will be None if the page no longer exists or isn't public.
+            - The third item is the number of images found on the page.
+        """
+
+        startTime = perf_counter()
+
         self.driver.get(baseLink+pageID)
-        self.driver.implicitly_wait(0)
 
-        imgElements = []
+        loadedTime = perf_counter()
+
         imagesNamesLinks = {}
 
-        try:
-            imgElements = self.driver.find_elements(
-                By.CLASS_NAME,
-                "confluence-embedded-image"
+        if self.DOM_EXTRACTION_MODE == "script":
+            pageInfo = json.loads(self.driver.execute_script(self.DOM_EXTRACTION_SCRIPT))
+
+            for imageLink, imageName in pageInfo["imagesMissingAltText"]:
+                imagesNamesLinks[imageLink] = imageName
+
+            pageName = pageInfo["pageName"]
+            numImages = pageInfo["numImages"]
+            responseStatus = pageInfo["responseStatus"]
+        else:
+            self.driver.implicitly_wait(0)
+
+            imgElements = []
+
+            try:
+                imgElements = self.driver.find_elements(
+                    By.CLASS_NAME,
+                    "confluence-embedded-image"
+                )
+            except:
+                pass
+
+            for imgElement in imgElements:
+                if imgElement.get_attribute("alt") == "":
+                    imagesNamesLinks[
+                        imgElement.get_attribute("src")
+                    ] = imgElement.get_attribute("data-linked-resource-default-alias")
+
+            pageTitleElements = self.driver.find_elements(
+                By.CSS_SELECTOR,
+                "meta[name=\"ajs-page-title\"]"
             )
-        except:
-            pass
 
-        print(f"\tNumber of images found: {len(imgElements)}")
+            pageName = pageTitleElements[0].get_attribute("content") if pageTitleElements else None
+            numImages = len(imgElements)
+            responseStatus = self.driver.execute_script(self.RESPONSE_STATUS_SCRIPT)
 
-        for imgElement in imgElements:
-            if imgElement.get_attribute("alt") == "":
-                imagesNamesLinks[
-                    imgElement.get_attribute("src")
-                ] = imgElement.get_attribute("data-linked-resource-default-alias")
+            self.driver.implicitly_wait(self.implicitWait)
 
-        print(f"\tNumber of images that have alternate text: {len(imgElements)-len(imagesNamesLinks)}")
-        
-        print(f"\tNumber of images that are missing alternate text: {len(imagesNamesLinks)}")
+        self.lastPageTimings = (loadedTime - startTime, perf_counter() - loadedTime)
 
-        pageName = self.driver.find_element(
-            By.CSS_SELECTOR,
-            "meta[name=\"ajs-page-title\"]"
-        ).get_attribute("content")
+        # Confluence answers a deleted page with a 404, and a page the user can't view with a 403
+        if responseStatus in (403, 404):
+            return ({}, None, 0)
 
-        self.driver.implicitly_wait(5)
+        if responseStatus is not None and not 200 <= responseStatus < 300:
+            raise RuntimeError(f"Loading page {pageID} failed with HTTP status {responseStatus}")
 
-        return (imagesNamesLinks, pageName)
+        if pageName is None:
+            raise RuntimeError(f"Page {pageID} has no page title, so it isn't a Confluence page (it may be a login or error page)")
+
+        return (imagesNamesLinks, pageName, numImages)
+
+    def findImagesMissingAltTextWithRetries(self, baseLink, pageID, maxAttempts=2):
+        """
+        Runs findImagesMissingAltText, and tries the page again on a restarted browser if it fails
+
+        A page that timed out, or that couldn't be read (e.g. because the session expired and the browser landed on a login page), can leave the browser in a bad state even though it still answers commands.  So the browser is always restarted and logged in again before the page is tried again.
+
+        Parameters
+        ----------
+        baseLink : String
+            The base link for a Confluence page.  Will look something like "https://confluence.xyz.com/pages/viewpage.action?pageId="
+
+        pageID : String
+            The unique ID for a Confluence page
+
+        maxAttempts (optional) : Integer
+            The number of times the page is tried.  The last attempt's error is raised.
+
+        Returns
+        ----------
+        Tuple
+            The three items that findImagesMissingAltText returns
+        """
+
+        for attempt in range(maxAttempts):
+            try:
+                return self.findImagesMissingAltText(baseLink, pageID)
+            except (WebDriverException, RuntimeError) as error:
+                if attempt == maxAttempts - 1:
+                    raise
+
+                print(f"\tChecking page {pageID} failed ({type(error).__name__}).  Restarting the browser and trying again.")
+
+                self.restartDriver()
+
+    def scanPages(self, baseLink, pageIDs):
+        """
+        Receives pageIDs, and yields detailed information about each page and its images missing alternate text, one page at a time
+
+        Parameters
+        ----------
+        baseLink : String
+            The base link for a Confluence page.  Will look something like "https://confluence.xyz.com/pages/viewpage.action?pageId="
+
+        pageIDs : List
+            The unique IDs of Confluence pages
+
+        Returns
+        ----------
+        Generator
+            Yields three-item tuples of a pageID, and the two items that getImagesMisssingAltText returns for the page
+        """
+
+        for index, pageID in enumerate(pageIDs):
+            print(f"\nChecking page #{index+1} ({pageID}) for alternate text now...")
+
+            yield (pageID, *self.getImagesMisssingAltText(baseLink, pageID))
+
+    def startOwnDriver(self, leanScanProfile=False, pageLoadTimeout=None, implicitWait=5):
+        """
+        Starts a headless Chrome instance for this SeleniumManager only, instead of the one that every SeleniumManager shares
+
+        Used by SeleniumPool, so each of its workers drives its own browser, and by restartDriver.  The new instance has to be logged in to Confluence separately.
+
+        A lean scan profile only downloads what findImagesMissingAltText needs to read the page.  Pages count as loaded once their HTML is parsed (the "eager" page load strategy), images aren't loaded, and nothing matching SCAN_BLOCKED_URLS is requested.  The images' attributes are in the page's HTML, so the results are the same.
+
+        Parameters
+        ----------
+        leanScanProfile (optional) : Boolean
+            True to start the browser with the lean scan profile
+
+        pageLoadTimeout (optional) : Integer
+            The most seconds a page may take to load, before driver.get raises a TimeoutException.  No limit if not given.
+
+        implicitWait (optional) : Integer
+            The seconds that the driver waits for an element to appear, before giving up
+
+        Returns
+        ----------
+        None
+        """
+
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--start-maximized")
+
+        capabilities = DesiredCapabilities.CHROME.copy()
+
+        if leanScanProfile:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            capabilities["pageLoadStrategy"] = "eager"
+
+        self.driver = webdriver.Chrome(chrome_options=chrome_options, desired_capabilities=capabilities)
+
+        self.applyScanProfile(
+            leanScanProfile=leanScanProfile,
+            pageLoadTimeout=pageLoadTimeout,
+            implicitWait=implicitWait
+        )
+
+    def applyScanProfile(self, leanScanProfile=False, pageLoadTimeout=None, implicitWait=5):
+        """
+        Applies the settings for checking pages to the browser that's already running
+
+        Lets the browser that's already logged in check the pages, instead of starting another one.  A running browser can only block SCAN_BLOCKED_URLS.  It still loads images, and waits for each whole page to load.  The settings are kept, and a browser that restartDriver starts gets the whole lean scan profile.
+
+        Parameters
+        ----------
+        leanScanProfile (optional) : Boolean
+            True to block the requests for SCAN_BLOCKED_URLS
+
+        pageLoadTimeout (optional) : Integer
+            The most seconds a page may take to load, before driver.get raises a TimeoutException.  No limit if not given.
+
+        implicitWait (optional) : Integer
+            The seconds that the driver waits for an element to appear, before giving up
+
+        Returns
+        ----------
+        None
+        """
+
+        if leanScanProfile:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.SCAN_BLOCKED_URLS})
+
+        if pageLoadTimeout is not None:
+            self.driver.set_page_load_timeout(pageLoadTimeout)
+
+        self.implicitWait = implicitWait
+        self.driver.implicitly_wait(self.implicitWait)
+
+        self._scanProfile = {"leanScanProfile": leanScanProfile, "pageLoadTimeout": pageLoadTimeout, "implicitWait": implicitWait}
+
+    def restartDriver(self):
+        """
+        Quits this SeleniumManager's browser, and starts and logs in a new one with the same settings
+
+        If this SeleniumManager was using the Chrome instance that every SeleniumManager shares, that instance is left running, and this SeleniumManager gets its own from then on.  The old browser is only quit once the new one has started, so a browser that fails to start leaves the old one in place, to be restarted again after the next failure.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        None
+        """
+
+        oldDriver = self.__dict__.get("driver")
+
+        self.startOwnDriver(**self._scanProfile)
+
+        if oldDriver is not None:
+            try:
+                oldDriver.quit()
+            except WebDriverException:
+                pass
+
+        self.logInToConfluence(
+            serverAddr=self._serverAddr,
+            username=self._username,
+            password=self._password
+        )
+
+    def isDriverResponsive(self):
+        """
+        Checks that this SeleniumManager's Chrome instance still answers commands
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        Boolean
+            True if the browser ran a trivial script, False if it crashed, hung up, or was closed
+        """
+
+        try:
+            return self.driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+
+    def quitDriver(self):
+        """
+        Quits this SeleniumManager's own Chrome instance.  The Chrome instance that every SeleniumManager shares is left running.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        None
+        """
+
+        if "driver" not in self.__dict__:
+            return
+
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+        del self.driver
 
     def logInToConfluence(self, serverAddr, username, password):
         """
-        Receives the user's login credentials and logs the Selenium instance that this Python script uses into Confluence
+        Receives the user's login credentials and logs the Selenium instance that this Python script uses into Confluence.  The credentials are kept, so that restartDriver can log in a restarted browser.
     
         Parameters
         ----------
@@ -131,6 +495,10 @@ class SeleniumManager:
         ----------
         None
         """
+
+        self._serverAddr = serverAddr
+        self._username = username
+        self._password = password
     
         self.driver.get(serverAddr)
         
@@ -188,7 +556,7 @@ class SeleniumManager:
         except:
             address = "Address not found"
 
-        self.driver.implicitly_wait(5)
+        self.driver.implicitly_wait(self.implicitWait)
         
         return address
 
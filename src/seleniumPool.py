@@ -0,0 +1,321 @@
+import queue
+import threading
+from seleniumManager import SeleniumManager
+
+class SeleniumPool:
+    """Checks Confluence pages for images missing alternate text with several headless Chrome instances at once.  A drop-in alternative to SeleniumManager.scanPages.
+
+    Each worker thread owns a SeleniumManager with its own Chrome instance, logged in to Confluence with logInToConfluence.  The workers and their browsers are started the first time the pool checks pages, and are kept for every later call to scanPages, until close is called.  The workers take pages from a shared work queue, and put each scan's results on that scan's results queue.  Only the thread that iterates scanPages touches the db.  It writes the results back through the record handlers, inside that space's unit of work, so the writes are committed in one batch.
+
+    A worker checks that its browser still answers every HEALTH_CHECK_INTERVAL pages, and restarts an unresponsive browser.  A page that fails (e.g. it times out, or the browser lands on a login page) is tried again on a restarted browser (see SeleniumManager.findImagesMissingAltTextWithRetries).  A page that fails on the restarted browser as well stops the scan, and the error is raised by scanPages.
+
+    Attributes
+    ----------
+    HEALTH_CHECK_INTERVAL (class) : Integer
+        The number of pages a worker checks between health checks of its browser
+
+    MAX_ATTEMPTS_PER_PAGE (class) : Integer
+        The number of times a page is tried, restarting the worker's browser in between, before the scan stops
+
+    poolSize : Integer
+        The number of Chrome instances that check pages at the same time
+
+    leanScanProfile : Boolean
+        True if the workers' browsers use the lean scan profile (see SeleniumManager.startOwnDriver)
+
+    pageLoadTimeout : Integer
+        The most seconds a page may take to load.  None for no limit.
+
+    implicitWait : Integer
+        The seconds that the workers' browsers wait for an element to appear
+
+    Methods
+    ----------
+    logInToConfluence(serverAddr, username, password)
+        Receives the user's login credentials, which each worker's Chrome instance is logged in with when it starts
+
+    getImagesMisssingAltText(baseLink, pageID)
+        Receives a pageID, then identifies images on the Confluence page that are missing alternate text, and then returns a tuple of detailed information about the page and its images
+
+    scanPages(baseLink, pageIDs)
+        Receives pageIDs, and yields detailed information about each page and its images missing alternate text, as the workers finish checking them
+
+    start()
+        Starts the worker threads, each with its own Chrome instance, if they aren't running yet
+
+    close()
+        Stops the worker threads, and quits their Chrome instances
+
+    startWorker()
+        Returns a SeleniumManager with its own Chrome instance, logged in to Confluence
+
+    scanPagesOnWorker(slmMgr)
+        Checks pages from the work queue on one worker's Chrome instance, until the pool is closed
+    """
+
+    HEALTH_CHECK_INTERVAL = 50
+
+    MAX_ATTEMPTS_PER_PAGE = 2
+
+    def __init__(self, poolSize, leanScanProfile=False, pageLoadTimeout=None, implicitWait=5):
+        """
+        Parameters
+        ----------
+        poolSize : Integer
+            The number of Chrome instances that check pages at the same time
+
+        leanScanProfile (optional) : Boolean
+            True if the workers' browsers should use the lean scan profile
+
+        pageLoadTimeout (optional) : Integer
+            The most seconds a page may take to load.  No limit if not given.
+
+        implicitWait (optional) : Integer
+            The seconds that the workers' browsers wait for an element to appear
+        """
+
+        self.poolSize = poolSize
+        self.leanScanProfile = leanScanProfile
+        self.pageLoadTimeout = pageLoadTimeout
+        self.implicitWait = implicitWait
+        self._serverAddr = None
+        self._username = None
+        self._password = None
+        self._pageQueue = queue.Queue()
+        self._allWorkers = []
+
+    def __repr__(self):
+        return f'SeleniumPool({self.poolSize})'
+
+    def logInToConfluence(self, serverAddr, username, password):
+        """
+        Receives the user's login credentials, which each worker's Chrome instance is logged in with when it starts
+
+        Parameters
+        ----------
+        serverAddr : String
+            The Confluence instance the workers should log in to
+
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        Returns
+        ----------
+        None
+        """
+
+        self._serverAddr = serverAddr
+        self._username = username
+        self._password = password
+
+    def getImagesMisssingAltText(self, baseLink, pageID):
+        """
+        Receives a pageID, then identifies images on the Confluence page that are missing alternate text, and then returns a tuple of detailed information about the page and its images
+
+        Parameters
+        ----------
+        baseLink : String
+            The base link for a Confluence page.  Will look something like "https://confluence.xyz.com/pages/viewpage.action?pageId="
+
+        pageID : String
+            The unique ID for a Confluence page
+
+        Returns
+        ----------
+        Tuple
+            A two item tuple
+            - The first item is a dict of key-value pairs of links to images and the image names.  Will return an empty dict if either the page has no images, or all images have alernate text.
+            - The second item is the page name.  Will be None if the page no longer exists or isn't public.
+        """
+
+        for _, imagesNamesLinks, pageName in self.scanPages(baseLink, [pageID]):
+            return (imagesNamesLinks, pageName)
+
+    def scanPages(self, baseLink, pageIDs):
+        """
+        Receives pageIDs, and yields detailed information about each page and its images missing alternate text, as the workers finish checking them
+
+        The pool is started first, if it isn't running yet.  The pages are yielded in the order they finish, not in the order of pageIDs.  If the caller stops iterating early, the workers skip this scan's pages that they haven't started yet, and stay ready for the next scan.
+
+        Parameters
+        ----------
+        baseLink : String
+            The base link for a Confluence page.  Will look something like "https://confluence.xyz.com/pages/viewpage.action?pageId="
+
+        pageIDs : List
+            The unique IDs of Confluence pages
+
+        Returns
+        ----------
+        Generator
+            Yields three-item tuples of a pageID, and the two items that getImagesMisssingAltText returns for the page
+        """
+
+        self.start()
+
+        resultQueue = queue.Queue()
+        stopEvent = threading.Event()
+
+        for pageID in pageIDs:
+            self._pageQueue.put((baseLink, pageID, resultQueue, stopEvent))
+
+        try:
+            for index in range(len(pageIDs)):
+                result = resultQueue.get()
+
+                # A worker that couldn't check a page puts the exception on the results queue
+                if isinstance(result, BaseException):
+                    raise result
+
+                pageID, imagesNamesLinks, pageName, numImages, pageTimings = result
+
+                print(f"\nChecking page #{index+1} ({pageID}) for alternate text now...")
+                print(f"\tNumber of images found: {numImages}")
+                print(f"\tNumber of images that have alternate text: {numImages-len(imagesNamesLinks)}")
+                print(f"\tNumber of images that are missing alternate text: {len(imagesNamesLinks)}")
+                print(f"\tPage loaded in {pageTimings[0]:.3f}s, images read in {pageTimings[1]:.3f}s ({SeleniumManager.DOM_EXTRACTION_MODE} mode)")
+
+                yield (pageID, imagesNamesLinks, pageName)
+        finally:
+            stopEvent.set()
+
+    def start(self):
+        """
+        Starts the worker threads, each with its own Chrome instance, if they aren't running yet
+
+        The browsers are started and logged in one at a time, so a browser that can't start or log in raises here.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        None
+        """
+
+        if self._allWorkers:
+            return
+
+        allManagers = []
+
+        try:
+            for _ in range(self.poolSize):
+                allManagers.append(self.startWorker())
+        except BaseException:
+            for slmMgr in allManagers:
+                slmMgr.quitDriver()
+
+            raise
+
+        self._allWorkers = [
+            threading.Thread(target=self.scanPagesOnWorker, args=(slmMgr,), daemon=True)
+            for slmMgr in allManagers
+        ]
+
+        for worker in self._allWorkers:
+            worker.start()
+
+    def close(self):
+        """
+        Stops the worker threads, and quits their Chrome instances
+
+        Each worker finishes the page it's checking first.  Does nothing if the pool isn't running.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        None
+        """
+
+        for _ in self._allWorkers:
+            self._pageQueue.put(None)
+
+        for worker in self._allWorkers:
+            worker.join()
+
+        self._allWorkers = []
+
+    def startWorker(self):
+        """
+        Returns a SeleniumManager with its own Chrome instance, logged in to Confluence
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        ----------
+        Class (of type 'SeleniumManager')
+            The worker's SeleniumManager
+        """
+
+        slmMgr = SeleniumManager()
+        slmMgr.startOwnDriver(
+            leanScanProfile=self.leanScanProfile,
+            pageLoadTimeout=self.pageLoadTimeout,
+            implicitWait=self.implicitWait
+        )
+        slmMgr.logInToConfluence(
+            serverAddr=self._serverAddr,
+            username=self._username,
+            password=self._password
+        )
+
+        return slmMgr
+
+    def scanPagesOnWorker(self, slmMgr):
+        """
+        Checks pages from the work queue on one worker's Chrome instance, until the pool is closed
+
+        Runs on its own thread.  Each work item is a four-item tuple of the base link, the pageID, the scan's results queue, and the scan's stop event.  Pages of a scan that has stopped are skipped.  Each result is put on the scan's results queue as a five-item tuple of the pageID, the three items that SeleniumManager.findImagesMissingAltText returns, and the worker's SeleniumManager.lastPageTimings.  If the worker can't check a page, it puts the exception on the results queue instead, and waits for the next page.
+
+        Parameters
+        ----------
+        slmMgr : Class (of type 'SeleniumManager')
+            The worker's SeleniumManager, as startWorker returns it
+
+        Returns
+        ----------
+        None
+        """
+
+        numPagesSinceHealthCheck = 0
+
+        try:
+            while True:
+                workItem = self._pageQueue.get()
+
+                # close puts a None on the work queue for each worker
+                if workItem is None:
+                    return
+
+                baseLink, pageID, resultQueue, stopEvent = workItem
+
+                if stopEvent.is_set():
+                    continue
+
+                try:
+                    if numPagesSinceHealthCheck >= self.HEALTH_CHECK_INTERVAL:
+                        numPagesSinceHealthCheck = 0
+
+                        if not slmMgr.isDriverResponsive():
+                            slmMgr.restartDriver()
+
+                    numPagesSinceHealthCheck += 1
+
+                    resultQueue.put((
+                        pageID,
+                        *slmMgr.findImagesMissingAltTextWithRetries(baseLink, pageID, self.MAX_ATTEMPTS_PER_PAGE),
+                        slmMgr.lastPageTimings
+                    ))
+                except Exception as error:
+                    resultQueue.put(error)
+        finally:
+            slmMgr.quitDriver()
@@ -6,6 +6,30 @@ class KeyInfo:
     CONFLUENCE_SERVER_ADDRESS(class) : String
         The Confluence server that this Python script connects to
 
+    CONFLUENCE_BACKEND(class) : String
+        How this Python script calls the Confluence server.  Either "acli" (Bob Swift's ACLI app, see ACLIController) or "rest" (Confluence's REST API, see ConfluenceRestClient).
+
+    PAGE_SCANNER(class) : String
+        How this Python script checks pages for images missing alternate text.  Either "selenium" (renders each page in headless Chrome, see SeleniumManager), "html" (parses each page's HTML without a browser, see HTMLAltTextScanner), or "storage" (parses each page's storage format, many pages per call, see StorageFormatScanner).  "html" and "storage" always call Confluence's REST API, whatever CONFLUENCE_BACKEND is.
+
+    SELENIUM_POOL_SIZE(class) : Integer
+        The number of headless Chrome instances that check pages at the same time, when PAGE_SCANNER is "selenium".  With more than 1, the pages are checked by a SeleniumPool, whose browsers are started once and check every space.  With 1, the Selenium instance that the rest of this Python script uses checks the pages.  About one per CPU core works well, as long as the box has the memory for that many browsers.
+
+    SELENIUM_LEAN_SCAN_PROFILE(class) : Boolean
+        True to check pages, when PAGE_SCANNER is "selenium", with headless Chrome instances that don't download images, fonts, stylesheets, media, or analytics scripts, and that read each page as soon as its HTML is parsed.  With a SELENIUM_POOL_SIZE of 1, the Selenium instance that's already running only stops downloading fonts, stylesheets, media, and analytics scripts, until it's restarted (see SeleniumManager.applyScanProfile).
+
+    SELENIUM_PAGE_LOAD_TIMEOUT(class) : Integer
+        The most seconds a page may take to load in the instances that check pages.  A page that times out is tried once more, on a restarted and logged in instance, before the scan stops.
+
+    SELENIUM_IMPLICIT_WAIT(class) : Integer
+        The seconds that the instances that check pages wait for an element to appear, before giving up
+
+    CONFLUENCE_SPACE_KEYS(class) : List
+        The keys of the Confluence spaces that this Python script scans.  The spaces' page inventories are listed at the same time.
+
+    PAGE_INVENTORY_CHUNK_SIZE(class) : Integer
+        The number of pages that are read from Confluence and reconciled with the db at a time.  Memory use during the page inventory grows with this number, not with the number of pages in the space.
+
     SUB_LINK_VIEW_CONFLUENCE_PAGE(class) : String
         The subdirectory for viewing a specific Confluence page. When a pageID is added to the end of this sub link, the link will be a working link and go to the specific page.
 
@@ -31,6 +55,14 @@ class KeyInfo:
     """
 
     CONFLUENCE_SERVER_ADDRESS = "https://confluence.xyz.com"
+    CONFLUENCE_BACKEND = "acli"
+    PAGE_SCANNER = "selenium"
+    SELENIUM_POOL_SIZE = 1
+    SELENIUM_LEAN_SCAN_PROFILE = True
+    SELENIUM_PAGE_LOAD_TIMEOUT = 30
+    SELENIUM_IMPLICIT_WAIT = 5
+    CONFLUENCE_SPACE_KEYS = ["public"]
+    PAGE_INVENTORY_CHUNK_SIZE = 5000
     SUB_LINK_VIEW_CONFLUENCE_PAGE = "/pages/viewpage.action?pageId="
     SUB_LINK_AUTHOR_PAGE = "/display/~"
 
@@ -0,0 +1,403 @@
+import html.entities
+from urllib.parse import quote, quote_plus
+from xml.etree.ElementTree import ParseError, XMLPullParser
+from confluenceRestClient import ConfluenceRestClient
+from htmlAltTextScanner import HTMLAltTextScanner
+
+class StorageFormatScanner:
+    """Finds the images missing alternate text in Confluence pages' storage format, instead of in the rendered pages.  A drop-in alternative to SeleniumManager.getImagesMisssingAltText.
+
+    A missing alternate text is an <ac:image> without an ac:alt attribute (or with an empty one) in the page's storage XHTML.  The storage bodies of STORAGE_BATCH_SIZE pages are fetched with one REST API call, and each body is parsed by a streaming XML parser.  Attachment links are built from the page's ID and the attachment's file name, so no browser is needed.  A page whose storage format isn't well-formed XML is scanned by HTMLAltTextScanner instead.
+
+    The image links point at the latest version of each attachment (e.g. ".../download/attachments/123/image.png?api=v2"), so they differ from the links in the rendered pages, which carry the attachment's version and modification date.
+
+    Attributes
+    ----------
+    STORAGE_BATCH_SIZE (class) : Integer
+        The most pages whose storage bodies are fetched with one call
+
+    STORAGE_NAMESPACES (class) : Dict
+        The XML namespaces of the ac: and ri: prefixes that the storage format uses
+
+    STORAGE_DOCTYPE (class) : String
+        A document type declaration that defines every HTML named entity (e.g. &nbsp;), which the storage format uses but XML doesn't define
+
+    Methods
+    ----------
+    logInToConfluence(serverAddr, username, password)
+        Receives the user's login credentials, which every REST API call is then authenticated with
+
+    getImagesMisssingAltText(baseLink, pageID)
+        Receives a pageID, then identifies images on the Confluence page that are missing alternate text, and then returns a tuple of detailed information about the page and its images
+
+    scanPages(baseLink, pageIDs)
+        Receives pageIDs, and yields detailed information about each page and its images missing alternate text, scanning STORAGE_BATCH_SIZE pages at a time
+
+    getStorageBodies(pageIDs)
+        Fetches the title, space, and storage body of each page in a batch
+
+    getStorageBody(pageID)
+        Fetches the title, space, and storage body of one page by its ID
+
+    getImagesMissingAltTextFromStorage(storageBody, pageID, spaceKey)
+        Parses a page's storage body, and returns the images missing alternate text and the number of images
+
+    getImageLink(pageID, spaceKey, imageInfo)
+        Returns the link to an image, from the resource identifier in its <ac:image>
+
+    getPageIDByTitle(spaceKey, title)
+        Returns the ID of the page that has a given title in a given space.  Used to resolve attachments of other pages.
+    """
+
+    STORAGE_BATCH_SIZE = 50
+
+    STORAGE_NAMESPACES = {
+        "ac": "http://atlassian.com/content",
+        "ri": "http://atlassian.com/resource/identifier"
+    }
+
+    # XML only predefines &amp; &lt; &gt; &quot; and &apos;
+    STORAGE_DOCTYPE = "<!DOCTYPE storage [{0}]>".format("".join(
+        f'<!ENTITY {entityName} "&#{codepoint};">'
+        for entityName, codepoint in html.entities.name2codepoint.items()
+        if entityName not in ("amp", "lt", "gt", "quot", "apos")
+    ))
+
+    def __init__(self):
+        """
+        Parameters
+        ----------
+        None
+        """
+
+        self._restClient = ConfluenceRestClient()
+        self._htmlScanner = HTMLAltTextScanner()
+        self._pageIDsByTitle = {}
+        self._serverAddr = None
+        self._username = None
+        self._password = None
+
+    def __repr__(self):
+        return f'StorageFormatScanner()'
+
+    def logInToConfluence(self, serverAddr, username, password):
+        """
+        Receives the user's login credentials, which every REST API call is then authenticated with
+
+        Parameters
+        ----------
+        serverAddr : String
+            The URL to the Confluence server
+
+        username : String
+            The user's username
+
+        password : String
+            The user's password
+
+        Returns
+        ----------
+        None
+        """
+
+        self._serverAddr = serverAddr
+        self._username = username
+        self._password = password
+
+        self._htmlScanner.logInToConfluence(serverAddr, username, password)
+
+    def getImagesMisssingAltText(self, baseLink, pageID):
+        """
+        Receives a pageID, then identifies images on the Confluence page that are missing alternate text, and then returns a tuple of detailed information about the page and its images
+
+        Parameters
+        ----------
+        baseLink : String
+            The base link for a Confluence page.  Only used if the page's storage format can't be parsed.
+
+        pageID : String
+            The unique ID for a Confluence page
+
+        Returns
+        ----------
+        Tuple
+            A two item tuple
+            - The first item is a dict of key-value pairs of links to images and the image names.  Will return an empty dict if either the page has no images, or all images have alernate text.
+            - The second item is the page name.  Will be None if the page no longer exists or isn't public.
+        """
+
+        for _, imagesNamesLinks, pageName in self.scanPages(baseLink, [pageID]):
+            return (imagesNamesLinks, pageName)
+
+    def scanPages(self, baseLink, pageIDs):
+        """
+        Receives pageIDs, and yields detailed information about each page and its images missing alternate text, scanning STORAGE_BATCH_SIZE pages at a time
+
+        Parameters
+        ----------
+        baseLink : String
+            The base link for a Confluence page.  Only used for the pages whose storage format can't be parsed.
+
+        pageIDs : List
+            The unique IDs of Confluence pages
+
+        Returns
+        ----------
+        Generator
+            Yields three-item tuples of a pageID, and the two items that getImagesMisssingAltText returns for the page
+        """
+
+        for batchStart in range(0, len(pageIDs), self.STORAGE_BATCH_SIZE):
+            batchPageIDs = pageIDs[batchStart:batchStart + self.STORAGE_BATCH_SIZE]
+            storageBodies = self.getStorageBodies(batchPageIDs)
+
+            for index, pageID in enumerate(batchPageIDs, start=batchStart):
+                print(f"\nChecking page #{index+1} ({pageID}) for alternate text now...")
+
+                # CQL search reads Confluence's search index, which lags behind recent edits.  So a page that the search leaves out is only gone if reading it by ID says so.
+                if pageID not in storageBodies:
+                    storageBodies[pageID] = self.getStorageBody(pageID)
+
+                if storageBodies[pageID] is None:
+                    print("\tNumber of images found: 0")
+
+                    yield (pageID, {}, None)
+                    continue
+
+                pageName, spaceKey, storageBody = storageBodies[pageID]
+
+                try:
+                    imagesNamesLinks, numImages = self.getImagesMissingAltTextFromStorage(storageBody, pageID, spaceKey)
+                except ParseError:
+                    print("\tThe page's storage format isn't well-formed.  Checking the rendered page instead.")
+
+                    yield (pageID, *self._htmlScanner.getImagesMisssingAltText(baseLink, pageID))
+                    continue
+
+                print(f"\tNumber of images found: {numImages}")
+                print(f"\tNumber of images that have alternate text: {numImages-len(imagesNamesLinks)}")
+                print(f"\tNumber of images that are missing alternate text: {len(imagesNamesLinks)}")
+
+                yield (pageID, imagesNamesLinks, pageName)
+
+    def getStorageBodies(self, pageIDs):
+        """
+        Fetches the title, space, and storage body of each page in a batch
+
+        Parameters
+        ----------
+        pageIDs : List
+            The unique IDs of Confluence pages
+
+        Returns
+        ----------
+        Dict
+            Key-value pairs of a pageID, and a three-item tuple of the page's title, space key, and storage body.  Pages that the search leaves out are left out, which may just mean that the search index hasn't caught up with them (see getStorageBody).  Raises a RuntimeError if any page of the search results can't be read.
+        """
+
+        storageBodies = {}
+        start = 0
+
+        while True:
+            status, results = self._restClient.getJSON(
+                username=self._username,
+                password=self._password,
+                serverAddr=self._serverAddr,
+                path="/rest/api/content/search",
+                queryParams={
+                    "cql": f"id in ({','.join(str(int(pageID)) for pageID in pageIDs)})",
+                    "expand": "body.storage,space",
+                    "start": start,
+                    "limit": len(pageIDs)
+                }
+            )
+
+            if status != 200:
+                raise RuntimeError(f"Fetching the storage format of pages {pageIDs[0]} to {pageIDs[-1]} failed with HTTP status {status}")
+
+            for page in results["results"]:
+                storageBodies[str(page["id"])] = (
+                    page["title"],
+                    page["space"]["key"],
+                    page["body"]["storage"]["value"]
+                )
+
+            if "next" not in results.get("_links", {}):
+                return storageBodies
+
+            start += len(results["results"])
+
+    def getStorageBody(self, pageID):
+        """
+        Fetches the title, space, and storage body of one page by its ID
+
+        Reads the page itself, instead of searching for it, so it doesn't depend on Confluence's search index.
+
+        Parameters
+        ----------
+        pageID : String
+            The unique ID for a Confluence page
+
+        Returns
+        ----------
+        Tuple
+            A three-item tuple of the page's title, space key, and storage body.  None if the page no longer exists (HTTP status 404), or the user can't view it (HTTP status 403).  Raises a RuntimeError on any other failure.
+        """
+
+        status, page = self._restClient.getJSON(
+            username=self._username,
+            password=self._password,
+            serverAddr=self._serverAddr,
+            path=f"/rest/api/content/{int(pageID)}",
+            queryParams={"expand": "body.storage,space"}
+        )
+
+        if status in (403, 404):
+            return None
+
+        if status != 200:
+            raise RuntimeError(f"Fetching the storage format of page {pageID} failed with HTTP status {status}")
+
+        return (page["title"], page["space"]["key"], page["body"]["storage"]["value"])
+
+    def getImagesMissingAltTextFromStorage(self, storageBody, pageID, spaceKey):
+        """
+        Parses a page's storage body, and returns the images missing alternate text and the number of images
+
+        Parameters
+        ----------
+        storageBody : String
+            The page's storage XHTML
+
+        pageID : String
+            The unique ID for the Confluence page
+
+        spaceKey : String
+            The key of the Confluence space the page is in
+
+        Returns
+        ----------
+        Tuple
+            A two item tuple
+            - The first item is a dict of key-value pairs of links to images and the image names, as getImagesMisssingAltText returns it.
+            - The second item is the number of images on the page.
+        """
+
+        acImage = "{" + self.STORAGE_NAMESPACES["ac"] + "}image"
+        acAlt = "{" + self.STORAGE_NAMESPACES["ac"] + "}alt"
+        riNamespace = "{" + self.STORAGE_NAMESPACES["ri"] + "}"
+
+        storageParser = XMLPullParser(events=("start", "end"))
+        storageParser.feed(self.STORAGE_DOCTYPE)
+        storageParser.feed("<storage {0}>".format(" ".join(
+            f'xmlns:{prefix}="{namespace}"' for prefix, namespace in self.STORAGE_NAMESPACES.items()
+        )))
+        storageParser.feed(storageBody)
+        storageParser.feed("</storage>")
+        storageParser.close()
+
+        imagesNamesLinks = {}
+        numImages = 0
+        imageInfo = None
+
+        for event, element in storageParser.read_events():
+            if element.tag == acImage:
+                if event == "start":
+                    numImages += 1
+                    imageInfo = {}
+                else:
+                    if not element.get(acAlt):
+                        imageLink, imageName = self.getImageLink(pageID, spaceKey, imageInfo)
+                        imagesNamesLinks[imageLink] = imageName
+
+                    imageInfo = None
+
+            # The resource identifier says where the image is, e.g. <ri:attachment ri:filename="image.png"><ri:page ri:content-title="Other page" /></ri:attachment>
+            elif event == "start" and imageInfo is not None and element.tag.startswith(riNamespace):
+                imageInfo[element.tag[len(riNamespace):]] = {
+                    attrName[len(riNamespace):]: attrValue
+                    for attrName, attrValue in element.attrib.items()
+                    if attrName.startswith(riNamespace)
+                }
+
+        return (imagesNamesLinks, numImages)
+
+    def getImageLink(self, pageID, spaceKey, imageInfo):
+        """
+        Returns the link to an image, from the resource identifier in its <ac:image>
+
+        Parameters
+        ----------
+        pageID : String
+            The unique ID for the Confluence page the image is on
+
+        spaceKey : String
+            The key of the Confluence space the page is in
+
+        imageInfo : Dict
+            Key-value pairs of each resource identifier in the <ac:image> (e.g. "attachment", "page", "url"), and its attributes without the ri: prefix
+
+        Returns
+        ----------
+        Tuple
+            A two item tuple of the link to the image, and the image's name (its file name, or None if the image isn't an attachment)
+        """
+
+        if "url" in imageInfo:
+            return (imageInfo["url"].get("value", ""), None)
+
+        fileName = imageInfo.get("attachment", {}).get("filename", "")
+        ownerPageID = pageID
+
+        # The attachment belongs to another page
+        if "page" in imageInfo:
+            ownerPageID = self.getPageIDByTitle(
+                imageInfo["page"].get("space-key", spaceKey),
+                imageInfo["page"].get("content-title", "")
+            )
+
+            if ownerPageID is None:
+                return (
+                    f"{self._serverAddr}/display/{imageInfo['page'].get('space-key', spaceKey)}/{quote_plus(imageInfo['page'].get('content-title', ''))}",
+                    fileName
+                )
+
+        return (f"{self._serverAddr}/download/attachments/{ownerPageID}/{quote(fileName)}?api=v2", fileName)
+
+    def getPageIDByTitle(self, spaceKey, title):
+        """
+        Returns the ID of the page that has a given title in a given space.  Used to resolve attachments of other pages.
+
+        Each title is only looked up once.
+
+        Parameters
+        ----------
+        spaceKey : String
+            The key of a Confluence space
+
+        title : String
+            The title of a page in that space
+
+        Returns
+        ----------
+        String
+            The page's ID.  None if there's no such page, or the user can't view it.  Raises a RuntimeError if the lookup fails, so a failed lookup is never cached as a missing page.
+        """
+
+        if (spaceKey, title) not in self._pageIDsByTitle:
+            status, results = self._restClient.getJSON(
+                username=self._username,
+                password=self._password,
+                serverAddr=self._serverAddr,
+                path="/rest/api/content",
+                queryParams={"spaceKey": spaceKey, "title": title, "limit": 1}
+            )
+
+            if status not in (200, 403, 404):
+                raise RuntimeError(f"Looking up page {title} in Confluence space {spaceKey} failed with HTTP status {status}")
+
+            self._pageIDsByTitle[(spaceKey, title)] = (
+                str(results["results"][0]["id"]) if status == 200 and results["results"] else None
+            )
+
+        return self._pageIDsByTitle[(spaceKey, title)]
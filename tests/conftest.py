@@ -0,0 +1,23 @@
+import sys
+from pathlib import Path
+import pytest
+
+# The modules in src import each other as top-level modules, the way run.py runs them
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+@pytest.fixture
+def migratedDB(tmp_path, monkeypatch):
+    """A webscraper.db at the latest schema, in a temporary working directory"""
+
+    from DBCreator import DBCreator
+    from dbRecordHandler.connectionManager import ConnectionManager
+
+    # ConnectionManager opens the webscraper.db under the current working directory
+    (tmp_path / "src" / "sensitive").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+
+    DBCreator().createDB()
+
+    yield ConnectionManager().getConnection()
+
+    ConnectionManager().closeConnection()
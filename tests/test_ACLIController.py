@@ -0,0 +1,62 @@
+import os
+import sys
+import pytest
+from ACLIController import ACLIController
+
+# Runs the actions of an ACLI run script, and writes a two-revision content history for each page.  FAKE_ACLI_EXIT_CODE makes it fail, and FAKE_ACLI_SKIP_PAGE makes it leave out one page's history.
+FAKE_ACLI = """
+import os
+import shlex
+import sys
+
+if os.environ.get("FAKE_ACLI_EXIT_CODE"):
+    sys.stderr.write("Remote error: Login failed\\n")
+    sys.exit(int(os.environ["FAKE_ACLI_EXIT_CODE"]))
+
+with open(sys.argv[sys.argv.index("--file") + 1], encoding="utf-8") as scriptFile:
+    for line in scriptFile:
+        args = shlex.split(line)
+        pageID = args[args.index("--id") + 1]
+
+        if pageID == os.environ.get("FAKE_ACLI_SKIP_PAGE"):
+            continue
+
+        with open(args[args.index("--file") + 1], "w", encoding="utf-8") as historyFile:
+            historyFile.write('"Id","Title","Space","Version","Creator","Date","Username","Comment","Name"\\n')
+            historyFile.write(f'"{pageID}","Page {pageID}","public","2","editor","2022-06-01","editor","","An Editor"\\n')
+            historyFile.write(f'"{pageID}","Page {pageID}","public","1","author","2022-01-01","author","","An, Author"\\n')
+"""
+
+@pytest.fixture
+def fakeACLI(tmp_path, monkeypatch):
+    if os.name == "nt":
+        pytest.skip("The fake acli is an executable script, which Windows can't run without an extension")
+
+    acliPath = tmp_path / "acli"
+    acliPath.write_text(f"#!{sys.executable}\n{FAKE_ACLI}", encoding="utf-8")
+    acliPath.chmod(0o755)
+
+    monkeypatch.setenv("PATH", str(tmp_path) + os.pathsep + os.environ.get("PATH", ""))
+
+    return monkeypatch
+
+def getRevisionsForBatch(pageIDs):
+    return ACLIController().getRevisionsForBatch("user", "password", "https://confluence.example.com", pageIDs)
+
+def test_batchHistoriesAreReadPerPage(fakeACLI):
+    assert getRevisionsForBatch(["1", "2"]) == [
+        ("1", [("2022-06-01", "editor", "An Editor"), ("2022-01-01", "author", "An, Author")]),
+        ("2", [("2022-06-01", "editor", "An Editor"), ("2022-01-01", "author", "An, Author")]),
+    ]
+
+def test_failedBatchRaises(fakeACLI):
+    fakeACLI.setenv("FAKE_ACLI_EXIT_CODE", "1")
+
+    with pytest.raises(RuntimeError, match="Login failed"):
+        getRevisionsForBatch(["1", "2"])
+
+def test_missingHistoryRaises(fakeACLI):
+    fakeACLI.setenv("FAKE_ACLI_SKIP_PAGE", "2")
+
+    with pytest.raises(RuntimeError, match="page 2"):
+        getRevisionsForBatch(["1", "2"])
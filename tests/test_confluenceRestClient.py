@@ -0,0 +1,78 @@
+import pytest
+from confluenceRestClient import ConfluenceRestClient
+from confluenceRestStub import ConfluenceRestStub, ConfluenceRestStubHandler
+
+@pytest.fixture
+def stubServer():
+    # More pages and versions than fit in one page of results
+    stub = ConfluenceRestStub(numPages=250, numVersions=120, spaceKeys=["public", "internal"])
+    serverAddr = stub.start()
+
+    yield (stub, serverAddr)
+
+    stub.stop()
+
+def test_authentication(stubServer):
+    stub, serverAddr = stubServer
+
+    assert ConfluenceRestClient().testACLIauthentication(stub.username, stub.password, serverAddr)
+    assert not ConfluenceRestClient().testACLIauthentication(stub.username, "wrong password", serverAddr)
+
+def test_listingFollowsEveryPageOfResults(stubServer):
+    stub, serverAddr = stubServer
+
+    pages = list(ConfluenceRestClient().streamAllConfluencePageIDs(stub.username, stub.password, serverAddr, spaceKey="internal"))
+
+    # Page n is in spaceKeys[n % 2]
+    assert pages == [(str(pageID), "120") for pageID in range(1, 251, 2)]
+    assert stub.requestCount == 2
+
+def test_historyIsEveryRevisionNewestFirst(stubServer):
+    stub, serverAddr = stubServer
+
+    allRevisions = ConfluenceRestClient().getRevisionsForPage(stub.username, stub.password, serverAddr, "7")
+
+    assert len(allRevisions) == 120
+    assert allRevisions[0] == (stub.getVersions(7)[0]["when"][0:10], "author27", "Author 27")
+    assert allRevisions == sorted(allRevisions, key=lambda revision: revision[0], reverse=True)
+    assert all(len(revisionDate) == 10 for revisionDate, _, _ in allRevisions)
+
+def test_recentAuthorsAreTheLast30Days(stubServer):
+    stub, serverAddr = stubServer
+
+    # Versions are published 30 days apart, so the latest two are recent
+    assert ConfluenceRestClient().getRecentAuthors(stub.username, stub.password, serverAddr, "7") == [
+        ("author27", "Author 27"),
+        ("author26", "Author 26")
+    ]
+
+def test_batchHistoriesAreReadPerPage(stubServer):
+    stub, serverAddr = stubServer
+
+    revisionsByPageID = ConfluenceRestClient().getRevisionsForBatch(stub.username, stub.password, serverAddr, ["1", "2"])
+
+    assert [pageID for pageID, _ in revisionsByPageID] == ["1", "2"]
+    assert [len(revisions) for _, revisions in revisionsByPageID] == [120, 120]
+
+def test_failedListingRaises(stubServer):
+    stub, serverAddr = stubServer
+
+    with pytest.raises(RuntimeError, match="401"):
+        list(ConfluenceRestClient().streamAllConfluencePageIDs(stub.username, "wrong password", serverAddr))
+
+def test_failedHistoryReadRaises(stubServer):
+    stub, serverAddr = stubServer
+
+    with pytest.raises(RuntimeError, match="404"):
+        ConfluenceRestClient().getRevisionsForPage(stub.username, stub.password, serverAddr, "999")
+
+def test_loginPageInsteadOfJSONRaises(stubServer, monkeypatch):
+    stub, serverAddr = stubServer
+
+    # An SSO proxy that answers every call with its login page
+    monkeypatch.setattr(ConfluenceRestStubHandler, "do_GET", lambda handler: handler.sendHTML(200, "<html><body>Log in</body></html>"))
+
+    with pytest.raises(RuntimeError, match="/rest/api/content/search"):
+        list(ConfluenceRestClient().streamAllConfluencePageIDs(stub.username, stub.password, serverAddr))
+
+    assert not ConfluenceRestClient().testACLIauthentication(stub.username, stub.password, serverAddr)
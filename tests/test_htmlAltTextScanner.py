@@ -0,0 +1,123 @@
+import json
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import pytest
+from htmlAltTextScanner import HTMLAltTextScanner
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "htmlAltTextScanner"
+
+# Each saved page has a .json file of the results that SeleniumManager.getImagesMisssingAltText returns for it, with "{server}" in place of the address it was served from
+PARITY_FIXTURES = sorted(path.stem for path in FIXTURES_DIR.glob("*.json"))
+
+class FixtureRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the saved pages, and a few paths that answer the way Confluence does when a page can't be fetched"""
+
+    ERROR_PATHS = {
+        "/deleted.html": 404,
+        "/restricted.html": 403,
+        "/outage.html": 503,
+        "/broken.html": 500,
+        "/unauthorized.html": 401
+    }
+
+    def do_GET(self):
+        if self.path in self.ERROR_PATHS:
+            self.send_error(self.ERROR_PATHS[self.path])
+        elif self.path == "/sso.html":
+            self.send_response(302)
+            self.send_header("Location", "https://sso.example.com/login")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/loop.html":
+            self.send_response(302)
+            self.send_header("Location", "/loop.html")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/moved.html":
+            self.send_response(301)
+            self.send_header("Location", "/allAltText.html")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        else:
+            super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture(scope="module")
+def fixtureServer():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(FixtureRequestHandler, directory=str(FIXTURES_DIR)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def htmlScanner(fixtureServer):
+    scanner = HTMLAltTextScanner()
+    scanner.logInToConfluence(fixtureServer, "stub", "stub")
+
+    return scanner
+
+def getSavedResults(fixtureName, serverAddr):
+    savedResults = json.loads((FIXTURES_DIR / f"{fixtureName}.json").read_text(encoding="utf-8"))
+
+    imagesNamesLinks = {
+        (imageLink.replace("{server}", serverAddr) if imageLink is not None else None): imageName
+        for imageLink, imageName in savedResults["imagesNamesLinks"]
+    }
+
+    return (imagesNamesLinks, savedResults["pageName"], savedResults["numImages"])
+
+@pytest.mark.parametrize("fixtureName", PARITY_FIXTURES)
+def test_htmlScannerMatchesSavedResults(htmlScanner, fixtureServer, fixtureName):
+    imagesNamesLinks, pageName, numImages = getSavedResults(fixtureName, fixtureServer)
+
+    assert htmlScanner.getImagesMissingAltTextFromHTML(*htmlScanner.getPageHTML(f"{fixtureServer}/{fixtureName}.html")) == (imagesNamesLinks, pageName, numImages)
+    assert htmlScanner.getImagesMisssingAltText(f"{fixtureServer}/", f"{fixtureName}.html") == (imagesNamesLinks, pageName)
+
+@pytest.fixture(params=["script", "elements"])
+def seleniumManager(request, monkeypatch):
+    pytest.importorskip("selenium")
+
+    # SeleniumManager starts Chrome when it's imported
+    try:
+        from seleniumManager import SeleniumManager
+    except Exception as error:
+        pytest.skip(f"Chrome couldn't be started: {error}")
+
+    monkeypatch.setattr(SeleniumManager, "DOM_EXTRACTION_MODE", request.param)
+
+    return SeleniumManager()
+
+@pytest.mark.parametrize("fixtureName", PARITY_FIXTURES)
+def test_seleniumMatchesSavedResults(seleniumManager, fixtureServer, fixtureName):
+    assert seleniumManager.findImagesMissingAltText(f"{fixtureServer}/", f"{fixtureName}.html") == getSavedResults(fixtureName, fixtureServer)
+
+def test_redirectOnTheServerIsFollowed(htmlScanner, fixtureServer):
+    assert htmlScanner.getImagesMisssingAltText(f"{fixtureServer}/", "moved.html") == ({}, "Style guide")
+
+@pytest.mark.parametrize("pageID", ["deleted.html", "restricted.html"])
+def test_pageThatIsGoneHasNoPageName(htmlScanner, fixtureServer, pageID):
+    assert htmlScanner.getImagesMisssingAltText(f"{fixtureServer}/", pageID) == ({}, None)
+
+@pytest.mark.parametrize("pageID", ["outage.html", "broken.html", "unauthorized.html", "sso.html", "loop.html", "loginPage.html"])
+def test_pageThatCouldNotBeReadRaises(htmlScanner, fixtureServer, pageID):
+    with pytest.raises(RuntimeError):
+        htmlScanner.getImagesMisssingAltText(f"{fixtureServer}/", pageID)
+
+@pytest.mark.parametrize("pageID", ["deleted.html", "restricted.html"])
+def test_seleniumPageThatIsGoneHasNoPageName(seleniumManager, fixtureServer, pageID):
+    assert seleniumManager.findImagesMissingAltText(f"{fixtureServer}/", pageID) == ({}, None, 0)
+
+# The browser follows sso.html off the server, and the page it lands on can't be loaded here either
+@pytest.mark.parametrize("pageID", ["outage.html", "broken.html", "unauthorized.html", "sso.html", "loginPage.html"])
+def test_seleniumPageThatCouldNotBeReadRaises(seleniumManager, fixtureServer, pageID):
+    from selenium.common.exceptions import WebDriverException
+
+    with pytest.raises((RuntimeError, WebDriverException)):
+        seleniumManager.findImagesMissingAltText(f"{fixtureServer}/", pageID)
@@ -0,0 +1,92 @@
+import pytest
+from DBMigrator import DBMigrator
+from dbRecordHandler.creator import Creator
+from dbRecordHandler.deleter import Deleter
+from dbRecordHandler.retriever import Retriever
+
+# Each Retriever and Deleter method, and the arguments it's called with
+RECORD_HANDLER_CALLS = [
+    (Retriever, "wasMajorCLItaskCompleted", ("GOTIDS",)),
+    (Retriever, "wasSpaceTaskCompleted", ("public", "GOTIDS")),
+    (Retriever, "isPageIDInDB", ("1",)),
+    (Retriever, "getAllPageIDsFromDB", ()),
+    (Retriever, "getOldPageVersion", ("1",)),
+    (Retriever, "getPageIDsToCheck", ()),
+    (Retriever, "getPageIDsToCheck", ("public",)),
+    (Retriever, "getPageIDsMissingAltTextFromDB", ()),
+    (Retriever, "getAuthorsUsernames", ()),
+    (Retriever, "doesPageHaveRecentAuthor", ("1",)),
+    (Retriever, "getRecentAuthorsForAllPagesMissingAltText", ()),
+    (Retriever, "getNotificationDigests", ()),
+    (Retriever, "getNumberOfStalePages", ()),
+    (Retriever, "getExcludedAuthors", ()),
+    (Retriever, "getPageInventoryMark", ("full", "public")),
+    (Retriever, "getCachedRevisions", (["1", "2"],)),
+    (Deleter, "unassignPageIDFromConfluenceCoordinators", ("1", "author")),
+    (Deleter, "removeAuthorFromDB", ("author",)),
+    (Deleter, "removeAuthorFromDB", ("not given", "author@example.com")),
+    (Deleter, "removeAuthorsFromDB", (["author"], ["author@example.com"])),
+    (Deleter, "removeInactiveAuthorsFromDB", ()),
+    (Deleter, "unassignAuthorsFromStalePageIDs", ()),
+    (Deleter, "removePageIDfromMissingAltTextTable", ("1",)),
+    (Deleter, "removePageIDfromAllConfluencePagesTable", ("1",)),
+]
+
+# The only methods that are meant to read a whole table, and the SCAN steps that they're allowed.  Any other SCAN step fails the test, unless it's one of DBMigrator.ALLOWED_SCANS.
+WHOLE_TABLE_READS = {
+    "getAllPageIDsFromDB": ("SCAN ALL_CONFLUENCE_PAGES",),
+    "getPageIDsToCheck": ("SCAN CONFLUENCE_PAGES_MISSING_ALT_TEXT",),
+    "getPageIDsMissingAltTextFromDB": ("SCAN CONFLUENCE_PAGES_MISSING_ALT_TEXT",),
+    "getAuthorsUsernames": ("SCAN ALL_CONFLUENCE_AUTHORS",),
+    "getRecentAuthorsForAllPagesMissingAltText": ("SCAN RECENT_CONFLUENCE_AUTHORS",),
+    # Every assignment is notified, in the order of the username index
+    "getNotificationDigests": ("SCAN recentAuthors USING COVERING INDEX IX_RECENT_CONFLUENCE_AUTHORS_USERNAME",),
+    "getExcludedAuthors": ("SCAN EXCLUDED_AUTHORS",),
+}
+
+@pytest.fixture
+def seededDB(migratedDB):
+    creator = Creator()
+    creator.addNewConfluencePageToDB("1", "3")
+    creator.addNewConfluencePageToDB("2", "1")
+    creator.addConfluencePageMissingAltText("1", "Style guide", {"https://confluence.example.com/image.png": "image.png"})
+    creator.addAuthorToDB("1", "author", "An Author")
+
+    return migratedDB
+
+def getStatementsRunBy(dbConnector, recordHandler, methodName, args):
+    statements = []
+
+    dbConnector.set_trace_callback(statements.append)
+
+    try:
+        result = getattr(recordHandler(), methodName)(*args)
+
+        # Generators only run their statements as they're consumed
+        if hasattr(result, "__next__"):
+            list(result)
+    finally:
+        dbConnector.set_trace_callback(None)
+
+    return [statement for statement in statements if statement.lstrip().upper().startswith(("SELECT", "WITH", "INSERT", "UPDATE", "DELETE"))]
+
+def test_indexedQueriesAreServedByAnIndex(seededDB):
+    assert DBMigrator().getFullTableScans() == []
+
+@pytest.mark.parametrize(
+    "recordHandler, methodName, args",
+    RECORD_HANDLER_CALLS,
+    ids=[f"{recordHandler.__name__}.{methodName}{args}" for recordHandler, methodName, args in RECORD_HANDLER_CALLS]
+)
+def test_recordHandlerQueriesAreServedByAnIndex(seededDB, recordHandler, methodName, args):
+    statements = getStatementsRunBy(seededDB, recordHandler, methodName, args)
+
+    assert statements
+
+    for statement in statements:
+        assert DBMigrator().getFullTableScanSteps(statement, WHOLE_TABLE_READS.get(methodName, ())) == [], statement
+
+def test_scanOfWholeCoveringIndexCounts(seededDB):
+    assert DBMigrator().getFullTableScanSteps("SELECT username FROM ALL_CONFLUENCE_AUTHORS") == [
+        "SCAN ALL_CONFLUENCE_AUTHORS USING COVERING INDEX sqlite_autoindex_ALL_CONFLUENCE_AUTHORS_1"
+    ]
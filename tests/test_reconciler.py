@@ -0,0 +1,66 @@
+import pytest
+from dbRecordHandler.connectionManager import ConnectionManager
+from dbRecordHandler.reconciler import Reconciler
+
+def getPages(dbConnector):
+    return dbConnector.execute("""
+        SELECT pageID, oldPageVersion, wasPageRecentlyUpdated, wasPageCheckedThisRun, spaceKey FROM ALL_CONFLUENCE_PAGES
+        ORDER BY pageID
+    """).fetchall()
+
+def streamPagesThenFail(detailedInfo):
+    yield from detailedInfo
+
+    raise RuntimeError("Listing the pages failed")
+
+@pytest.fixture
+def inventoriedDB(migratedDB):
+    Reconciler().reconcilePageInventory([(pageID, 1) for pageID in range(1, 11)], chunkSize=3)
+
+    return migratedDB
+
+def test_fullInventoryRemovesPagesThatWereNotListed(inventoriedDB):
+    reconciledCounts = Reconciler().reconcilePageInventory([(pageID, 2 if pageID == 4 else 1) for pageID in range(1, 9)], chunkSize=3)
+
+    assert reconciledCounts == {"new": 0, "changed": 1, "unchanged": 7, "removed": 2}
+    assert [page[0] for page in getPages(inventoriedDB)] == list(range(1, 9))
+
+def test_interruptedInventoryLeavesDBAsItWas(inventoriedDB):
+    pagesBefore = getPages(inventoriedDB)
+
+    with pytest.raises(RuntimeError):
+        Reconciler().reconcilePageInventory(streamPagesThenFail([(pageID, 2) for pageID in range(1, 6)]), chunkSize=2)
+
+    assert getPages(inventoriedDB) == pagesBefore
+
+def test_interruptedInterleavedInventoriesLeaveDBAsItWas(inventoriedDB):
+    pagesBefore = getPages(inventoriedDB)
+    reconciler = Reconciler()
+
+    # The way run.py reconciles several spaces whose chunks arrive interleaved
+    with pytest.raises(RuntimeError):
+        with ConnectionManager().unitOfWork():
+            reconciler.beginPageInventory(spaceKey="public", isFullInventory=True)
+            reconciler.beginPageInventory(spaceKey="internal", isFullInventory=True)
+
+            reconciler.reconcilePageInventoryChunk([(1, 2), (2, 1)], spaceKey="public")
+            reconciler.reconcilePageInventoryChunk([(11, 1)], spaceKey="internal")
+
+            raise RuntimeError("Listing the pages failed")
+
+    assert getPages(inventoriedDB) == pagesBefore
+
+    # The next run's inventory starts over from the same db
+    with ConnectionManager().unitOfWork():
+        reconciler.beginPageInventory(spaceKey="public", isFullInventory=True)
+        reconciler.reconcilePageInventoryChunk([(pageID, 1) for pageID in range(1, 6)], spaceKey="public")
+
+        assert reconciler.finishPageInventory(spaceKey="public", isFullInventory=True, numCurrentPages=5) == 5
+
+    assert [page[0] for page in getPages(inventoriedDB)] == list(range(1, 6))
+
+def test_repeatedPageIsCountedOnce(inventoriedDB):
+    # A paginated listing repeats a page that moved while it was being listed
+    reconciledCounts = Reconciler().reconcilePageInventory([(1, 1), (2, 2), (1, 1), (2, 2), (3, 1)], isFullInventory=False)
+
+    assert reconciledCounts == {"new": 0, "changed": 1, "unchanged": 2, "removed": 0}
@@ -0,0 +1,81 @@
+import pytest
+from confluenceRestStub import ConfluenceRestStub, ConfluenceRestStubHandler
+from storageFormatScanner import StorageFormatScanner
+
+@pytest.fixture
+def stubServer():
+    stub = ConfluenceRestStub(numPages=120, numImages=4)
+    serverAddr = stub.start()
+
+    yield (stub, serverAddr)
+
+    stub.stop()
+
+@pytest.fixture
+def storageScanner(stubServer):
+    stub, serverAddr = stubServer
+
+    scanner = StorageFormatScanner()
+    scanner.logInToConfluence(serverAddr, stub.username, stub.password)
+
+    return scanner
+
+def test_storageScannerMatchesRenderedPages(stubServer, storageScanner):
+    _, serverAddr = stubServer
+    baseLink = f"{serverAddr}/pages/viewpage.action?pageId="
+
+    for pageID, imagesNamesLinks, pageName in storageScanner.scanPages(baseLink, ["1", "77"]):
+        htmlImagesNamesLinks, htmlPageName = storageScanner._htmlScanner.getImagesMisssingAltText(baseLink, pageID)
+
+        # The storage format links to each attachment's latest version, and the rendered page to a specific one
+        assert {imageLink.split("?")[0]: imageName for imageLink, imageName in imagesNamesLinks.items()} == {
+            imageLink.split("?")[0]: imageName for imageLink, imageName in htmlImagesNamesLinks.items()
+        }
+        assert pageName == htmlPageName
+
+def test_pageThatCantBeReadByIDIsGone(stubServer, storageScanner):
+    _, serverAddr = stubServer
+
+    assert list(storageScanner.scanPages(f"{serverAddr}/pages/viewpage.action?pageId=", ["5", "999"]))[1] == ("999", {}, None)
+
+def test_pageLeftOutOfSearchIndexIsReadByID(stubServer, storageScanner):
+    stub, serverAddr = stubServer
+    stub.unindexedPageIDs = {5}
+
+    pageID, imagesNamesLinks, pageName = list(storageScanner.scanPages(f"{serverAddr}/pages/viewpage.action?pageId=", ["4", "5"]))[1]
+
+    assert (pageID, pageName) == ("5", "Page 5")
+    assert sorted(imagesNamesLinks.values()) == ["image0.png", "image3.png"]
+
+def test_failedReadByIDRaises(stubServer, storageScanner, monkeypatch):
+    stub, serverAddr = stubServer
+    stub.unindexedPageIDs = {5}
+    answerGET = ConfluenceRestStubHandler.do_GET
+
+    def failReadByID(handler):
+        if handler.path.startswith("/rest/api/content/5?"):
+            handler.sendJSON(500, {"statusCode": 500, "message": "Internal server error"})
+        else:
+            answerGET(handler)
+
+    monkeypatch.setattr(ConfluenceRestStubHandler, "do_GET", failReadByID)
+
+    with pytest.raises(RuntimeError, match="500"):
+        list(storageScanner.scanPages(f"{serverAddr}/pages/viewpage.action?pageId=", ["4", "5"]))
+
+def test_failedSearchRaises(stubServer, storageScanner, monkeypatch):
+    _, serverAddr = stubServer
+    monkeypatch.setattr(ConfluenceRestStubHandler, "do_GET", lambda handler: handler.sendJSON(503, {"statusCode": 503, "message": "Service unavailable"}))
+
+    with pytest.raises(RuntimeError):
+        list(storageScanner.scanPages(f"{serverAddr}/pages/viewpage.action?pageId=", ["5", "999"]))
+
+def test_failedTitleLookupRaisesAndIsNotCached(stubServer, storageScanner, monkeypatch):
+    monkeypatch.setattr(ConfluenceRestStubHandler, "do_GET", lambda handler: handler.sendJSON(500, {"statusCode": 500, "message": "Internal server error"}))
+
+    with pytest.raises(RuntimeError, match="500"):
+        storageScanner.getPageIDByTitle("public", "Other page")
+
+    monkeypatch.setattr(ConfluenceRestStubHandler, "do_GET", lambda handler: handler.sendJSON(404, {"statusCode": 404, "message": "Not found"}))
+
+    assert storageScanner.getPageIDByTitle("public", "Other page") is None